@@ -2,6 +2,9 @@ import re
 from functools import lru_cache
 from typing import List, Dict, Tuple, Pattern
 from core.utils.config_loader import load_config
+from core.utils.order_grammar import OrderGrammar
+from core.utils.keyword_automaton import KeywordAutomaton
+from core.utils.text_normalizer import MenuTextNormalizer
 
 # 수량 패턴 설정 캐싱
 @lru_cache(maxsize=8)
@@ -13,6 +16,11 @@ def get_quantity_config() -> Dict:
 def get_temperature_config() -> Dict:
     return load_config('temperature_patterns')
 
+# 포장 방식 별칭 설정 캐싱
+@lru_cache(maxsize=8)
+def get_packaging_config() -> Dict:
+    return load_config('packaging_patterns')
+
 # 메뉴 설정 캐싱
 @lru_cache(maxsize=8)
 def get_menu_config() -> Dict:
@@ -56,8 +64,8 @@ def get_compiled_menu_extraction_pattern() -> Pattern:
 @lru_cache(maxsize=16)
 def get_temperature_keywords() -> Tuple[List[str], List[str], List[str]]:
     temp_config = get_temperature_config()
-    cold_keywords = temp_config.get("cold_expressions", [])
-    hot_keywords = temp_config.get("hot_expressions", [])
+    cold_keywords = temp_config.get("cold_expressions") or temp_config.get("ice_keywords") or []
+    hot_keywords = temp_config.get("hot_expressions") or temp_config.get("hot_keywords") or []
     all_keywords_lower = [k.lower() for k in cold_keywords + hot_keywords]
     return cold_keywords, hot_keywords, all_keywords_lower
 
@@ -96,6 +104,64 @@ def get_packaging_keywords() -> Dict[str, str]:
         "dine_in": "매장식사"
     }
 
+# 포장 방식별 별칭 목록 캐싱 (포장 분류기 / setup_packaging_data 공용)
+@lru_cache(maxsize=16)
+def get_packaging_aliases() -> Dict[str, List[str]]:
+    return get_packaging_config().get("packaging_aliases", {})
+
+# 발화에서 포장 방식을 판단하는 표현 캐싱
+@lru_cache(maxsize=16)
+def get_packaging_phrases() -> Dict[str, List[str]]:
+    return {
+        "포장": ["포장", "테이크아웃", "takeout", "take-out", "to go", "togo"],
+        "매장식사": ["매장", "먹고", "for here", "here", "dine-in", "dine in"],
+    }
+
+# 메뉴 검색 전 제거할 포장 관련 표현 캐싱
+@lru_cache(maxsize=16)
+def get_menu_noise_words() -> List[str]:
+    return ["포장", "테이크아웃", "매장", "먹고", "가져가", "take out", "to go", "for here"]
+
+# 메뉴 검색 전 제거할 어미/조사 캐싱
+@lru_cache(maxsize=16)
+def get_filler_words() -> List[str]:
+    return ["해줘", "해주세요", "주세요", "좀", "요", "하나", "으로", "을", "를", "이", "가"]
+
+# 메뉴 검색 전 공백으로 바꿀 따옴표/괄호/문장부호 캐싱
+@lru_cache(maxsize=16)
+def get_menu_punctuation() -> str:
+    return "\"'“”‘’`(){}[],.!?"
+
+# 온도/포장/확인/불용어 키워드 오토마톤 캐싱 (ice, hot 순서가 온도 키워드 우선순위)
+@lru_cache(maxsize=4)
+def get_keyword_automaton() -> KeywordAutomaton:
+    cold_keywords, hot_keywords, _ = get_temperature_keywords()
+    positive_words, negative_words = get_confirmation_keywords()
+    packaging_phrases = get_packaging_phrases()
+    return KeywordAutomaton({
+        "ice": cold_keywords,
+        "hot": hot_keywords,
+        "takeout": packaging_phrases["포장"],
+        "dine_in": packaging_phrases["매장식사"],
+        "packaging_noise": get_menu_noise_words(),
+        "filler": get_filler_words(),
+        "positive": positive_words,
+        "negative": negative_words,
+    })
+
+# 메뉴 검색용 텍스트 정리에서 제거하는 키워드 분류
+MENU_STRIP_CATEGORIES = ("ice", "hot", "packaging_noise", "filler")
+
+# 메뉴 검색용 텍스트 정리 파이프라인 캐싱 (수량 패턴 조합별)
+@lru_cache(maxsize=8)
+def get_menu_text_normalizer(quantity_patterns: Tuple[str, ...]) -> MenuTextNormalizer:
+    return MenuTextNormalizer(
+        automaton=get_keyword_automaton(),
+        quantity_patterns=quantity_patterns,
+        strip_categories=MENU_STRIP_CATEGORIES,
+        punctuation=get_menu_punctuation(),
+    )
+
 # 유사도 임계값 설정 캐싱
 @lru_cache(maxsize=8)
 def get_similarity_thresholds() -> Dict[str, float]:
@@ -105,15 +171,31 @@ def get_similarity_thresholds() -> Dict[str, float]:
         "temperature_high_confidence": temp_config.get("high_confidence_threshold", 0.7),
         "menu_similarity_threshold": 0.45,
         "popular_bonus": 0.03,
-        "rapidfuzz_threshold": 85
+        "rapidfuzz_threshold": 85,
+        # 자모 fuzzy 1차 매칭: ratio 하한(0~100), 1·2위 최소 점수 차 (scripts.bench_jamo_matcher 로 조정)
+        "jamo_match_threshold": 80,
+        "jamo_match_margin": 3
     }
 
+# 주문 분리 문법 캐싱 (구분자/수량/단위/온도 패턴을 한 번만 컴파일)
+@lru_cache(maxsize=4)
+def get_order_grammar() -> OrderGrammar:
+    _, _, temp_keywords_lower = get_temperature_keywords()
+    return OrderGrammar(
+        separators=get_separators_list(),
+        korean_numbers=get_korean_numbers(),
+        units=get_units_list(),
+        temperature_keywords=temp_keywords_lower,
+        fuzzy_threshold=get_similarity_thresholds()["rapidfuzz_threshold"],
+    )
+
 # 설정 관련 모든 캐시 정리
 def clear_config_caches():
     # 설정 캐시
     get_quantity_config.cache_clear()
     get_temperature_config.cache_clear()
     get_menu_config.cache_clear()
+    get_packaging_config.cache_clear()
 
     # 패턴 캐시
     get_compiled_separators_pattern.cache_clear()
@@ -121,6 +203,7 @@ def clear_config_caches():
     get_compiled_quantity_pattern.cache_clear()
     get_compiled_number_pattern.cache_clear()
     get_compiled_menu_extraction_pattern.cache_clear()
+    get_order_grammar.cache_clear()
 
     # 키워드 캐시
     get_temperature_keywords.cache_clear()
@@ -129,6 +212,13 @@ def clear_config_caches():
     get_separators_list.cache_clear()
     get_confirmation_keywords.cache_clear()
     get_packaging_keywords.cache_clear()
+    get_packaging_phrases.cache_clear()
+    get_packaging_aliases.cache_clear()
+    get_menu_noise_words.cache_clear()
+    get_filler_words.cache_clear()
+    get_keyword_automaton.cache_clear()
+    get_menu_punctuation.cache_clear()
+    get_menu_text_normalizer.cache_clear()
 
     # 임계값 캐시
     get_similarity_thresholds.cache_clear()
@@ -148,6 +238,8 @@ def warmup_config_cache():
     get_confirmation_keywords()
     get_packaging_keywords()
     get_similarity_thresholds()
+    get_order_grammar()
+    get_keyword_automaton()
 
 # 단위 필수 여부 확인
 def is_unit_required() -> bool:
@@ -28,4 +28,11 @@ class SessionUpdateFailedException(HTTPException):
         super().__init__(
             status_code=500,
             detail=f"세션 {operation}에 실패했습니다: {session_id}"
-        )
\ No newline at end of file
+        )
+
+class SessionConflictException(HTTPException):
+    def __init__(self, session_id: str):
+        super().__init__(
+            status_code=409,
+            detail=f"다른 요청이 세션을 먼저 변경했습니다. 다시 시도해주세요: {session_id}"
+        )
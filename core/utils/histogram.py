@@ -0,0 +1,41 @@
+import bisect
+import threading
+from typing import Dict, Sequence
+
+# 고정 구간 누적 히스토그램 (Prometheus 방식 le 버킷, /health/metrics 노출용)
+class Histogram:
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = sorted(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum += value
+            if value > self._max:
+                self._max = value
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            counts = list(self._counts)
+            count, total, maximum = self._count, self._sum, self._max
+
+        cumulative: Dict[str, int] = {}
+        running = 0
+        for bound, n in zip(self.buckets, counts):
+            running += n
+            cumulative[f"le_{bound:g}"] = running
+        cumulative["le_inf"] = running + counts[-1]
+        return {
+            "count": count,
+            "sum": round(total, 3),
+            "avg": round(total / count, 3) if count else 0.0,
+            "max": round(maximum, 3),
+            "buckets": cumulative,
+        }
@@ -0,0 +1,63 @@
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+from rapidfuzz import fuzz as rf_fuzz, process as rf_process
+
+# 한글 음절 → 호환 자모 분해 (초성/중성/종성), 음절이 아닌 문자는 그대로
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONGSEONG = ("", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ", "ㄿ", "ㅀ",
+              "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ")
+_SYLLABLE_BASE = 0xAC00
+_SYLLABLE_LAST = 0xD7A3
+
+def _decompose_char(ch: str) -> str:
+    code = ord(ch)
+    if not _SYLLABLE_BASE <= code <= _SYLLABLE_LAST:
+        return ch
+    offset = code - _SYLLABLE_BASE
+    return _CHOSEONG[offset // 588] + _JUNGSEONG[(offset % 588) // 28] + _JONGSEONG[offset % 28]
+
+# 음절 단위 분해표 (11,172자) 를 한 번만 만들어 str.translate 로 일괄 변환
+_SYLLABLE_TABLE = {code: _decompose_char(chr(code)) for code in range(_SYLLABLE_BASE, _SYLLABLE_LAST + 1)}
+
+# "아메리카노" → "ㅇㅏㅁㅔㄹㅣㅋㅏㄴㅗ" (소문자 변환 포함)
+@lru_cache(maxsize=8192)
+def to_jamo(text: str) -> str:
+    return (text or "").lower().translate(_SYLLABLE_TABLE)
+
+# 공백 제거 자모열 (STT 띄어쓰기 차이 무시)
+def to_compact_jamo(text: str) -> str:
+    return "".join(to_jamo(text).split())
+
+# 메뉴명 자모 인덱스 기반 fuzzy 매처 (names 는 중복 없는 메뉴명 목록)
+# 음절 단위 비교는 "아메리까노"/"카페라뗴" 처럼 한 음절만 틀려도 점수가 크게 떨어지므로 초성/중성/종성 단위로 비교
+class JamoMatcher:
+    def __init__(self, names: Sequence[str]):
+        self.names: List[str] = list(names)
+        self.choices: List[str] = [to_compact_jamo(name) for name in self.names]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    # 모든 이름과의 자모 ratio (0~100)
+    def scores(self, text: str) -> np.ndarray:
+        query = to_compact_jamo(text)
+        if not query or not self.choices:
+            return np.zeros(len(self.choices), dtype=np.float32)
+        return rf_process.cdist([query], self.choices, scorer=rf_fuzz.ratio, processor=None, dtype=np.float32)[0]
+
+    # (이름 인덱스, 점수). score_cutoff 미만이거나 2위와 차이가 margin 미만(애매함)이면 None
+    def best(self, text: str, score_cutoff: float, margin: float = 0.0) -> Optional[Tuple[int, float]]:
+        scores = self.scores(text)
+        if not len(scores):
+            return None
+        index = int(np.argmax(scores))
+        score = float(scores[index])
+        if score < score_cutoff:
+            return None
+        if margin > 0 and len(scores) > 1:
+            runner_up = float(np.partition(scores, -2)[-2])
+            if score - runner_up < margin:
+                return None
+        return index, score
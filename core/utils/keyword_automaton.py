@@ -0,0 +1,113 @@
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Set
+
+# 키워드 매칭 결과 (같은 키워드가 여러 분류에 속할 수 있음)
+class KeywordHit(NamedTuple):
+    start: int
+    end: int
+    keyword: str
+    categories: FrozenSet[str]
+
+# 여러 키워드 집합을 한 번에 찾는 Aho-Corasick 오토마톤 (대소문자 무시)
+class KeywordAutomaton:
+    def __init__(self, keyword_sets: Dict[str, Iterable[str]]):
+        categories_by_keyword: Dict[str, Set[str]] = {}
+        # 키워드 우선순위: keyword_sets 에 처음 등장한 순서
+        self.rank: Dict[str, int] = {}
+        for category, keywords in keyword_sets.items():
+            for keyword in keywords:
+                keyword = (keyword or "").lower()
+                if not keyword:
+                    continue
+                categories_by_keyword.setdefault(keyword, set()).add(category)
+                self.rank.setdefault(keyword, len(self.rank))
+
+        self.keywords: List[str] = list(categories_by_keyword)
+        self._categories: List[FrozenSet[str]] = [frozenset(categories_by_keyword[k]) for k in self.keywords]
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        for index, keyword in enumerate(self.keywords):
+            self._insert(keyword, index)
+        self._build_failure_links()
+
+    def _insert(self, keyword: str, index: int):
+        state = 0
+        for ch in keyword:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append(index)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    # 텍스트를 한 번 훑어 모든(겹치는 것 포함) 키워드 위치 반환
+    def find(self, text: str) -> List[KeywordHit]:
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # 소문자 변환으로 길이가 바뀌는 문자는 원문 기준으로 매칭
+            lowered = text
+        goto, fail, out = self._goto, self._fail, self._out
+        hits: List[KeywordHit] = []
+        state = 0
+        for i, ch in enumerate(lowered):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for index in out[state]:
+                keyword = self.keywords[index]
+                hits.append(KeywordHit(i + 1 - len(keyword), i + 1, keyword, self._categories[index]))
+        return hits
+
+    @staticmethod
+    def categories_of(hits: Iterable[KeywordHit]) -> Set[str]:
+        found: Set[str] = set()
+        for hit in hits:
+            found |= hit.categories
+        return found
+
+    # 해당 분류 매칭 중 우선순위가 가장 높은(설정 순서가 앞선) 키워드
+    def best(self, hits: Iterable[KeywordHit], categories: Iterable[str]) -> Optional[KeywordHit]:
+        wanted = frozenset(categories)
+        candidates = [hit for hit in hits if hit.categories & wanted]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda hit: (self.rank[hit.keyword], hit.start))
+
+    # 지정 분류에 속한 매칭 구간을 모두 replacement 로 치환 (한 번에)
+    def strip(self, text: str, hits: Iterable[KeywordHit], categories: Optional[Iterable[str]] = None,
+              replacement: str = " ") -> str:
+        wanted = frozenset(categories) if categories is not None else None
+        spans = sorted(
+            (hit.start, hit.end) for hit in hits
+            if wanted is None or hit.categories & wanted
+        )
+        if not spans:
+            return text
+
+        parts: List[str] = []
+        pos = 0
+        for start, end in spans:
+            if start > pos:
+                parts.append(text[pos:start])
+            if start >= pos:
+                parts.append(replacement)
+            pos = max(pos, end)
+        parts.append(text[pos:])
+        return "".join(parts)
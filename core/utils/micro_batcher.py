@@ -0,0 +1,111 @@
+import time
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Set, Tuple
+import numpy as np
+from core.utils.histogram import Histogram
+
+# 동시에 들어온 인코딩 요청을 잠깐(max_wait_ms) 모으거나 max_batch 개가 차면 한 번에 처리하는 이벤트 루프용 배처
+# batch_fn: 텍스트 목록 -> 같은 순서의 행렬 (동기 함수, run 으로 이벤트 루프 밖에서 실행)
+class MicroBatcher:
+    def __init__(
+        self,
+        batch_fn: Callable[[List[str]], np.ndarray],
+        run: Callable[..., Awaitable[np.ndarray]],
+        max_batch: int = 64,
+        max_wait_ms: float = 3.0,
+    ):
+        self.batch_fn = batch_fn
+        self.run = run
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: List[Tuple[List[str], asyncio.Future, float]] = []
+        self._pending_texts = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # 실행 중인 배치 작업 (이벤트 루프는 작업을 약하게 참조하므로 끝날 때까지 여기서 붙잡아 둠)
+        self._tasks: Set[asyncio.Task] = set()
+
+        self.batch_sizes = Histogram([1, 2, 4, 8, 16, 32, 64, 128, 256])
+        self.requests_per_batch = Histogram([1, 2, 4, 8, 16, 32, 64])
+        self.queue_ms = Histogram([0.5, 1, 2, 5, 10, 20, 50, 100])
+
+    # texts 의 벡터 행렬 반환 (다른 요청과 합쳐서 한 번에 인코딩)
+    async def submit(self, texts: Sequence[str]) -> np.ndarray:
+        texts = list(texts)
+        if self.max_wait == 0:
+            self._observe(len(texts), 1, [0.0])
+            return await self.run(self.batch_fn, texts)
+
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # 이벤트 루프가 바뀌면(테스트/재시작) 이전 루프의 대기열은 버림
+            self._loop = loop
+            self._pending, self._pending_texts, self._timer = [], 0, None
+            self._tasks = set()
+
+        future = loop.create_future()
+        self._pending.append((texts, future, time.perf_counter()))
+        self._pending_texts += len(texts)
+        if self._pending_texts >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending, self._pending_texts = self._pending, [], 0
+        task = self._loop.create_task(self._run_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    # 종료 시: 대기열을 바로 보내고 실행 중인 배치가 끝날 때까지 기다림 (lifespan 종료 시)
+    async def aclose(self):
+        if self._loop is not asyncio.get_running_loop():
+            return
+        self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _run_batch(self, batch: List[Tuple[List[str], asyncio.Future, float]]):
+        started = time.perf_counter()
+        unique = list(dict.fromkeys(text for texts, _, _ in batch for text in texts))
+        self._observe(len(unique), len(batch), [(started - queued) * 1000 for _, _, queued in batch])
+
+        try:
+            matrix = await self.run(self.batch_fn, unique)
+        except asyncio.CancelledError:
+            # 배치 작업이 취소돼도 기다리던 요청이 멈춰 있지 않도록 함께 취소
+            for _, future, _ in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        row_of: Dict[str, int] = {text: i for i, text in enumerate(unique)}
+        for texts, future, _ in batch:
+            if not future.done():
+                future.set_result(matrix[[row_of[t] for t in texts]])
+
+    def _observe(self, texts: int, requests: int, queue_ms: List[float]):
+        self.batch_sizes.observe(texts)
+        self.requests_per_batch.observe(requests)
+        for ms in queue_ms:
+            self.queue_ms.observe(ms)
+
+    def stats(self) -> Dict:
+        return {
+            "max_batch": self.max_batch,
+            "max_wait_ms": self.max_wait * 1000,
+            "batch_size": self.batch_sizes.snapshot(),
+            "requests_per_batch": self.requests_per_batch.snapshot(),
+            "queue_ms": self.queue_ms.snapshot(),
+        }
@@ -0,0 +1,131 @@
+import re
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Tuple
+from rapidfuzz import process as rf_process, fuzz as rf_fuzz
+
+# 주문 문장 토큰 (kind: menu | quantity | unit | temperature | separator)
+class OrderToken(NamedTuple):
+    kind: str
+    text: str
+    start: int
+    end: int
+
+_WordPiece = Tuple[str, str, int, int]
+
+# 긴 키워드가 먼저 매칭되도록 정렬한 정규식 alternation
+def _alternation(words: Iterable[str]) -> str:
+    ordered = sorted({w for w in words if w}, key=len, reverse=True)
+    return '|'.join(re.escape(w) for w in ordered) or r'(?!)'
+
+# quantity_patterns.json / temperature_patterns.json 에서 한 번만 컴파일하는 주문 분리 문법
+class OrderGrammar:
+    def __init__(
+        self,
+        separators: List[str],
+        korean_numbers: Dict[str, int],
+        units: List[str],
+        temperature_keywords: List[str],
+        fuzzy_threshold: float,
+        word_cache_size: int = 8192,
+    ):
+        units_alt = _alternation(units)
+        numbers_alt = _alternation(korean_numbers.keys())
+
+        self.word_pattern = re.compile(r'\S+')
+        # 단어 내부를 한 번에 훑는 패턴: 구분자 > 수량(+단위) > 단위만 있는 단어 > 메뉴 글자
+        # 한글 수사는 뒤에 한글이 이어지면 수량으로 보지 않음 (예: '세트', '한라봉')
+        self.piece_pattern = re.compile(
+            rf'(?P<separator>{_alternation(separators)})'
+            rf'|(?P<quantity>\d+|(?:{numbers_alt})(?=$|[^가-힣]|(?:{units_alt})))(?P<unit>{units_alt})?'
+            rf'|(?P<unit_word>^(?:{units_alt})$)'
+            rf'|(?P<menu>.)'
+        )
+        self.temperature_words = frozenset(k.lower() for k in temperature_keywords)
+        self._temperature_list = sorted(self.temperature_words)
+        self.fuzzy_threshold = fuzzy_threshold
+
+        self._word_cache: Dict[str, Tuple[_WordPiece, ...]] = {}
+        self._word_cache_size = word_cache_size
+
+    # 온도 키워드 여부 (정확 일치 우선, 아니면 rapidfuzz ratio 임계치)
+    def is_temperature_word(self, word_lower: str) -> bool:
+        if word_lower in self.temperature_words:
+            return True
+        return rf_process.extractOne(
+            word_lower, self._temperature_list, scorer=rf_fuzz.ratio, score_cutoff=self.fuzzy_threshold
+        ) is not None
+
+    # 단어 하나를 조각으로 분해 (단어 단위로 캐싱)
+    def _word_pieces(self, word: str) -> Tuple[_WordPiece, ...]:
+        pieces = self._word_cache.get(word)
+        if pieces is not None:
+            return pieces
+
+        if self.is_temperature_word(word.lower()):
+            pieces = (("temperature", word, 0, len(word)),)
+        else:
+            found: List[_WordPiece] = []
+            for m in self.piece_pattern.finditer(word):
+                kind = m.lastgroup
+                if kind == "menu":
+                    if found and found[-1][0] == "menu":
+                        prev = found[-1]
+                        found[-1] = ("menu", prev[1] + m.group(), prev[2], m.end())
+                    else:
+                        found.append(("menu", m.group(), m.start(), m.end()))
+                elif kind == "unit":
+                    found.append(("quantity", m.group("quantity"), m.start("quantity"), m.end("quantity")))
+                    found.append(("unit", m.group("unit"), m.start("unit"), m.end("unit")))
+                elif kind == "unit_word":
+                    found.append(("unit", m.group(), m.start(), m.end()))
+                else:
+                    found.append((kind, m.group(), m.start(), m.end()))
+            pieces = tuple(found)
+
+        if len(self._word_cache) >= self._word_cache_size:
+            self._word_cache.clear()
+        self._word_cache[word] = pieces
+        return pieces
+
+    # 문장을 한 번 훑어 메뉴/수량/단위/온도/구분자 토큰 생성
+    def tokenize(self, text: str) -> Iterator[OrderToken]:
+        for m in self.word_pattern.finditer(text):
+            offset = m.start()
+            for kind, piece, start, end in self._word_pieces(m.group()):
+                yield OrderToken(kind, piece, offset + start, offset + end)
+
+    # 구분자 기준 분리, 없으면 '메뉴 수량 [단위]' 묶음 기준 분리. 나눌 수 없으면 원문 그대로
+    def split(self, text: str) -> List[str]:
+        tokens = list(self.tokenize(text))
+
+        separators = [t for t in tokens if t.kind == "separator"]
+        if separators:
+            orders = []
+            pos = 0
+            for sep in separators:
+                orders.append(text[pos:sep.start])
+                pos = sep.end
+            orders.append(text[pos:])
+            orders = [order.strip() for order in orders if order.strip()]
+            if len(orders) > 1:
+                return orders
+
+        orders = []
+        menu_start = None
+        i = 0
+        while i < len(tokens):
+            token = tokens[i]
+            if token.kind == "quantity" and menu_start is not None:
+                menu = text[menu_start:token.start].strip()
+                if i + 1 < len(tokens) and tokens[i + 1].kind == "unit":
+                    orders.append(f"{menu} {token.text} {tokens[i + 1].text}")
+                    i += 1
+                else:
+                    orders.append(f"{menu} {token.text}")
+                menu_start = None
+            elif menu_start is None:
+                menu_start = token.start
+            i += 1
+
+        if len(orders) > 1:
+            return orders
+        return [text.strip()]
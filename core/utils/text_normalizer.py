@@ -0,0 +1,91 @@
+import re
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from core.utils.keyword_automaton import KeywordAutomaton, KeywordHit
+
+logger = logging.getLogger(__name__)
+
+# 수량 정규식들을 하나의 alternation 으로 컴파일 (잘못된 패턴은 건너뜀)
+def compile_quantity_alternation(patterns: Iterable[str]) -> Optional["re.Pattern"]:
+    valid: List[str] = []
+    for pattern in patterns:
+        try:
+            re.compile(pattern)
+            valid.append(f"(?:{pattern})")
+        except re.error:
+            logger.warning(f"수량 패턴 무시(정규식 오류): {pattern}")
+    return re.compile("|".join(valid)) if valid else None
+
+# 메뉴 검색용 텍스트 정리 파이프라인
+# 키워드 구간(오토마톤 한 번) + 수량 구간(정규식 한 번)을 합쳐 한 번에 잘라내고,
+# 문장부호는 번역 테이블로 공백 치환, 결과는 LRU 캐시
+class MenuTextNormalizer:
+    def __init__(
+        self,
+        automaton: KeywordAutomaton,
+        quantity_patterns: Sequence[str],
+        strip_categories: Iterable[str],
+        punctuation: Iterable[str] = (),
+        cache_size: int = 2048,
+    ):
+        self.automaton = automaton
+        self.quantity_pattern = compile_quantity_alternation(quantity_patterns)
+        self.strip_categories = frozenset(strip_categories)
+        self._punctuation_table = str.maketrans({ch: " " for ch in punctuation})
+
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    # hits: 같은 텍스트에 대해 이미 훑은 오토마톤 결과 (있으면 재사용)
+    def normalize(self, text: str, hits: Optional[List[KeywordHit]] = None) -> str:
+        text = text or ""
+        with self._lock:
+            cached = self._cache.get(text)
+            if cached is not None:
+                self._cache.move_to_end(text)
+                self._hits += 1
+                return cached
+            self._misses += 1
+
+        cleaned = self._normalize(text, hits)
+
+        with self._lock:
+            self._cache[text] = cleaned
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return cleaned
+
+    def _normalize(self, text: str, hits: Optional[List[KeywordHit]]) -> str:
+        if hits is None:
+            hits = self.automaton.find(text)
+
+        spans: List[Tuple[int, int]] = [
+            (hit.start, hit.end) for hit in hits if hit.categories & self.strip_categories
+        ]
+        if self.quantity_pattern is not None:
+            spans.extend(m.span() for m in self.quantity_pattern.finditer(text) if m.end() > m.start())
+        spans.sort()
+
+        parts: List[str] = []
+        pos = 0
+        for start, end in spans:
+            if start > pos:
+                parts.append(text[pos:start])
+            pos = max(pos, end)
+            parts.append(" ")
+        parts.append(text[pos:])
+
+        return " ".join("".join(parts).translate(self._punctuation_table).split())
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"size": len(self._cache), "hits": self._hits, "misses": self._misses}
@@ -0,0 +1,201 @@
+import time
+import logging
+import threading
+from collections import deque
+from typing import Dict, Any, Deque, Optional
+import pymysql
+from pymysql.constants import SERVER_STATUS
+
+logger = logging.getLogger(__name__)
+
+class PoolTimeoutError(Exception):
+    pass
+
+# 풀이 관리하는 실제 연결과 생성/사용 시각
+class _PoolEntry:
+    __slots__ = ("raw", "created_at", "last_used_at")
+
+    def __init__(self, raw):
+        now = time.monotonic()
+        self.raw = raw
+        self.created_at = now
+        self.last_used_at = now
+
+# 풀에서 빌려준 연결. close() 하면 실제로 닫지 않고 풀에 반납
+class PooledConnection:
+    def __init__(self, pool: "MySQLConnectionPool", entry: _PoolEntry):
+        self._pool = pool
+        self._entry = entry
+        self._released = False
+
+    def __getattr__(self, name):
+        return getattr(self._entry.raw, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        if not self._released:
+            self._released = True
+            self._pool._release(self._entry)
+
+# 스레드 안전한 고정 크기 MySQL 연결 풀
+class MySQLConnectionPool:
+    def __init__(
+        self,
+        connection_config: Dict[str, Any],
+        max_size: int = 10,
+        checkout_timeout: float = 5.0,
+        max_lifetime: float = 1800.0,
+        health_check_interval: float = 30.0,
+    ):
+        self.connection_config = connection_config
+        self.max_size = max_size
+        self.checkout_timeout = checkout_timeout
+        self.max_lifetime = max_lifetime
+        self.health_check_interval = health_check_interval
+        self._default_autocommit = bool(connection_config.get("autocommit", False))
+
+        self._idle: Deque[_PoolEntry] = deque()
+        self._size = 0  # 유휴 + 대여 중인 연결 수
+        self._in_use = 0
+        self._cond = threading.Condition()
+
+        self._stats = {
+            "created": 0,
+            "closed": 0,
+            "recycled": 0,
+            "health_check_failures": 0,
+            "checkouts": 0,
+            "timeouts": 0,
+            "total_wait_ms": 0.0,
+            "max_wait_ms": 0.0,
+        }
+
+    def _connect(self) -> _PoolEntry:
+        raw = pymysql.connect(**self.connection_config)
+        with self._cond:
+            self._stats["created"] += 1
+        return _PoolEntry(raw)
+
+    def _close_raw(self, entry: _PoolEntry):
+        try:
+            entry.raw.close()
+        except Exception:
+            pass
+        with self._cond:
+            self._stats["closed"] += 1
+
+    # 재사용 가능한 연결인지 확인 (수명 초과 / 오래 쉰 연결은 ping)
+    def _is_usable(self, entry: _PoolEntry) -> bool:
+        now = time.monotonic()
+        if self.max_lifetime and now - entry.created_at > self.max_lifetime:
+            with self._cond:
+                self._stats["recycled"] += 1
+            return False
+        if not entry.raw.open:
+            return False
+        if now - entry.last_used_at > self.health_check_interval:
+            try:
+                entry.raw.ping(reconnect=False)
+            except Exception as e:
+                logger.warning(f"MySQL 풀 연결 상태 확인 실패: {e}")
+                with self._cond:
+                    self._stats["health_check_failures"] += 1
+                return False
+        return True
+
+    # 연결 대여 (checkout_timeout 동안 빈 자리가 없으면 PoolTimeoutError)
+    def acquire(self, timeout: Optional[float] = None) -> PooledConnection:
+        timeout = self.checkout_timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+
+        entry: Optional[_PoolEntry] = None
+        with self._cond:
+            while True:
+                if self._idle:
+                    entry = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    self._size += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._stats["timeouts"] += 1
+                    raise PoolTimeoutError(f"MySQL 연결 대기 시간 초과 ({timeout}초, 최대 {self.max_size}개)")
+                self._cond.wait(remaining)
+            self._in_use += 1
+
+        try:
+            if entry is not None and not self._is_usable(entry):
+                self._close_raw(entry)
+                entry = None
+            if entry is None:
+                entry = self._connect()
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+
+        wait_ms = (time.monotonic() - started) * 1000
+        with self._cond:
+            self._stats["checkouts"] += 1
+            self._stats["total_wait_ms"] += wait_ms
+            self._stats["max_wait_ms"] = max(self._stats["max_wait_ms"], wait_ms)
+        return PooledConnection(self, entry)
+
+    # 반납: 열린 트랜잭션은 롤백하고 autocommit 설정을 원래대로 되돌림
+    def _release(self, entry: _PoolEntry):
+        reusable = entry.raw.open
+        if reusable:
+            try:
+                if entry.raw.server_status & SERVER_STATUS.SERVER_STATUS_IN_TRANS:
+                    entry.raw.rollback()
+                if entry.raw.get_autocommit() != self._default_autocommit:
+                    entry.raw.autocommit(self._default_autocommit)
+            except Exception as e:
+                logger.warning(f"MySQL 풀 반납 중 연결 정리 실패: {e}")
+                reusable = False
+
+        if not reusable:
+            self._close_raw(entry)
+
+        with self._cond:
+            self._in_use -= 1
+            if reusable:
+                entry.last_used_at = time.monotonic()
+                self._idle.append(entry)
+            else:
+                self._size -= 1
+            self._cond.notify()
+
+    # 유휴 연결 모두 종료
+    def close_all(self):
+        with self._cond:
+            idle = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle)
+        for entry in idle:
+            self._close_raw(entry)
+
+    # 풀 지표 반환
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            stats = dict(self._stats)
+            stats.update({
+                "max_size": self.max_size,
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": self._in_use,
+            })
+        checkouts = stats["checkouts"]
+        stats["avg_wait_ms"] = round(stats["total_wait_ms"] / checkouts, 3) if checkouts else 0.0
+        stats["total_wait_ms"] = round(stats["total_wait_ms"], 3)
+        stats["max_wait_ms"] = round(stats["max_wait_ms"], 3)
+        return stats
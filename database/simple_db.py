@@ -1,14 +1,135 @@
 import pymysql
+import aiomysql
+import asyncio
 import logging
 import json
-from typing import Optional, Dict, List
+import time
+import threading
+from contextlib import contextmanager
+from typing import Any, Optional, Dict, List, NamedTuple, Sequence, Tuple
 import os
 from dotenv import load_dotenv
+from database.connection_pool import MySQLConnectionPool
 
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# profile이 JSON 문자열이면 파싱, 일반 문자열(URL 등)이면 그대로 반환
+def _parse_profile(profile_data):
+    if isinstance(profile_data, str):
+        try:
+            return json.loads(profile_data)
+        except json.JSONDecodeError:
+            return profile_data
+    return profile_data
+
+# 메뉴 카탈로그 캐시 (menu_id → 가격/활성 여부/파싱된 profile)
+MENU_CATALOG_CACHE_ENABLED = os.getenv("MENU_CATALOG_CACHE_ENABLED", "true").lower() not in ("0", "false", "no")
+MENU_CATALOG_CACHE_TTL = float(os.getenv("MENU_CATALOG_CACHE_TTL", "300"))
+MENU_CATALOG_CACHE_MAX_SIZE = int(os.getenv("MENU_CATALOG_CACHE_MAX_SIZE", "10000"))
+
+_CATALOG_SQL = "SELECT id, price, is_active, profile FROM menu WHERE id IN ({})"
+
+class MenuCatalogEntry(NamedTuple):
+    price: Optional[int]
+    is_active: bool
+    profile: Any
+
+# menu 행 캐시 (TTL + 명시적 무효화). 없는 menu_id 도 None 으로 캐시해 반복 조회를 막음
+# 동기(SimpleMenuDB)/비동기(AsyncMenuDB) 조회가 같은 인스턴스를 공유
+class MenuCatalogCache:
+    def __init__(self, ttl: float = MENU_CATALOG_CACHE_TTL, max_size: int = MENU_CATALOG_CACHE_MAX_SIZE,
+                 enabled: bool = MENU_CATALOG_CACHE_ENABLED):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.enabled = enabled and ttl > 0
+        self._entries: Dict[int, Tuple[float, Optional[MenuCatalogEntry]]] = {}
+        self._lock = threading.Lock()
+        # 무효화마다 증가: 무효화 전에 시작한 DB 조회 결과가 캐시에 다시 들어가지 않도록
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.invalidations = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    # (캐시에 있는 항목, DB 조회가 필요한 menu_id 목록)
+    def get_many(self, menu_ids: Sequence[int]) -> Tuple[Dict[int, Optional[MenuCatalogEntry]], List[int]]:
+        if not self.enabled:
+            return {}, list(menu_ids)
+
+        found: Dict[int, Optional[MenuCatalogEntry]] = {}
+        missing: List[int] = []
+        now = time.monotonic()
+        with self._lock:
+            for menu_id in menu_ids:
+                cached = self._entries.get(menu_id)
+                if cached is not None and cached[0] > now:
+                    found[menu_id] = cached[1]
+                    continue
+                if cached is not None:
+                    del self._entries[menu_id]
+                    self.expired += 1
+                missing.append(menu_id)
+            self.hits += len(found)
+            self.misses += len(missing)
+        return found, missing
+
+    # DB 조회 결과 저장 (rows 에 없는 menu_id 는 없는 메뉴로 기록)
+    def put_many(self, menu_ids: Sequence[int], rows: Dict[int, MenuCatalogEntry], generation: int):
+        if not self.enabled:
+            return
+        expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            if generation != self._generation:
+                return
+            if len(self._entries) + len(menu_ids) > self.max_size:
+                self._entries.clear()
+            for menu_id in menu_ids:
+                self._entries[menu_id] = (expires_at, rows.get(menu_id))
+
+    # menu_ids 가 None 이면 전체 무효화
+    def invalidate(self, menu_ids: Optional[Sequence[int]] = None):
+        with self._lock:
+            self._generation += 1
+            self.invalidations += 1
+            if menu_ids is None:
+                self._entries.clear()
+            else:
+                for menu_id in menu_ids:
+                    self._entries.pop(menu_id, None)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            size = len(self._entries)
+        total = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "ttl_seconds": self.ttl,
+            "size": size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "expired": self.expired,
+            "invalidations": self.invalidations,
+        }
+
+def _catalog_rows(results) -> Dict[int, MenuCatalogEntry]:
+    return {
+        menu_id: MenuCatalogEntry(price, bool(is_active), _parse_profile(profile) if profile else None)
+        for menu_id, price, is_active, profile in results
+    }
+
+def _active_prices(entries: Dict[int, Optional[MenuCatalogEntry]]) -> Dict[int, int]:
+    return {menu_id: e.price for menu_id, e in entries.items() if e is not None and e.is_active}
+
+def _active_profiles(entries: Dict[int, Optional[MenuCatalogEntry]]) -> Dict[int, Any]:
+    return {menu_id: e.profile for menu_id, e in entries.items() if e is not None and e.is_active and e.profile}
+
 class SimpleMenuDB:
     def __init__(self):
         self.connection_config = {
@@ -17,60 +138,84 @@ class SimpleMenuDB:
             'user': os.getenv("DB_USER"),
             'password': os.getenv("DB_PASSWORD"),
             'database': os.getenv("DB_NAME"),
-            'charset': 'utf8mb4'
+            'charset': 'utf8mb4',
+            # 풀 연결은 조회 후 스냅샷이 남지 않도록 autocommit, 여러 문장 쓰기는 transaction() 사용
+            'autocommit': True
         }
+        self.pool = MySQLConnectionPool(
+            self.connection_config,
+            max_size=int(os.getenv("DB_POOL_SIZE", "10")),
+            checkout_timeout=float(os.getenv("DB_POOL_TIMEOUT", "5")),
+            max_lifetime=float(os.getenv("DB_POOL_MAX_LIFETIME", "1800")),
+            health_check_interval=float(os.getenv("DB_POOL_PING_INTERVAL", "30")),
+        )
 
-# 데이터 베이스 연결 생성
+# 풀에서 연결 대여 (close() 하면 풀에 반납)
     def get_connection(self):
         try:
-            return pymysql.connect(**self.connection_config)
+            return self.pool.acquire()
         except Exception as e:
             logger.error(f"MySQL 연결 실패: {e}")
             return None
 
-# menu_id로 가격 조회
-    def get_menu_price(self, menu_id: int) -> Optional[int]:
+# with 블록 동안 풀 연결 대여
+    @contextmanager
+    def connection(self):
+        conn = self.pool.acquire()
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+# 여러 문장을 하나의 트랜잭션으로 실행 (예외 시 롤백)
+    @contextmanager
+    def transaction(self):
+        with self.connection() as conn:
+            conn.begin()
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+# 카탈로그 캐시 경유 menu 행 조회 (캐시에 없는 것만 한 번에 DB 조회, 실패 시 None 반환)
+    def get_catalog_entries(self, menu_ids: Sequence[int]) -> Optional[Dict[int, Optional[MenuCatalogEntry]]]:
+        menu_ids = list(dict.fromkeys(menu_ids))
+        entries, missing = menu_catalog_cache.get_many(menu_ids)
+        if not missing:
+            return entries
+
+        generation = menu_catalog_cache.generation
         connection = self.get_connection()
         if not connection:
             return None
 
         try:
             with connection.cursor() as cursor:
-                sql = "SELECT price FROM menu WHERE id = %s AND is_active = 1"
-                cursor.execute(sql, (menu_id,))
-                result = cursor.fetchone()
-                return result[0] if result else None
-
+                # IN 절을 위한 플레이스홀더 생성
+                cursor.execute(_CATALOG_SQL.format(','.join(['%s'] * len(missing))), missing)
+                rows = _catalog_rows(cursor.fetchall())
         except Exception as e:
-            logger.error(f"가격 조회 실패 (menu_id: {menu_id}): {e}")
+            logger.error(f"메뉴 조회 실패 (menu_ids: {missing}): {e}")
             return None
         finally:
             connection.close()
 
+        menu_catalog_cache.put_many(missing, rows, generation)
+        entries.update((menu_id, rows.get(menu_id)) for menu_id in missing)
+        return entries
+
+# menu_id로 가격 조회
+    def get_menu_price(self, menu_id: int) -> Optional[int]:
+        return self.get_multiple_menu_prices([menu_id]).get(menu_id)
+
 # 여러 menu_id의 가격을 한 번에 조회
     def get_multiple_menu_prices(self, menu_ids: List[int]) -> Dict[int, int]:
         if not menu_ids:
             return {}
-
-        connection = self.get_connection()
-        if not connection:
-            return {}
-
-        try:
-            with connection.cursor() as cursor:
-                # IN 절을 위한 플레이스홀더 생성
-                placeholders = ','.join(['%s'] * len(menu_ids))
-                sql = f"SELECT id, price FROM menu WHERE id IN ({placeholders}) AND is_active = 1"
-                cursor.execute(sql, menu_ids)
-                results = cursor.fetchall()
-
-                return {menu_id: price for menu_id, price in results}
-
-        except Exception as e:
-            logger.error(f"가격 일괄 조회 실패 (menu_ids: {menu_ids}): {e}")
-            return {}
-        finally:
-            connection.close()
+        entries = self.get_catalog_entries(menu_ids)
+        return _active_prices(entries) if entries is not None else {}
 
 # 연결 테스트
     def test_connection(self) -> bool:
@@ -92,39 +237,93 @@ class SimpleMenuDB:
 
 # menu_id로 profile 조회 (null이면 null 반환)
     def get_user_profile(self, menu_id: int) -> Optional[Dict]:
-        connection = self.get_connection()
-        if not connection:
-            return None
+        entries = self.get_catalog_entries([menu_id])
+        return _active_profiles(entries).get(menu_id) if entries is not None else None
 
-        try:
-            with connection.cursor(pymysql.cursors.DictCursor) as cursor:
-                # menu 테이블에서 profile 컬럼 조회
-                sql = "SELECT profile FROM menu WHERE id = %s AND is_active = 1"
-                cursor.execute(sql, (menu_id,))
-                result = cursor.fetchone()
+# aiomysql 기반 비동기 메뉴 조회 (이벤트 루프를 막지 않는 API 경로용)
+class AsyncMenuDB:
+    def __init__(self, connection_config: Dict):
+        self.connection_config = {
+            'host': connection_config['host'],
+            'port': connection_config['port'],
+            'user': connection_config['user'],
+            'password': connection_config['password'],
+            'db': connection_config['database'],
+            'charset': connection_config['charset'],
+            'autocommit': True,
+        }
+        self.max_size = int(os.getenv("DB_POOL_SIZE", "10"))
+        self.pool_recycle = int(float(os.getenv("DB_POOL_MAX_LIFETIME", "1800")))
+        self._pool = None
+        self._pool_lock = asyncio.Lock()
+
+    # 풀은 이벤트 루프 안에서 처음 사용할 때 생성
+    async def _get_pool(self):
+        if self._pool is None:
+            async with self._pool_lock:
+                if self._pool is None:
+                    self._pool = await aiomysql.create_pool(
+                        minsize=1,
+                        maxsize=self.max_size,
+                        pool_recycle=self.pool_recycle,
+                        **self.connection_config
+                    )
+        return self._pool
 
-                if result and result['profile']:
-                    logger.info(f"Profile 조회 성공: menu_id={menu_id}")
-                    profile_data = result['profile']
-                    
-                    # profile이 JSON 문자열이면 파싱
-                    if isinstance(profile_data, str):
-                        try:
-                            return json.loads(profile_data)
-                        except json.JSONDecodeError:
-                            # JSON이 아닌 일반 문자열(URL 등)이면 그대로 반환
-                            return profile_data
-                    else:
-                        return profile_data
-                else:
-                    logger.info(f"Profile 없음: menu_id={menu_id}")
-                    return None
+# 카탈로그 캐시 경유 menu 행 조회 (캐시에 없는 것만 한 번에 DB 조회, 실패 시 None 반환)
+    async def get_catalog_entries(self, menu_ids: Sequence[int]) -> Optional[Dict[int, Optional[MenuCatalogEntry]]]:
+        menu_ids = list(dict.fromkeys(menu_ids))
+        entries, missing = menu_catalog_cache.get_many(menu_ids)
+        if not missing:
+            return entries
 
+        generation = menu_catalog_cache.generation
+        try:
+            pool = await self._get_pool()
+            async with pool.acquire() as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.execute(_CATALOG_SQL.format(','.join(['%s'] * len(missing))), missing)
+                    rows = _catalog_rows(await cursor.fetchall())
         except Exception as e:
-            logger.error(f"Profile 조회 실패 (menu_id: {menu_id}): {e}")
+            logger.error(f"메뉴 조회 실패 (menu_ids: {missing}): {e}")
             return None
-        finally:
-            connection.close()
+
+        menu_catalog_cache.put_many(missing, rows, generation)
+        entries.update((menu_id, rows.get(menu_id)) for menu_id in missing)
+        return entries
+
+# menu_id로 가격 조회
+    async def get_menu_price(self, menu_id: int) -> Optional[int]:
+        return (await self.get_multiple_menu_prices([menu_id])).get(menu_id)
+
+# 여러 menu_id의 가격을 한 번에 조회
+    async def get_multiple_menu_prices(self, menu_ids: List[int]) -> Dict[int, int]:
+        if not menu_ids:
+            return {}
+        entries = await self.get_catalog_entries(menu_ids)
+        return _active_prices(entries) if entries is not None else {}
+
+# menu_id로 profile 조회 (null이면 null 반환)
+    async def get_user_profile(self, menu_id: int) -> Optional[Dict]:
+        if menu_id is None:
+            return None
+        return (await self.get_multiple_user_profiles([menu_id])).get(menu_id)
+
+# 여러 menu_id의 profile을 한 번에 조회 (profile 이 없는 메뉴는 결과에서 빠짐)
+    async def get_multiple_user_profiles(self, menu_ids: List[int]) -> Dict[int, Dict]:
+        if not menu_ids:
+            return {}
+        entries = await self.get_catalog_entries(menu_ids)
+        return _active_profiles(entries) if entries is not None else {}
+
+# 풀 정리 (lifespan 종료 시)
+    async def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            await self._pool.wait_closed()
+            self._pool = None
 
 # 전역 인스턴스
-simple_menu_db = SimpleMenuDB()
\ No newline at end of file
+menu_catalog_cache = MenuCatalogCache()
+simple_menu_db = SimpleMenuDB()
+async_menu_db = AsyncMenuDB(simple_menu_db.connection_config)
\ No newline at end of file
@@ -13,15 +13,27 @@ from routers.auth_owner import router as auth_router
 from routers.owner_orders import router as owner_orders_router
 from routers.owner_menu import router as owner_menu_router
 from config.swagger_config import setup_swagger
-from sentence_transformers import SentenceTransformer
-from services.similarity_utils import set_model_getter
+from services.similarity_utils import set_model_getter, set_store_getter, close_encode_batcher
+from services.embedding_store import get_embedding_store
+from services.model_registry import model_registry, preload_enabled
 from config.config_cache import warmup_config_cache
-from contextlib import asynccontextmanager
-from database.simple_db import simple_menu_db
+from contextlib import asynccontextmanager, suppress
+import asyncio
+from database.simple_db import simple_menu_db, async_menu_db
+from services.order_at_once_service import get_order_at_once_service
+from services.redis_session_service import async_session_manager
+from services.logic_service import get_qdrant_client, get_async_qdrant_client, get_qdrant_menu_search
+from services.menu_index import menu_vector_index, use_memory_index
+from services.packaging_classifier import get_packaging_classifier
+from services.menu_catalog_events import run_menu_catalog_subscriber
 from routers.phone_router import router as phone_router
 
-model = SentenceTransformer('jhgan/ko-sroberta-multitask')
-set_model_getter(lambda: model)
+# 임베딩 모델은 레지스트리에서 프로세스당 한 번만 적재
+set_model_getter(model_registry.get)
+# 디스크 임베딩 저장소: 재시작/다른 워커가 계산해 둔 벡터 재사용
+set_store_getter(get_embedding_store)
+if preload_enabled():
+    model_registry.preload()
 
 # 애플리케이션 시작 시 초기화 스크립트들을 실행
 async def run_initialization_scripts():
@@ -65,13 +77,55 @@ async def lifespan(_: FastAPI):
     else:
         logger.error("MySQL 데이터베이스 연결 실패")
 
+    # 임베딩 모델 준비 (사전 적재를 껐다면 여기서 워커별로 적재)
+    await asyncio.to_thread(model_registry.get)
+    logger.info(f"임베딩 모델 상태: {model_registry.stats()}")
+
     # 초기화 스크립트 실행
     await run_initialization_scripts()
 
     warmup_config_cache()
     logger.info("설정 캐시 예열 완료")
+
+    # Qdrant 검색 어댑터 준비 (API 호환성 확인 + temp 필터 생성)
+    get_qdrant_menu_search()
+
+    # 메뉴 벡터 인덱스 적재 (Qdrant → 실패 시 MySQL)
+    if use_memory_index():
+        if await asyncio.to_thread(menu_vector_index.load, get_qdrant_client()):
+            logger.info("메뉴 벡터 인덱스 준비 완료")
+        else:
+            logger.warning("메뉴 벡터 인덱스 로드 실패 → Qdrant 검색 사용")
+
+    # 포장 분류기 별칭 임베딩 준비
+    await asyncio.to_thread(get_packaging_classifier().build)
+
+    # 메뉴 인덱스는 프로세스당 한 번만 만들고, 이후에는 백그라운드에서 변경분만 교체
+    order_service = get_order_at_once_service()
+    menu_refresher = asyncio.create_task(order_service.run_menu_refresher())
+    logger.info("OrderAtOnceService 메뉴 캐시 준비 완료")
+
+    # 다른 워커의 메뉴 변경 시 가격/프로필 캐시 무효화
+    catalog_subscriber = asyncio.create_task(run_menu_catalog_subscriber())
+
+    # 만료된 세션을 단계별 통계에서 주기적으로 차감
+    stats_reaper = asyncio.create_task(async_session_manager.run_stats_reaper())
+
+    # 다른 워커가 세션을 바꾸면 로컬 세션 캐시에서 제거
+    session_cache_subscriber = asyncio.create_task(async_session_manager.run_cache_subscriber())
     yield
 
+    # 종료 시
+    for task in (menu_refresher, catalog_subscriber, stats_reaper, session_cache_subscriber):
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    await close_encode_batcher()
+    simple_menu_db.pool.close_all()
+    await async_menu_db.close()
+    await async_session_manager.close()
+    await get_async_qdrant_client().close()
+
 # FastAPI 앱 생성
 app = FastAPI(
     title="네이버 클로바 STT API",
@@ -23,6 +23,38 @@ async def health_check():
         stt_service_available=stt_available
     )
 
+@router.get("/health/metrics", summary="캐시/리소스 지표 조회")
+async def get_metrics():
+    from services.order_at_once_service import get_order_at_once_service
+    from database.simple_db import simple_menu_db, menu_catalog_cache
+    from services.menu_index import menu_vector_index
+    from services.model_registry import model_registry
+    from services.embedding_store import get_embedding_store
+    from services.similarity_utils import encode_batcher_stats
+    from services.logic_service import menu_search_cascade_stats
+    from services.redis_session_service import session_ops_stats, async_session_manager
+    from services.session_cache import session_local_cache
+    import redis
+
+    store = get_embedding_store()
+    try:
+        sessions = await async_session_manager.get_session_stats()
+    except redis.RedisError as e:
+        sessions = {"error": str(e)}
+    return {
+        "menu_cache": get_order_at_once_service().get_cache_stats(),
+        "menu_index": menu_vector_index.stats(),
+        "mysql_pool": simple_menu_db.pool.stats(),
+        "menu_catalog_cache": menu_catalog_cache.stats(),
+        "embedding_model": model_registry.stats(),
+        "embedding_store": store.stats() if store is not None else None,
+        "encode_batcher": encode_batcher_stats(),
+        "menu_search_cascade": menu_search_cascade_stats.stats(),
+        "session_redis_ops": session_ops_stats.stats(),
+        "sessions": sessions,
+        "session_local_cache": session_local_cache.stats(),
+    }
+
 @router.get("/languages", response_model=LanguagesResponse)
 async def get_supported_languages():
     language_map = {
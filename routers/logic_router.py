@@ -3,7 +3,7 @@ from services.logic_service import process_order, process_packaging, analyze_con
 from models.logic_request_models import MenuRequest, PackagingRequest
 from models.logic_response_models import StandardResponse, ErrorResponse, SessionResponse
 
-from services.redis_session_service import session_manager
+from services.redis_session_service import async_session_manager, with_session_unit_of_work
 import logging
 
 from core.exceptions.session_exceptions import (
@@ -22,7 +22,7 @@ router = APIRouter(
 # 세션 생성
 @router.post("/start", summary="세션 생성")
 async def start_order():
-    session_id = session_manager.create_session()
+    session_id = await async_session_manager.create_session()
     return StandardResponse(
         message="주문을 시작합니다. 원하시는 메뉴와 수량을 말씀해주세요.",
         session_id=session_id,
@@ -30,9 +30,10 @@ async def start_order():
     )
 
 @router.post("/order/{session_id}", summary="메뉴/수량 처리")
+@with_session_unit_of_work("logic.order")
 async def place_order(session_id: str, order: MenuRequest):  # MenuRequest 재사용
     try:
-        msg = process_order(session_id, order.menu_item)
+        msg = await process_order(session_id, order.menu_item)
 
         logger.debug(f"주문 처리 완료: {session_id}")
         logger.debug(f"현재 단계: packaging, 다음: 포장/매장식사 선택")
@@ -73,11 +74,12 @@ async def place_order(session_id: str, order: MenuRequest):  # MenuRequest 재
         )
 
 @router.post("/packaging/{session_id}", summary="매장/포장 처리")
+@with_session_unit_of_work("logic.packaging")
 async def choose_packaging(session_id: str, p: PackagingRequest):
     try:
-        msg = process_packaging(session_id, p.packaging_type)
+        msg = await process_packaging(session_id, p.packaging_type)
 
-        session = session_manager.get_session(session_id)
+        session = await async_session_manager.get_session(session_id)
         orders = session["data"].get("orders", [])
         total_items = session["data"].get("total_items", 0)
         total_price = sum(order["price"] * order["quantity"] for order in orders) if orders else 0
@@ -102,12 +104,13 @@ async def choose_packaging(session_id: str, p: PackagingRequest):
 
 # 전체 세션 정보 조회
 @router.get("/session/{session_id}", summary="Redis에 저장된 세션 조회")
+@with_session_unit_of_work("logic.session", local_cache=True)
 async def get_full_session(session_id: str):
-    session = session_manager.get_session(session_id)
+    session = await async_session_manager.get_session(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다.")
 
-    orders = add_profiles_to_orders(session_id)
+    orders = await add_profiles_to_orders(session_id)
     total_items = session["data"].get("total_items", 0)
     total_price = sum(order["price"] * order["quantity"] for order in orders) if orders else 0
     packaging = session["data"].get("packaging_type")
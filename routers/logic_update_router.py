@@ -6,6 +6,7 @@ from models.logic_update_response_models import (
     RemoveOrderRequest,
     OrderManagementResponse
 )
+from services.redis_session_service import with_session_unit_of_work
 from services.logic_update_service import (
     patch_orders,
     add_additional_order,
@@ -30,12 +31,13 @@ router = APIRouter(prefix="/orders", tags=["Order Management"])
 
 # 부분 주문 업데이트
 @router.put("/{session_id}/patch-update", response_model=OrderManagementResponse, summary="부분 주문 업데이트")
+@with_session_unit_of_work("orders.patch")
 async def update_all_orders_endpoint(session_id: str, request: UpdateAllOrdersRequest) -> OrderManagementResponse:
     try:
         # Pydantic 모델을 딕셔너리 리스트로 변환
         order_items = [order.model_dump() for order in request.orders]
 
-        result = patch_orders(
+        result = await patch_orders(
             session_id=session_id,
             order_items=order_items
         )
@@ -61,9 +63,10 @@ async def update_all_orders_endpoint(session_id: str, request: UpdateAllOrdersRe
 
 # 추가 주문 (POST 메서드)
 @router.post("/{session_id}/add", response_model=OrderManagementResponse, summary="추가 주문")
+@with_session_unit_of_work("orders.add")
 async def add_order(session_id: str, request: AddOrderRequest) -> OrderManagementResponse:
     try:
-        result = add_additional_order(
+        result = await add_additional_order(
             session_id=session_id,
             order_text=request.order_text
         )
@@ -89,9 +92,10 @@ async def add_order(session_id: str, request: AddOrderRequest) -> OrderManagemen
 
 # 주문 삭제 (DELETE 메서드)
 @router.delete("/{session_id}/remove", response_model=OrderManagementResponse, summary="주문 삭제")
+@with_session_unit_of_work("orders.remove")
 async def remove_order(session_id: str, request: RemoveOrderRequest) -> OrderManagementResponse:
     try:
-        result = remove_order_item(
+        result = await remove_order_item(
             session_id=session_id,  # 수정: request.session_id → session_id
             menu_id=request.menu_id
         )
@@ -117,9 +121,10 @@ async def remove_order(session_id: str, request: RemoveOrderRequest) -> OrderMan
 
 # 전체 주문 삭제 (DELETE 메서드)
 @router.delete("/{session_id}/clear", response_model=OrderManagementResponse, summary="전체 주문 삭제")
+@with_session_unit_of_work("orders.clear")
 async def clear_orders(session_id: str) -> OrderManagementResponse:
     try:
-        result = clear_all_orders(session_id=session_id)
+        result = await clear_all_orders(session_id=session_id)
 
         return OrderManagementResponse(
             success=True,
@@ -2,25 +2,26 @@ from fastapi import APIRouter, HTTPException, Depends
 from config.naver_stt_settings import logger
 from models.order_response_models import StandardResponse, ErrorResponse, PackagingType
 
-from services.order_at_once_service import OrderAtOnceService
-from services.redis_session_service import session_manager
-from database.simple_db import simple_menu_db
+from services.order_at_once_service import OrderAtOnceService, get_order_at_once_service
+from services.redis_session_service import async_session_manager, with_session_unit_of_work
+from database.simple_db import async_menu_db
 
 router = APIRouter(prefix="/order-at-once", tags=["Order At Once"])
 
 def get_order_service() -> OrderAtOnceService:
-    return OrderAtOnceService()
+    return get_order_at_once_service()
 
 @router.post("/start", summary="세션 생성")
 async def start_order_at_once():
     try:
-        session_id = session_manager.create_session()
+        session_id = await async_session_manager.create_session()
         return {"message": "한 번에 주문해주세요.", "session_id": session_id}
     except Exception as e:
         logger.error(f"세션 생성 중 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=f"세션 생성 실패: {str(e)}")
 
 @router.post("/process/{session_id}", summary="한번에 주문 처리")
+@with_session_unit_of_work("order_at_once.process")
 async def process_order_at_once(
     session_id: str,
     text: str,
@@ -64,9 +65,10 @@ async def process_order_at_once(
     )
 
 @router.get("/session/{session_id}", summary="Redis 세션 조회")
+@with_session_unit_of_work("order_at_once.session", local_cache=True)
 async def get_session_order(session_id: str):
   try:
-    session = session_manager.get_session(session_id)
+    session = await async_session_manager.get_session(session_id)
     if not session:
       return ErrorResponse(
           message="세션을 찾을 수 없습니다.",
@@ -89,7 +91,7 @@ async def get_session_order(session_id: str):
     price = menu_obj.get("price", 0) or 0
     packaging = data.get("packaging_type") or None
     pack_enum = PackagingType(packaging) if packaging in {"포장", "매장식사"} else None
-    profile = simple_menu_db.get_user_profile(menu_id)
+    profile = await async_menu_db.get_user_profile(menu_id)
 
     return {
       "message": "세션 조회 완료",
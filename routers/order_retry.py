@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException
 
 from config.naver_stt_settings import logger
 from services.order_retry_service import OrderRetryService
-from services.order_at_once_service import OrderAtOnceService
+from services.order_at_once_service import get_order_at_once_service
 
 from models.order_retry_request_models import (
     PackagingRetryRequest,
@@ -16,7 +16,7 @@ from models.order_retry_response_models import (
 router = APIRouter(prefix="/order-retry", tags=["Order Retry"])
 
 def get_retry_service() -> OrderRetryService:
-    return OrderRetryService(base_service=OrderAtOnceService())
+    return OrderRetryService(base_service=get_order_at_once_service())
 
 @router.post("/update-packaging/{session_id}", response_model=PackagingRetryResponse, summary="포장 여부 업데이트")
 async def update_packaging_only(session_id: str, req: PackagingRetryRequest, svc: OrderRetryService = Depends(get_retry_service)):
@@ -0,0 +1,71 @@
+# 동시 요청 부하에서 /logic, /order-at-once 응답 지연(p50/p95/p99) 측정
+# 사용법: python -m scripts.bench_async_latency --base-url http://localhost:8000 --concurrency 32 --requests 500
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List, Tuple
+import httpx
+
+ORDER_TEXTS = [
+    "아이스 아메리카노 두 잔",
+    "따뜻한 카페라떼 한 잔 하고 치즈케이크 하나",
+    "바닐라 라떼 한 잔",
+    "레몬에이드 두 잔 그리고 티라미수 하나",
+]
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+# (지연 ms, 성공 여부) — 실패 응답도 지연에는 포함하고 따로 센다
+async def _logic_order(client: httpx.AsyncClient, text: str) -> Tuple[float, bool]:
+    session_id = (await client.post("/logic/start")).json()["session_id"]
+    started = time.perf_counter()
+    response = await client.post(f"/logic/order/{session_id}", json={"menu_item": text})
+    return (time.perf_counter() - started) * 1000, response.is_success
+
+async def _order_at_once(client: httpx.AsyncClient, text: str) -> Tuple[float, bool]:
+    session_id = (await client.post("/order-at-once/start")).json()["session_id"]
+    started = time.perf_counter()
+    response = await client.post(f"/order-at-once/process/{session_id}", params={"text": f"{text} 포장"})
+    return (time.perf_counter() - started) * 1000, response.is_success
+
+async def run(base_url: str, endpoint: str, concurrency: int, total: int) -> None:
+    call = _logic_order if endpoint == "logic" else _order_at_once
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    failures = 0
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=60) as client:
+        async def one(i: int):
+            nonlocal failures
+            async with semaphore:
+                latency, ok = await call(client, ORDER_TEXTS[i % len(ORDER_TEXTS)])
+                latencies.append(latency)
+                failures += not ok
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(total)))
+        elapsed = time.perf_counter() - started
+
+    print(f"[{endpoint}] 동시성={concurrency}, 요청={total}, 실패={failures}, 처리량={total / elapsed:.1f} req/s")
+    print(f"  평균={statistics.mean(latencies):.1f}ms "
+          f"p50={_percentile(latencies, 50):.1f}ms "
+          f"p95={_percentile(latencies, 95):.1f}ms "
+          f"p99={_percentile(latencies, 99):.1f}ms")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--endpoint", choices=["logic", "order-at-once", "both"], default="both")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    endpoints = ["logic", "order-at-once"] if args.endpoint == "both" else [args.endpoint]
+    for ep in endpoints:
+        asyncio.run(run(args.base_url, ep, args.concurrency, args.requests))
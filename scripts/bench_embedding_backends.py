@@ -0,0 +1,89 @@
+# 임베딩 백엔드별 적재 시간/메모리/지연 비교 (torch 기준 vs onnx vs onnx-int8)
+# 사용법: python -m scripts.bench_embedding_backends --repeat 200
+# 메모리를 공정하게 재기 위해 백엔드마다 별도 프로세스에서 측정
+import sys
+import json
+import time
+import argparse
+import subprocess
+import numpy as np
+from services.model_registry import EMBED_MODEL, EMBED_BACKENDS, load_embedding_model, process_memory_mb
+
+UTTERANCES = [
+    "아메리카노",
+    "아이스 아메리카노",
+    "따뜻한 카페라떼 한 잔",
+    "바닐라 라떼 두 잔 포장이요",
+    "치즈케이크 하나 주세요",
+    "여기서 먹고 갈게요",
+    "흑당 버블 밀크티",
+    "딸기 바나나 스무디 하나 가져갈게요",
+]
+
+def _normalized(model, texts):
+    vectors = np.asarray(model.encode(texts, show_progress_bar=False, convert_to_numpy=True), dtype=np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+# 한 프로세스에서 한 백엔드만 측정해 JSON 으로 출력
+def measure(backend: str, repeat: int) -> dict:
+    rss_before = process_memory_mb()["rss_mb"]
+    started = time.perf_counter()
+    model = load_embedding_model(EMBED_MODEL, backend)
+    load_seconds = time.perf_counter() - started
+    _normalized(model, UTTERANCES)  # 워밍업
+    rss_loaded = process_memory_mb()["rss_mb"]
+
+    single = []
+    for i in range(repeat):
+        text = UTTERANCES[i % len(UTTERANCES)]
+        t0 = time.perf_counter()
+        model.encode([text], show_progress_bar=False, convert_to_numpy=True)
+        single.append((time.perf_counter() - t0) * 1000)
+
+    t0 = time.perf_counter()
+    rounds = max(1, repeat // len(UTTERANCES))
+    for _ in range(rounds):
+        model.encode(UTTERANCES, show_progress_bar=False, convert_to_numpy=True)
+    batch_per_sec = rounds * len(UTTERANCES) / (time.perf_counter() - t0)
+
+    return {
+        "backend": backend,
+        "load_seconds": load_seconds,
+        "rss_delta_mb": rss_loaded - rss_before,
+        "p50_ms": float(np.percentile(single, 50)),
+        "p95_ms": float(np.percentile(single, 95)),
+        "batch_per_sec": batch_per_sec,
+        "vectors": _normalized(model, UTTERANCES).tolist(),
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--backends", nargs="+", default=list(EMBED_BACKENDS), choices=EMBED_BACKENDS)
+    parser.add_argument("--only", choices=EMBED_BACKENDS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.only:
+        print(json.dumps(measure(args.only, args.repeat)))
+        sys.exit(0)
+
+    results = []
+    for backend in args.backends:
+        proc = subprocess.run(
+            [sys.executable, "-m", "scripts.bench_embedding_backends", "--only", backend, "--repeat", str(args.repeat)],
+            capture_output=True, text=True,
+        )
+        if proc.returncode != 0:
+            print(f"[건너뜀] {backend}: {proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else '실패'}")
+            continue
+        results.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+
+    reference = next((np.asarray(r["vectors"]) for r in results if r["backend"] == "torch"), None)
+    print(f"\n모델 {EMBED_MODEL}, 단건 {args.repeat}회")
+    print(f"  {'백엔드':<10} {'적재(s)':>8} {'RSS증가(MB)':>12} {'p50(ms)':>8} {'p95(ms)':>8} {'배치(문장/초)':>14} {'최소 코사인':>10}")
+    for r in results:
+        drift = "-"
+        if reference is not None:
+            drift = f"{np.sum(reference * np.asarray(r['vectors']), axis=1).min():.5f}"
+        print(f"  {r['backend']:<10} {r['load_seconds']:>8.2f} {r['rss_delta_mb']:>12.1f} "
+              f"{r['p50_ms']:>8.2f} {r['p95_ms']:>8.2f} {r['batch_per_sec']:>14,.0f} {drift:>10}")
@@ -0,0 +1,138 @@
+# STT 오인식 메뉴명 매칭 정확도/지연 비교 (음절 ratio vs 자모 ratio vs 음절→자모 순차)
+# 사용법: python -m scripts.bench_jamo_matcher --repeat 200 --cutoff 80 --margin 3 --verbose
+import time
+import argparse
+from typing import Callable, List, Optional
+from rapidfuzz import fuzz as rf_fuzz, process as rf_process
+from rapidfuzz.utils import default_process
+from core.utils.jamo import JamoMatcher
+
+# scripts/setup_menu_data.py 메뉴명
+MENU_NAMES = [
+    "아메리카노", "카페라떼", "바닐라 라떼", "카푸치노", "카페모카", "카라멜 마키아토", "초코 라떼", "녹차 라떼",
+    "곡물 라떼", "흑임자 라떼", "제주 말차 버블 라떼", "밀크티", "흑당 버블 밀크티", "레몬티", "유자차",
+    "캐모마일 티", "페퍼민트 티", "레몬 허니 블랙티", "자몽 허니 블랙티", "레몬에이드", "자몽에이드",
+    "청포도 에이드", "블루 레몬 에이드", "딸기 주스", "키위 주스", "오렌지 주스", "딸기 바나나 스무디",
+    "망고 요거트 스무디", "블루베리 요거트 스무디", "플레인 요거트 스무디", "말차 프라페", "초콜릿 프라페",
+    "치즈케이크", "티라미수", "초코 머핀", "크루아상", "플레인 스콘", "마카롱 (3개)",
+]
+
+# (STT 결과, 정답 메뉴명 또는 None=메뉴 아님)
+GARBLED_CORPUS = [
+    ("아메리카노", "아메리카노"),
+    ("아메리까노", "아메리카노"),
+    ("아메리카나", "아메리카노"),
+    ("아매리카노", "아메리카노"),
+    ("아메리 카노", "아메리카노"),
+    ("카페라떼", "카페라떼"),
+    ("카페라뗴", "카페라떼"),
+    ("카페라테", "카페라떼"),
+    ("까페라떼", "카페라떼"),
+    ("카페 라때", "카페라떼"),
+    ("바닐라라떼", "바닐라 라떼"),
+    ("바날라 라떼", "바닐라 라떼"),
+    ("바닐나 라테", "바닐라 라떼"),
+    ("카푸치너", "카푸치노"),
+    ("카프치노", "카푸치노"),
+    ("카페모까", "카페모카"),
+    ("카라맬 마끼아또", "카라멜 마키아토"),
+    ("캬라멜 마키야토", "카라멜 마키아토"),
+    ("초꼬 라떼", "초코 라떼"),
+    ("녹챠 라떼", "녹차 라떼"),
+    ("흑임자라테", "흑임자 라떼"),
+    ("밀크띠", "밀크티"),
+    ("흑당 버블 밀크띠", "흑당 버블 밀크티"),
+    ("레몬 티", "레몬티"),
+    ("유자짜", "유자차"),
+    ("캐모마이 티", "캐모마일 티"),
+    ("카모마일 티", "캐모마일 티"),
+    ("페퍼민 티", "페퍼민트 티"),
+    ("레모네이드", "레몬에이드"),
+    ("래몬에이드", "레몬에이드"),
+    ("자몽애이드", "자몽에이드"),
+    ("청포토 에이드", "청포도 에이드"),
+    ("딸기 쥬스", "딸기 주스"),
+    ("키위쥬스", "키위 주스"),
+    ("오랜지 주스", "오렌지 주스"),
+    ("딸기 바나나 스므디", "딸기 바나나 스무디"),
+    ("망고 요구르트 스무디", "망고 요거트 스무디"),
+    ("말차 프라뻬", "말차 프라페"),
+    ("초콜렛 프라페", "초콜릿 프라페"),
+    ("치즈 케익", "치즈케이크"),
+    ("치즈캐이크", "치즈케이크"),
+    ("티라미슈", "티라미수"),
+    ("초코 머팬", "초코 머핀"),
+    ("크로와상", "크루아상"),
+    ("크루와상", "크루아상"),
+    ("플래인 스콘", "플레인 스콘"),
+    # 메뉴가 아닌 발화 (매칭되면 오답)
+    ("화장실 어디예요", None),
+    ("감사합니다", None),
+    ("잠깐만요", None),
+    ("카드 결제", None),
+    ("라떼", None),
+]
+
+def syllable_matcher(cutoff: float) -> Callable[[str], Optional[str]]:
+    choices = [default_process(name) for name in MENU_NAMES]
+
+    def match(text: str) -> Optional[str]:
+        best = rf_process.extractOne(default_process(text), choices, scorer=rf_fuzz.ratio,
+                                     processor=None, score_cutoff=cutoff)
+        return MENU_NAMES[best[2]] if best else None
+    return match
+
+def jamo_matcher(cutoff: float, margin: float) -> Callable[[str], Optional[str]]:
+    matcher = JamoMatcher(MENU_NAMES)
+
+    def match(text: str) -> Optional[str]:
+        best = matcher.best(text, score_cutoff=cutoff, margin=margin)
+        return matcher.names[best[0]] if best else None
+    return match
+
+def evaluate(name: str, match: Callable[[str], Optional[str]], repeat: int) -> List[str]:
+    correct = wrong = missed = 0
+    failures = []
+    for text, expected in GARBLED_CORPUS:
+        got = match(text)
+        if got == expected:
+            correct += 1
+        elif got is None:
+            missed += 1
+            failures.append(f"    미스  '{text}' (정답 {expected})")
+        else:
+            wrong += 1
+            failures.append(f"    오답  '{text}' → {got} (정답 {expected})")
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for text, _ in GARBLED_CORPUS:
+            match(text)
+    us = (time.perf_counter() - started) / (repeat * len(GARBLED_CORPUS)) * 1e6
+
+    total = len(GARBLED_CORPUS)
+    print(f"  {name:<16}: 정답 {correct:>2}/{total} ({correct / total:6.1%}), 오답 {wrong:>2}, 미스 {missed:>2}, {us:7.2f} µs/발화")
+    return failures
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--syllable-cutoff", type=float, default=70)
+    parser.add_argument("--cutoff", type=float, default=80, help="자모 ratio 하한 (0~100)")
+    parser.add_argument("--margin", type=float, default=3, help="1·2위 자모 점수 최소 차이")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    syllable = syllable_matcher(args.syllable_cutoff)
+    jamo = jamo_matcher(args.cutoff, args.margin)
+
+    print(f"메뉴 {len(MENU_NAMES)}개, 발화 {len(GARBLED_CORPUS)}개 × {args.repeat}회")
+    results = [
+        ("음절 ratio", evaluate("음절 ratio", syllable, args.repeat)),
+        ("자모 ratio", evaluate("자모 ratio", jamo, args.repeat)),
+        ("음절→자모", evaluate("음절→자모", lambda t: syllable(t) or jamo(t), args.repeat)),
+    ]
+    if args.verbose:
+        for name, failures in results:
+            print(f"\n[{name}]")
+            print("\n".join(failures) or "    없음")
@@ -0,0 +1,106 @@
+# 메뉴 검색용 텍스트 정리 처리량 비교 (기존 정규식 연쇄 vs 단일 패스 정리기, 캐시 유무)
+# 사용법: python -m scripts.bench_menu_normalizer --rounds 200
+import re
+import time
+import argparse
+from typing import Callable, List
+from config.config_cache import (
+    get_quantity_config,
+    get_temperature_keywords,
+    get_keyword_automaton,
+    get_menu_noise_words,
+    get_filler_words,
+    get_menu_punctuation,
+    MENU_STRIP_CATEGORIES,
+)
+from core.utils.text_normalizer import MenuTextNormalizer
+
+# 키오스크 음성 주문 문장 (STT 결과 그대로)
+KIOSK_CORPUS = [
+    "아이스 아메리카노 두 잔 포장이요",
+    "따뜻한 카페라떼 한잔 매장에서 먹고 갈게요",
+    "바닐라 라떼 하나 주세요",
+    "시원한 레몬에이드 2잔 테이크아웃 해주세요",
+    "치즈케이크 하나랑 아메리카노 한 잔이요",
+    "뜨거운 녹차 라떼 1개 좀 해주세요",
+    "카페모카 아이스로 두 개요",
+    "초코 머핀 세 개 포장해 주세요",
+    "딸기 바나나 스무디 하나 가져갈게요",
+    "흑당 버블 밀크티 두 잔이요",
+    "캐모마일 티 따뜻하게 한 잔",
+    "말차 프라페 하나요!",
+    "아이스 카라멜 마키아토 한 잔 to go",
+    "hot americano 2잔 for here",
+    "유자차 뜨거운 걸로 하나 주세요",
+    "자몽에이드 두 잔 그리고 티라미수 하나",
+    "\"블루 레몬 에이드\" 하나 주세요",
+    "카푸치노 (핫) 1잔",
+    "플레인 스콘 두 개, 크루아상 하나",
+    "얼음 많이 아이스티 한 잔",
+    "망고 요거트 스무디 하나 포장",
+    "흑임자 라떼 아이스로 한 잔 주세요",
+    "밀크티 따뜻한 거 두 잔이요",
+    "곡물 라떼 하나 매장",
+    "오렌지 주스 한 잔 테이크아웃이요",
+]
+
+# 변경 전 구현: 패턴/키워드마다 re.sub 한 번씩
+def legacy_clean(text: str, quantity_patterns: List[str], temp_keywords: List[str]) -> str:
+    cleaned = text
+    for pattern in quantity_patterns:
+        cleaned = re.sub(pattern, " ", cleaned)
+    for keyword in temp_keywords:
+        cleaned = re.sub(re.escape(keyword), " ", cleaned, flags=re.IGNORECASE)
+    for kw in get_menu_noise_words():
+        cleaned = re.sub(re.escape(kw), " ", cleaned, flags=re.IGNORECASE)
+    cleaned = re.sub(r'[\"\'“”‘’`]', " ", cleaned)
+    cleaned = re.sub(r'[(){}\[\],.!?]', " ", cleaned)
+    for word in get_filler_words():
+        cleaned = re.sub(re.escape(word), " ", cleaned, flags=re.IGNORECASE)
+    return " ".join(cleaned.split()).strip()
+
+def _throughput(clean: Callable[[str], str], rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for text in KIOSK_CORPUS:
+            clean(text)
+    return rounds * len(KIOSK_CORPUS) / (time.perf_counter() - started)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    quantity_patterns = get_quantity_config().get("regex_patterns", [])
+    cold, hot, _ = get_temperature_keywords()
+    temp_keywords = cold + hot
+
+    def make_normalizer(cache_size: int) -> MenuTextNormalizer:
+        return MenuTextNormalizer(
+            automaton=get_keyword_automaton(),
+            quantity_patterns=quantity_patterns,
+            strip_categories=MENU_STRIP_CATEGORIES,
+            punctuation=get_menu_punctuation(),
+            cache_size=cache_size,
+        )
+
+    uncached = make_normalizer(cache_size=0)
+    cached = make_normalizer(cache_size=2048)
+
+    mismatches = 0
+    for text in KIOSK_CORPUS:
+        before = legacy_clean(text, quantity_patterns, temp_keywords)
+        after = uncached.normalize(text)
+        if before != after:
+            mismatches += 1
+            print(f"≠ '{text}'\n    기존: '{before}'\n    변경: '{after}'")
+    print(f"문장 {len(KIOSK_CORPUS)}개 중 결과 차이 {mismatches}개\n")
+
+    results = [
+        ("기존 정규식 연쇄", _throughput(lambda t: legacy_clean(t, quantity_patterns, temp_keywords), args.rounds)),
+        ("단일 패스 (캐시 없음)", _throughput(uncached.normalize, args.rounds)),
+        ("단일 패스 (캐시)", _throughput(cached.normalize, args.rounds)),
+    ]
+    baseline = results[0][1]
+    for name, per_sec in results:
+        print(f"  {name:<18}: {per_sec:>10,.0f} 문장/초 ({1e6 / per_sec:7.2f} µs, {per_sec / baseline:5.1f}배)")
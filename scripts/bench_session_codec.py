@@ -0,0 +1,90 @@
+# 세션 코덱별 인코딩/디코딩 시간과 저장 크기 비교 (세션 해시 필드 전체 기준)
+# 사용법: python -m scripts.bench_session_codec --repeat 2000 --compress-min-bytes 1024
+import time
+import json
+import argparse
+from typing import Any, Dict, List
+from services.session_codec import SessionCodec, SESSION_CODECS, encode_session_fields, decode_session_fields
+
+def _order(i: int) -> Dict[str, Any]:
+    return {
+        "menu_id": 100 + i,
+        "menu_item": ["아메리카노", "카페라떼", "바닐라 라떼", "흑당 버블 밀크티", "딸기 바나나 스무디"][i % 5],
+        "price": 4000 + 500 * (i % 4),
+        "quantity": 1 + i % 3,
+        "original": f"아이스 메뉴{i} {1 + i % 3}개",
+        "popular": i % 2 == 0,
+        "temp": "ice" if i % 2 else "hot",
+    }
+
+def _session(orders: int, order_at_once: bool) -> Dict[str, Any]:
+    items = [_order(i) for i in range(orders)]
+    session = {
+        "created_at": "2025-01-01T12:00:00.000000",
+        "expires_at": "2025-01-01T12:30:00.000000",
+        "updated_at": "2025-01-01T12:01:30.000000",
+        "step": "packaging",
+        "version": 3,
+        "data": {
+            "menu_item": None,
+            "quantity": None,
+            "packaging_type": "포장",
+            "orders": items,
+            "total_items": sum(o["quantity"] for o in items),
+        },
+    }
+    if order_at_once:
+        session["data"]["order_at_once"] = {
+            "menu": {"menu_id": 101, "name": "카페라떼", "quantity": 2, "similarity": 0.93, "popular": True,
+                     "temp": "ice", "price": 4500, "method": "jamo"},
+            "packaging": "포장",
+            "original_text": "아이스 카페라떼 두 잔 포장해 주세요",
+            "status": "completed",
+            "step": "order_at_once_completed",
+            "menu_id": 101,
+        }
+    return session
+
+# (이름, 세션 문서)
+SCENARIOS = [
+    ("새 세션", _session(0, False)),
+    ("주문 3건", _session(3, False)),
+    ("주문 10건+한번에", _session(10, True)),
+    ("주문 40건+한번에", _session(40, True)),
+]
+
+def bench(codec: SessionCodec, session: Dict[str, Any], repeat: int) -> List[float]:
+    fields = encode_session_fields(session, codec)
+    assert decode_session_fields(fields, codec) == session
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        encode_session_fields(session, codec)
+    encode_us = (time.perf_counter() - started) / repeat * 1e6
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        decode_session_fields(fields, codec)
+    decode_us = (time.perf_counter() - started) / repeat * 1e6
+
+    size = sum(len(k) + len(v) for k, v in fields.items())
+    return [encode_us, decode_us, size]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=2000)
+    parser.add_argument("--compress-min-bytes", type=int, default=1024, help="zstd 압축 하한 (0 이면 압축 안 함)")
+    parser.add_argument("--zstd-level", type=int, default=3)
+    args = parser.parse_args()
+
+    variants = [(f"{name}", SessionCodec(name, 0)) for name in SESSION_CODECS]
+    if args.compress_min_bytes > 0:
+        variants += [(f"{name}+zstd", SessionCodec(name, args.compress_min_bytes, args.zstd_level)) for name in SESSION_CODECS]
+
+    for title, session in SCENARIOS:
+        legacy = len(json.dumps(session).encode("utf-8"))
+        print(f"\n[{title}] 이전 형식(JSON 문서 한 덩어리) {legacy:,} B")
+        print(f"  {'코덱':<14} {'인코딩 µs':>10} {'디코딩 µs':>10} {'크기 B':>9}")
+        for name, codec in variants:
+            encode_us, decode_us, size = bench(codec, session, args.repeat)
+            print(f"  {name:<14} {encode_us:>10.1f} {decode_us:>10.1f} {size:>9,}")
@@ -0,0 +1,86 @@
+# split_multiple_orders 발화당 처리 비용 비교 (기존 방식 vs 컴파일된 주문 문법)
+# 사용법: python -m scripts.bench_split_orders --repeat 2000
+import re
+import time
+import argparse
+from typing import List, Callable
+from rapidfuzz import process as rf_process, fuzz as rf_fuzz
+from config.config_cache import (
+    get_order_grammar,
+    get_temperature_keywords,
+    get_similarity_thresholds,
+    get_compiled_separators_pattern,
+    get_units_list,
+    get_korean_numbers,
+)
+
+UTTERANCES = [
+    "아이스 아메리카노 두 잔",
+    "따뜻한 카페라떼 한 잔 하고 치즈케이크 하나",
+    "아메리카노 두 잔 라떼 한 잔",
+    "카페라떼랑 레몬에이드 두 잔",
+    "뜨거운 카페라떼 한잔 아이스 아메리카노 두잔",
+    "아메리카노2잔카페라떼3잔",
+    "바닐라 라떼 한 잔",
+    "시원한 레몬에이드 두 잔 그리고 티라미수 하나",
+    "초코 머핀 세 개 녹차 라떼 두 잔 딸기 주스 한 잔",
+    "흑당 버블 밀크티 하나 주세요",
+]
+
+# 변경 전 구현 (매 호출마다 정규식 생성 + 단어별 extractOne + 문자열 치환)
+def legacy_split(order_text: str) -> List[str]:
+    _, _, temp_keywords_lower = get_temperature_keywords()
+    protected_text = order_text
+    replacements = {}
+    rapidfuzz_threshold = get_similarity_thresholds()["rapidfuzz_threshold"]
+
+    for i, word in enumerate(order_text.split()):
+        cand = rf_process.extractOne(word.lower(), temp_keywords_lower, scorer=rf_fuzz.ratio)
+        if cand and cand[1] >= rapidfuzz_threshold:
+            placeholder = f"__TEMP_{i}__"
+            protected_text = protected_text.replace(word, placeholder)
+            replacements[placeholder] = word
+
+    def restore(orders):
+        restored = []
+        for order in orders:
+            for placeholder, original in replacements.items():
+                order = order.replace(placeholder, original)
+            restored.append(order)
+        return restored
+
+    orders = [o.strip() for o in get_compiled_separators_pattern().split(protected_text) if o.strip()]
+    if len(orders) > 1:
+        return restore(orders)
+
+    unit_pattern = '|'.join(re.escape(unit) for unit in get_units_list())
+    korean_nums = '|'.join(re.escape(num) for num in get_korean_numbers().keys())
+    full_pattern = rf'([가-힣\s__TEMP_\d+__]*?[가-힣]+[가-힣\s__TEMP_\d+__]*?)\s*(\d+|{korean_nums})\s*({unit_pattern})?'
+    matches = re.findall(full_pattern, order_text)
+    if len(matches) > 1:
+        return restore([f"{m.strip()} {q} {u}" if u else f"{m.strip()} {q}" for m, q, u in matches])
+    return [order_text.strip()]
+
+def _measure(split: Callable[[str], List[str]], repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for text in UTTERANCES:
+            split(text)
+    return (time.perf_counter() - started) / (repeat * len(UTTERANCES)) * 1e6
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    grammar = get_order_grammar()
+    for text in UTTERANCES:
+        before, after = legacy_split(text), grammar.split(text)
+        mark = "=" if before == after else "≠"
+        print(f"{mark} '{text}'\n    기존: {before}\n    변경: {after}")
+
+    legacy_us = _measure(legacy_split, args.repeat)
+    grammar_us = _measure(grammar.split, args.repeat)
+    print(f"\n발화 {len(UTTERANCES)}개 × {args.repeat}회")
+    print(f"  기존 방식   : {legacy_us:8.2f} µs/발화")
+    print(f"  주문 문법   : {grammar_us:8.2f} µs/발화 ({legacy_us / grammar_us:.1f}배)")
@@ -0,0 +1,53 @@
+# 디스크 임베딩 저장소 사전 채우기 (배포 이미지 빌드/배포 직전에 실행)
+# 사용법: python -m scripts.build_embedding_store --purge-other-models
+# 활성 메뉴명(MySQL) + 포장 별칭/온도 키워드(설정 파일)를 현재 모델·백엔드로 인코딩해 저장
+import time
+import argparse
+from typing import List
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from services.model_registry import model_registry
+from services.embedding_store import get_embedding_store, collect_warm_texts
+from services.similarity_utils import set_model_getter, set_store_getter, encode_batch
+
+def load_menu_names() -> List[str]:
+    from database.simple_db import simple_menu_db
+
+    try:
+        with simple_menu_db.connection() as connection:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT DISTINCT name FROM menu WHERE is_active = 1")
+                return [row[0] for row in cursor.fetchall() if row[0]]
+    except Exception as e:
+        print(f"[경고] MySQL 메뉴명 조회 실패 → 설정 파일 텍스트만 저장: {e}")
+        return []
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--purge-other-models", action="store_true", help="다른 모델/백엔드로 계산된 행 삭제")
+    args = parser.parse_args()
+
+    set_model_getter(model_registry.get)
+    set_store_getter(get_embedding_store)
+    store = get_embedding_store()
+    if store is None:
+        raise SystemExit("임베딩 저장소가 비활성화되어 있습니다 (EMBED_STORE_ENABLED)")
+
+    if args.purge_other_models:
+        print(f"다른 모델 행 삭제: {store.purge_other_models()}개")
+
+    menu_names = load_menu_names()
+    texts = collect_warm_texts(menu_names)
+    print(f"대상 텍스트 {len(texts)}개 (메뉴명 {len(menu_names)}개), 모델 {store.model_key}")
+
+    started = time.perf_counter()
+    for i in range(0, len(texts), args.batch_size):
+        encode_batch(texts[i:i + args.batch_size])
+    store.evict()
+
+    stats = store.stats()
+    print(f"[OK] {store.path}: 기존 {stats['hits']}개 재사용, 새로 저장 {stats['writes']}개 "
+          f"({time.perf_counter() - started:.1f}s)")
@@ -0,0 +1,29 @@
+# 임베딩 모델을 ONNX / int8 동적 양자화 ONNX 로 로컬 내보내기 (EMBED_BACKEND=onnx|onnx-int8 용)
+# 사용법: python -m scripts.export_embedding_model --quant-config avx512_vnni
+# 필요 패키지: pip install "optimum[onnxruntime]"
+import os
+import argparse
+from sentence_transformers import SentenceTransformer, export_dynamic_quantized_onnx_model
+from services.model_registry import EMBED_MODEL, EMBED_QUANT_CONFIG, export_dir_for, onnx_file_name
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--model", default=EMBED_MODEL)
+    parser.add_argument("--quant-config", default=EMBED_QUANT_CONFIG,
+                        choices=["arm64", "avx2", "avx512", "avx512_vnni"])
+    parser.add_argument("--skip-int8", action="store_true")
+    args = parser.parse_args()
+
+    local_dir = export_dir_for(args.model)
+    os.makedirs(local_dir, exist_ok=True)
+
+    # backend="onnx" 로 열면 sentence-transformers 가 PyTorch 가중치를 ONNX 로 변환
+    model = SentenceTransformer(args.model, backend="onnx")
+    model.save_pretrained(local_dir)
+    print(f"[OK] ONNX 저장: {os.path.join(local_dir, onnx_file_name('onnx'))}")
+
+    if not args.skip_int8:
+        export_dynamic_quantized_onnx_model(model, args.quant_config, local_dir)
+        print(f"[OK] int8 저장: {os.path.join(local_dir, onnx_file_name('onnx-int8', args.quant_config))}")
+
+    print(f"EMBED_BACKEND=onnx 또는 onnx-int8, EMBED_EXPORT_DIR={os.path.dirname(local_dir)} 로 사용")
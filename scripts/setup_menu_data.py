@@ -1,12 +1,12 @@
 from qdrant_client import QdrantClient
-from sentence_transformers import SentenceTransformer
+from services.model_registry import get_embedding_model
 from qdrant_client.models import VectorParams, Distance, PointStruct
 
 # Qdrant 클라이언트 연결
 client = QdrantClient(url="http://qdrant:6333")
 
-# SentenceTransformer 모델 사용
-model = SentenceTransformer('jhgan/ko-sroberta-multitask')
+# 공용 임베딩 모델 사용 (앱에서 실행되면 이미 적재된 인스턴스를 그대로 씀)
+model = get_embedding_model()
 
 # 메뉴 데이터 (더 많은 메뉴 추가)
 menu_items = [
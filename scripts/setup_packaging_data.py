@@ -1,25 +1,16 @@
 from qdrant_client import QdrantClient
-from sentence_transformers import SentenceTransformer
+from services.model_registry import get_embedding_model
 from qdrant_client.models import VectorParams, Distance, PointStruct
+from config.config_cache import get_packaging_aliases
 
 client = QdrantClient(url="http://qdrant:6333")
-model = SentenceTransformer("jhgan/ko-sroberta-multitask")
+# 공용 임베딩 모델 사용 (앱에서 실행되면 이미 적재된 인스턴스를 그대로 씀)
+model = get_embedding_model()
 
+# 별칭 목록은 config/packaging_patterns.json 에서 관리 (포장 분류기와 공유)
 PACKAGING_DATA = [
-    {
-        "type": "포장",
-        "aliases": [
-            "포장", "포장해주세요", "테이크아웃", "가지고 갈게요", "take out",
-            "가져가", "가져갈게요", "갖고 갈게요", "나가서 먹을게요", "포장해줘"
-        ],
-    },
-    {
-        "type": "매장식사",
-        "aliases": [
-            "매장", "여기서 먹고 갈게요", "먹고 갈게요", "먹고",
-            "여기서", "매장에서 먹을게요", "앉아서 먹을게요",
-        ],
-    },
+    {"type": ptype, "aliases": aliases}
+    for ptype, aliases in get_packaging_aliases().items()
 ]
 
 COL = "packaging_options"
@@ -0,0 +1,200 @@
+import os
+import time
+import sqlite3
+import logging
+import threading
+from typing import Dict, Iterable, List, Optional, Sequence
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+EMBED_STORE_PATH = os.getenv("EMBED_STORE_PATH", os.path.join("artifacts", "embedding_cache.sqlite3"))
+EMBED_STORE_MAX_ROWS = int(os.getenv("EMBED_STORE_MAX_ROWS", "200000"))
+
+# 조회 시 last_used 갱신 간격(초): 매 조회마다 쓰기가 일어나지 않도록 오래된 행만 갱신
+_TOUCH_INTERVAL = 3600
+# 이 횟수만큼 쓸 때마다 크기 제한 검사
+_EVICT_CHECK_EVERY = 512
+# SQLite 바인딩 변수 제한 회피용 IN 절 묶음 크기
+_CHUNK = 500
+
+def store_enabled() -> bool:
+    return os.getenv("EMBED_STORE_ENABLED", "true").lower() in ("1", "true", "yes")
+
+# 모델별 정규화 임베딩을 보관하는 디스크 캐시 (SQLite WAL)
+# 재시작/워커 추가 시에도 이미 계산한 벡터를 재사용, 여러 워커가 같은 파일을 동시에 읽음
+# 오류는 모두 캐시 미스로 처리해 요청 처리에 영향을 주지 않음
+class EmbeddingStore:
+    def __init__(self, path: str, model_key: str, max_rows: int = EMBED_STORE_MAX_ROWS):
+        self.path = path
+        self.model_key = model_key
+        self.max_rows = max_rows
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._writes = 0
+        self._evicted = 0
+        self._errors = 0
+        self._since_evict_check = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                " model TEXT NOT NULL, text TEXT NOT NULL, vector BLOB NOT NULL,"
+                " last_used INTEGER NOT NULL, PRIMARY KEY (model, text)) WITHOUT ROWID"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_embeddings_lru ON embeddings (model, last_used)")
+
+    # 스레드별 연결 (sqlite3 연결은 스레드 간 공유하지 않음)
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _count(self, **deltas: int):
+        with self._stats_lock:
+            for name, value in deltas.items():
+                setattr(self, f"_{name}", getattr(self, f"_{name}") + value)
+
+    # 저장된 벡터 조회 (없는 키는 결과에서 빠짐)
+    def get_many(self, keys: Sequence[str]) -> Dict[str, np.ndarray]:
+        unique = list(dict.fromkeys(keys))
+        if not unique:
+            return {}
+        found: Dict[str, np.ndarray] = {}
+        stale: List[str] = []
+        now = int(time.time())
+        try:
+            conn = self._connection()
+            for i in range(0, len(unique), _CHUNK):
+                chunk = unique[i:i + _CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT text, vector, last_used FROM embeddings WHERE model = ? AND text IN ({placeholders})",
+                    (self.model_key, *chunk),
+                ).fetchall()
+                for text, blob, last_used in rows:
+                    found[text] = np.frombuffer(blob, dtype=np.float32)
+                    if now - last_used > _TOUCH_INTERVAL:
+                        stale.append(text)
+            if stale:
+                conn.executemany(
+                    "UPDATE embeddings SET last_used = ? WHERE model = ? AND text = ?",
+                    [(now, self.model_key, text) for text in stale],
+                )
+        except sqlite3.Error as e:
+            self._count(errors=1)
+            logger.warning(f"임베딩 저장소 조회 실패: {e}")
+            return {}
+
+        self._count(hits=len(found), misses=len(unique) - len(found))
+        return found
+
+    # 새로 계산한 정규화 벡터 저장
+    def put_many(self, keys: Sequence[str], vectors: np.ndarray):
+        if not len(keys):
+            return
+        now = int(time.time())
+        rows = [
+            (self.model_key, key, np.ascontiguousarray(vec, dtype=np.float32).tobytes(), now)
+            for key, vec in zip(keys, vectors)
+        ]
+        try:
+            conn = self._connection()
+            conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, text, vector, last_used) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+        except sqlite3.Error as e:
+            self._count(errors=1)
+            logger.warning(f"임베딩 저장소 쓰기 실패: {e}")
+            return
+
+        with self._stats_lock:
+            self._writes += len(rows)
+            self._since_evict_check += len(rows)
+            check = self._since_evict_check >= _EVICT_CHECK_EVERY
+            if check:
+                self._since_evict_check = 0
+        if check:
+            self.evict()
+
+    # 모델별 최대 행 수를 넘으면 가장 오래 안 쓴 행부터 삭제
+    def evict(self) -> int:
+        try:
+            conn = self._connection()
+            (rows,) = conn.execute("SELECT COUNT(*) FROM embeddings WHERE model = ?", (self.model_key,)).fetchone()
+            excess = rows - self.max_rows
+            if excess <= 0:
+                return 0
+            conn.execute(
+                "DELETE FROM embeddings WHERE model = ? AND text IN ("
+                " SELECT text FROM embeddings WHERE model = ? ORDER BY last_used LIMIT ?)",
+                (self.model_key, self.model_key, excess),
+            )
+        except sqlite3.Error as e:
+            self._count(errors=1)
+            logger.warning(f"임베딩 저장소 정리 실패: {e}")
+            return 0
+        self._count(evicted=excess)
+        logger.info(f"임베딩 저장소 정리: {excess}행 삭제 (모델 {self.model_key}, 상한 {self.max_rows})")
+        return excess
+
+    # 다른 모델/백엔드로 계산된 행 삭제 (모델 교체 후 정리용)
+    def purge_other_models(self) -> int:
+        try:
+            cursor = self._connection().execute("DELETE FROM embeddings WHERE model != ?", (self.model_key,))
+            return cursor.rowcount
+        except sqlite3.Error as e:
+            logger.warning(f"임베딩 저장소 정리 실패: {e}")
+            return 0
+
+    def stats(self) -> Dict:
+        with self._stats_lock:
+            return {
+                "path": self.path,
+                "model": self.model_key,
+                "max_rows": self.max_rows,
+                "hits": self._hits,
+                "misses": self._misses,
+                "writes": self._writes,
+                "evicted": self._evicted,
+                "errors": self._errors,
+            }
+
+_store: Optional[EmbeddingStore] = None
+_store_lock = threading.Lock()
+
+# 공용 임베딩 저장소 (모델명 + 실제 적재된 백엔드 기준으로 키 분리). 비활성화/생성 실패 시 None
+def get_embedding_store() -> Optional[EmbeddingStore]:
+    global _store
+    if _store is None and store_enabled():
+        with _store_lock:
+            if _store is None:
+                from services.model_registry import model_registry
+                try:
+                    _store = EmbeddingStore(EMBED_STORE_PATH, model_registry.model_key())
+                except (sqlite3.Error, OSError) as e:
+                    logger.error(f"임베딩 저장소 열기 실패 → 메모리 캐시만 사용: {e}")
+                    return None
+    return _store
+
+# 저장소 사전 채우기 대상 텍스트: 활성 메뉴명 + 설정 파일의 별칭/키워드
+def collect_warm_texts(menu_names: Iterable[str] = ()) -> List[str]:
+    from config.config_cache import get_packaging_aliases, get_temperature_keywords
+
+    texts: List[str] = list(menu_names)
+    for aliases in get_packaging_aliases().values():
+        texts.extend(aliases)
+    cold, hot, _ = get_temperature_keywords()
+    texts.extend(cold)
+    texts.extend(hot)
+    return list(dict.fromkeys(t for t in texts if t and t.strip()))
@@ -1,7 +1,8 @@
 import logging
-from typing import Dict, Any, List, Tuple
-from .redis_session_service import redis_session_manager
-from services.similarity_utils import combined_score_from_texts
+from typing import Dict, Any, List, Optional, Tuple, Sequence
+from .redis_session_service import redis_session_manager, async_session_manager
+import numpy as np
+from services.similarity_utils import combined_score_from_texts, score_candidates_async
 from core.exceptions.logic_exceptions import (
     MenuNotFoundException,
     OrderParsingException
@@ -16,6 +17,15 @@ logger = logging.getLogger(__name__)
 # 세션 검증 및 반환
 def validate_session(session_id: str, required_step: str = None) -> Dict[str, Any]:
     session = redis_session_manager.get_session(session_id)
+    return _check_session(session_id, session, required_step)
+
+# 세션 검증 및 반환 (비동기)
+async def validate_session_async(session_id: str, required_step: str = None) -> Dict[str, Any]:
+    session = await async_session_manager.get_session(session_id)
+    return _check_session(session_id, session, required_step)
+
+# 조회한 세션의 존재 여부와 단계 확인
+def _check_session(session_id: str, session: Dict[str, Any] | None, required_step: str = None) -> Dict[str, Any]:
     if not session:
         raise SessionNotFoundException(session_id)
 
@@ -36,31 +46,60 @@ def calculate_totals(orders: List[Dict[str, Any]]) -> Tuple[int, int]:
     total_price = sum(order["price"] * order["quantity"] for order in orders)
     return total_items, total_price
 
-# 세션 주문 정보 업데이트
-def update_session_orders(session_id: str, orders: List[Dict[str, Any]], step: str = "packaging") -> bool:
+# 세션에 저장할 주문 정보
+def _session_orders_data(orders: List[Dict[str, Any]]) -> Dict[str, Any]:
     total_items, _ = calculate_totals(orders)
+    return {
+        "orders": orders,
+        "total_items": total_items,
+        "menu_item": None,
+        "quantity": None
+    }
 
-    return redis_session_manager.update_session(
-        session_id,
-        step,
-        {
-            "orders": orders,
-            "total_items": total_items,
-            "menu_item": None,
-            "quantity": None
-        }
-    )
+# 세션 주문 정보 업데이트 (갱신된 세션 반환, 실패 시 None)
+def update_session_orders(session_id: str, orders: List[Dict[str, Any]], step: str = "packaging") -> Optional[Dict[str, Any]]:
+    return redis_session_manager.update_session(session_id, step, _session_orders_data(orders))
+
+# 세션 주문 정보 업데이트 (비동기)
+async def update_session_orders_async(session_id: str, orders: List[Dict[str, Any]], step: str = "packaging") -> Optional[Dict[str, Any]]:
+    return await async_session_manager.update_session(session_id, step, _session_orders_data(orders))
 
 # 메뉴 검증 및 주문 항목 생성
-def validate_and_create_order_item(menu_item: str, quantity: int, search_menu_func) -> Dict[str, Any]:
+async def validate_and_create_order_item(menu_item: str, quantity: int, search_menu_func) -> Dict[str, Any]:
     if quantity < 0:
         raise OrderParsingException(f"'{menu_item}' 수량은 1개 이상이어야 합니다.")
 
     try:
-        menu_info = search_menu_func(menu_item)
+        menu_info = await search_menu_func(menu_item)
     except MenuNotFoundException:
         raise MenuNotFoundException(f"'{menu_item}' 메뉴를 찾을 수 없습니다.")
 
+    return _build_order_item(menu_item, quantity, menu_info)
+
+# 여러 주문 항목을 한 번에 검증/생성 (메뉴 검색은 search_menus_func 한 번)
+# 결과는 입력 순서대로 주문 항목 또는 예외 (validate_and_create_order_item 을 항목마다 부른 것과 같은 결과)
+async def validate_and_create_order_items(items: Sequence[Tuple[str, int]], search_menus_func) -> List[Any]:
+    results: List[Any] = [None] * len(items)
+    to_search = []
+    for i, (menu_item, quantity) in enumerate(items):
+        if quantity < 0:
+            results[i] = OrderParsingException(f"'{menu_item}' 수량은 1개 이상이어야 합니다.")
+        else:
+            to_search.append(i)
+
+    menus = await search_menus_func([items[i][0] for i in to_search]) if to_search else []
+    for i, menu_info in zip(to_search, menus):
+        menu_item, quantity = items[i]
+        if isinstance(menu_info, MenuNotFoundException):
+            results[i] = MenuNotFoundException(f"'{menu_item}' 메뉴를 찾을 수 없습니다.")
+        elif isinstance(menu_info, Exception):
+            results[i] = menu_info
+        else:
+            results[i] = _build_order_item(menu_item, quantity, menu_info)
+    return results
+
+# 메뉴 검색 결과로 주문 항목 생성
+def _build_order_item(menu_item: str, quantity: int, menu_info: Dict[str, Any]) -> Dict[str, Any]:
     return {
         "menu_id": menu_info["menu_id"],
         "menu_item": menu_info["menu_item"],
@@ -171,4 +210,8 @@ def generate_update_message(changes: Dict) -> str:
 # 벡터 + fuzzy 유사도 점수 계산
 def calculate_similarity_score(input_text: str, target_text: str, threshold: float = 0.45) -> Tuple[float, float, float]:
     # threshold는 내부적으로 사용하지 않지만, 기존 호출부와의 호환을 위해 파라미터 유지
-    return combined_score_from_texts(input_text, target_text)
\ No newline at end of file
+    return combined_score_from_texts(input_text, target_text)
+
+# 입력 하나와 후보 여러 개의 벡터 + fuzzy 유사도 점수 일괄 계산 (final, vector, fuzzy 배열)
+async def calculate_similarity_scores(input_text: str, target_texts: Sequence[str]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    return await score_candidates_async(input_text, target_texts)
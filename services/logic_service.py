@@ -1,13 +1,18 @@
-from qdrant_client import QdrantClient
-from services.similarity_utils import encode_cached, warmup_embeddings
-from rapidfuzz import process as rf_process, fuzz as rf_fuzz
+from qdrant_client import QdrantClient, AsyncQdrantClient
+from services.similarity_utils import encode_batch_async, score_vectors
 import re
+import time
 import logging
-import inspect
+import threading
+import numpy as np
 from functools import lru_cache
-from typing import Tuple, List, Dict, Any, Optional
-from .redis_session_service import redis_session_manager
-from database.simple_db import simple_menu_db
+from typing import Tuple, List, Dict, Any, Optional, Sequence
+from .redis_session_service import async_session_manager
+from database.simple_db import async_menu_db
+from services.menu_index import menu_vector_index, use_memory_index
+from services.qdrant_menu_search import QdrantMenuSearch, trace_enabled
+from core.utils.keyword_automaton import KeywordAutomaton
+from core.utils.histogram import Histogram
 from core.exceptions.logic_exceptions import (
     MenuNotFoundException,
     OrderParsingException,
@@ -19,33 +24,31 @@ from core.exceptions.session_exceptions import (
     SessionUpdateFailedException
 )
 from .logic_order_utils import (
-    validate_session,
-    validate_and_create_order_item,
+    validate_session_async,
+    validate_and_create_order_items,
     validate_order_list,
-    update_session_orders,
+    update_session_orders_async,
     format_order_list,
     create_order_response,
-    calculate_similarity_score
+    calculate_similarity_scores
 )
 from config.config_cache import (
-    get_compiled_separators_pattern,
     get_compiled_unit_pattern,
     get_compiled_number_pattern,
-    get_temperature_keywords,
     get_korean_numbers,
-    get_units_list,
-    get_confirmation_keywords,
+    get_keyword_automaton,
     get_packaging_keywords,
     get_similarity_thresholds,
-    is_unit_required,
     get_default_temperature,
     get_menu_search_limit,
-    get_vector_score_threshold
+    get_vector_score_threshold,
+    get_order_grammar
 )
 
 logger = logging.getLogger(__name__)
 
 _client: Optional[QdrantClient] = None
+_async_client: Optional[AsyncQdrantClient] = None
 
 def get_qdrant_client() -> QdrantClient:
     global _client
@@ -53,121 +56,243 @@ def get_qdrant_client() -> QdrantClient:
         _client = QdrantClient(url="http://qdrant:6333")
     return _client
 
-try:
-    from qdrant_client.http.models import Filter, FieldCondition, MatchValue
-except ImportError:
-    from qdrant_client.models import Filter, FieldCondition, MatchValue
-
-# 메뉴 찾기
-def search_menu(menu_item: str) -> Dict[str, Any]:
-    try:
-        # 온도 감지 및 메뉴명 추출
-        cleaned_menu, user_temp, temp_detected = detect_temperature(menu_item)
-
-        query_vector = list(encode_cached(cleaned_menu))
-        client = get_qdrant_client()
-
-        # Qdrant 클라이언트 API 버전 호환성 체크
-        sig = inspect.signature(client.query_points)
-        filter_kw = "filter" if "filter" in sig.parameters else (
-            "query_filter" if "query_filter" in sig.parameters else None
+def get_async_qdrant_client() -> AsyncQdrantClient:
+    global _async_client
+    if _async_client is None:
+        _async_client = AsyncQdrantClient(url="http://qdrant:6333")
+    return _async_client
+
+_menu_search: Optional[QdrantMenuSearch] = None
+
+# Qdrant 메뉴 검색 어댑터 (필터 인자 확인/필터 객체 생성은 최초 1회)
+def get_qdrant_menu_search() -> QdrantMenuSearch:
+    global _menu_search
+    if _menu_search is None:
+        _menu_search = QdrantMenuSearch(get_async_qdrant_client(), collection_name="menu")
+    return _menu_search
+
+# 메뉴 검색 단계(exact → jamo → vector)별 시도/적중 수와 지연 분포
+class MenuSearchCascadeStats:
+    STAGES = ("exact", "jamo", "vector")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._attempts = {stage: 0 for stage in self.STAGES}
+        self._hits = {stage: 0 for stage in self.STAGES}
+        self._latency_ms = {stage: Histogram([0.05, 0.1, 0.5, 1, 5, 10, 50, 100, 500]) for stage in self.STAGES}
+
+    def start(self):
+        with self._lock:
+            self._requests += 1
+
+    def record(self, stage: str, hit: bool, started: float):
+        self._latency_ms[stage].observe((time.perf_counter() - started) * 1000)
+        with self._lock:
+            self._attempts[stage] += 1
+            if hit:
+                self._hits[stage] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            requests = self._requests
+            attempts = dict(self._attempts)
+            hits = dict(self._hits)
+        lexical_hits = hits["exact"] + hits["jamo"]
+        return {
+            "requests": requests,
+            # 인코더/벡터 검색까지 가지 않고 끝난 비율
+            "encoder_avoided_rate": round(lexical_hits / requests, 4) if requests else 0.0,
+            "stages": {
+                stage: {
+                    "attempts": attempts[stage],
+                    "hits": hits[stage],
+                    "hit_rate": round(hits[stage] / attempts[stage], 4) if attempts[stage] else 0.0,
+                    "latency_ms": self._latency_ms[stage].snapshot(),
+                }
+                for stage in self.STAGES
+            },
+        }
+
+menu_search_cascade_stats = MenuSearchCascadeStats()
+
+# 1단계: 정확 일치 사전 (대소문자/띄어쓰기 무시)
+def _match_menu_exact(cleaned_menu: str, temp: Optional[str]) -> Optional[List[Tuple]]:
+    payload = menu_vector_index.exact_match(cleaned_menu, temp)
+    if payload is None:
+        return None
+    return [(payload["menu_id"], payload["menu_item"], payload["price"], payload["popular"], payload["temp"],
+             1.0, 1.0, 1.0)]
+
+# 2단계: 자모 fuzzy 매칭 (STT 오인식 메뉴명). 확실할 때만 결과를 만들고 아니면 None → 벡터 검색
+def _match_menu_by_jamo(cleaned_menu: str, temp: Optional[str]) -> Optional[List[Tuple]]:
+    thresholds = get_similarity_thresholds()
+    matched = menu_vector_index.jamo_match(
+        cleaned_menu,
+        temp=temp,
+        score_cutoff=thresholds["jamo_match_threshold"],
+        margin=thresholds["jamo_match_margin"],
+    )
+    if matched is None:
+        return None
+    payload, score = matched
+    logger.info(f"'{cleaned_menu}' 자모 매칭: ID:{payload['menu_id']} {payload['menu_item']}[{payload['temp']}] ({score:.3f})")
+    return [(payload["menu_id"], payload["menu_item"], payload["price"], payload["popular"], payload["temp"],
+             score, 0.0, score)]
+
+# 3단계: 벡터 검색 + 재정렬 (어휘 단계에서 확신하지 못한 항목만)
+# 질의 전체를 인코딩 한 번 + 검색 한 번(메모리 행렬 곱 / Qdrant query_batch_points)으로 처리
+# 항목별 결과: 재정렬 결과 목록, 후보 없음(None), 또는 재정렬 중 발생한 예외
+async def _search_menus_by_vector(queries: List[Tuple[str, str, bool]]) -> List[Any]:
+    query_vectors = await encode_batch_async([cleaned_menu for cleaned_menu, _, _ in queries])
+
+    # 온도 우선순위: 사용자지정 > DB온도 > 기본값
+    # 사용자가 온도를 명시한 경우 해당 온도로만, 아니면 필터 없이 모든 메뉴 검색 (DB 온도 우선)
+    temps = [user_temp if temp_detected else None for _, user_temp, temp_detected in queries]
+
+    if use_memory_index() and menu_vector_index.ready:
+        # 프로세스 내 메뉴 인덱스 조회 (네트워크 왕복 없음)
+        hits = menu_vector_index.search_batch(
+            query_vectors,
+            limit=get_menu_search_limit(),
+            score_threshold=get_vector_score_threshold(),
+            temps=temps,
+        )
+        payload_lists = [[payload for payload, _ in item_hits] for item_hits in hits]
+    else:
+        payload_lists = await get_qdrant_menu_search().query_batch(
+            query_vectors,
+            limit=get_menu_search_limit(),
+            score_threshold=get_vector_score_threshold(),
+            temps=temps,
         )
 
+    results: List[Any] = []
+    for (cleaned_menu, _, _), query_vector, payloads in zip(queries, query_vectors, payload_lists):
+        if not payloads:
+            results.append(None)
+            continue
         try:
-            from qdrant_client.http.models import Filter, FieldCondition, MatchValue
-        except ImportError:
-            from qdrant_client.models import Filter, FieldCondition, MatchValue
-
-        # 공통 쿼리 함수 (temp 필터는 옵션)
-        def run_query(temp_filter: str | None):
-            flt = None
-            if temp_filter is not None:
-                flt = Filter(must=[FieldCondition(key="temp", match=MatchValue(value=temp_filter))])
-
-            # 동적으로 결정된 filter_kw 사용
-            kwargs = {
-                "collection_name": "menu",
-                "query": query_vector,
-                "limit": get_menu_search_limit(),
-                "score_threshold": get_vector_score_threshold(),
-                "with_payload": True,
-                "with_vectors": False,
-            }
-            
-            if flt is not None and filter_kw is not None:
-                kwargs[filter_kw] = flt # type: ignore
-            
-            return client.query_points(**kwargs)
-
-        # 온도 우선순위: 사용자지정 > DB온도 > 기본값
-        if temp_detected:
-            # 사용자가 온도를 명시한 경우: 해당 온도로만 검색
-            tried = [user_temp]
-        else:
-            # 사용자가 온도를 명시하지 않은 경우: 모든 온도로 검색 (DB 온도 우선)
-            tried = [None]  # 필터 없이 모든 메뉴 검색
-        
-        enhanced_results = None
-
-        for temp_try in tried:
-            results = run_query(temp_try)
-            if not results or not getattr(results, "points", None):
-                continue
-
-            enhanced = _process_menu_results(results, cleaned_menu)
-            if enhanced:
-                enhanced_results = enhanced
-                break
-
-        if not enhanced_results:
-            raise MenuNotFoundException(menu_item)
-
-        top = enhanced_results[0]
-
-        thresholds = get_similarity_thresholds()
+            results.append(await _process_menu_results(payloads, cleaned_menu, query_vector) or None)
+        except Exception as e:
+            results.append(e)
+    return results
+
+# 검색 중 예외를 항목별 MenuNotFoundException 으로 변환
+def _search_error(menu_item: str, error: Exception) -> MenuNotFoundException:
+    if isinstance(error, MenuNotFoundException):
+        return error
+    if isinstance(error, ConnectionError):
+        logger.error(f"벡터 DB 연결 실패: {error}")
+        return MenuNotFoundException(f"{menu_item} (검색 서비스 오류)")
+    logger.error(f"메뉴 검색 중 예상치 못한 오류: {error}")
+    return MenuNotFoundException(f"{menu_item} (검색 오류)")
+
+# 여러 메뉴명을 한 번에 검색
+# 어휘 단계는 항목별, 벡터 단계는 인코딩/검색 한 번, 가격 조회 한 번 (with_profiles 면 profile 조회도 한 번)
+# 결과는 입력 순서대로 메뉴 dict 또는 MenuNotFoundException (search_menu 를 항목마다 부른 것과 같은 결과)
+async def search_menus(menu_items: Sequence[str], with_profiles: bool = False) -> List[Any]:
+    stats = menu_search_cascade_stats
+    results: List[Any] = [None] * len(menu_items)
+    queries: Dict[int, Tuple[str, str, bool]] = {}
+    enhanced: Dict[int, List[Tuple]] = {}
+
+    # 단계별 검색: 정확 일치 → 자모 fuzzy → 벡터 (메모리 인덱스가 없으면 바로 벡터)
+    lexical_ready = use_memory_index() and menu_vector_index.ready
+    for i, menu_item in enumerate(menu_items):
+        try:
+            # 온도 감지 및 메뉴명 추출
+            cleaned_menu, user_temp, temp_detected = detect_temperature(menu_item)
+            stats.start()
+            queries[i] = (cleaned_menu, user_temp, temp_detected)
+
+            if lexical_ready:
+                temp = user_temp if temp_detected else None
+                for stage, match in (("exact", _match_menu_exact), ("jamo", _match_menu_by_jamo)):
+                    started = time.perf_counter()
+                    found = match(cleaned_menu, temp)
+                    stats.record(stage, found is not None, started)
+                    if found is not None:
+                        enhanced[i] = found
+                        break
+        except Exception as e:
+            results[i] = _search_error(menu_item, e)
 
-        if top[5] >= thresholds["menu_similarity_threshold"]:
-            final_temp = user_temp if temp_detected else top[4]
+    pending = [i for i in queries if i not in enhanced and results[i] is None]
+    if pending:
+        started = time.perf_counter()
+        try:
+            vector_results = await _search_menus_by_vector([queries[i] for i in pending])
+        except Exception as e:
+            vector_results = [e] * len(pending)
+        for i, found in zip(pending, vector_results):
+            stats.record("vector", bool(found) and not isinstance(found, Exception), started)
+            if isinstance(found, Exception):
+                results[i] = _search_error(menu_items[i], found)
+            elif found:
+                enhanced[i] = found
 
-            menu_id = top[0]
+    thresholds = get_similarity_thresholds()
+    tops: Dict[int, Tuple] = {}
+    for i in queries:
+        if results[i] is not None:
+            continue
+        found = enhanced.get(i)
+        if not found or found[0][5] < thresholds["menu_similarity_threshold"]:
+            results[i] = MenuNotFoundException(menu_items[i])
+        else:
+            tops[i] = found[0]
 
+    if tops:
+        menu_ids = list(dict.fromkeys(top[0] for top in tops.values()))
+        try:
+            mysql_prices = await async_menu_db.get_multiple_menu_prices(menu_ids)
+        except Exception as e:
+            logger.warning(f"MySQL 가격 조회 중 예외 발생: {e}. Qdrant 백업 사용.")
+            mysql_prices = {}
+        profiles = {}
+        if with_profiles:
             try:
-                mysql_price = simple_menu_db.get_menu_price(menu_id)
-                if mysql_price is None:
-                    logger.warning(f"MySQL에서 menu_id {menu_id}의 가격 없음. Qdrant 백업 사용.")
-                    mysql_price = top[2]
-                else:
-                    logger.info(f"MySQL 가격 조회 성공: menu_id {menu_id} = {mysql_price}원")
+                profiles = await async_menu_db.get_multiple_user_profiles(menu_ids)
             except Exception as e:
-                logger.error(f"MySQL 가격 조회 중 예외 발생: {e}. Qdrant 백업 사용.")
+                logger.warning(f"메뉴 프로필 조회 중 예외 발생: {e}. 프로필 없이 진행.")
+
+        for i, top in tops.items():
+            _, user_temp, temp_detected = queries[i]
+            menu_id = top[0]
+            mysql_price = mysql_prices.get(menu_id)
+            if mysql_price is None:
+                logger.warning(f"MySQL에서 menu_id {menu_id}의 가격 없음. Qdrant 백업 사용.")
                 mysql_price = top[2]
+            else:
+                logger.info(f"MySQL 가격 조회 성공: menu_id {menu_id} = {mysql_price}원")
 
-            return {
-                "menu_id": top[0],
+            menu = {
+                "menu_id": menu_id,
                 "menu_item": top[1],
                 "price": mysql_price,
                 "popular": top[3],
-                "temp": final_temp,
+                "temp": user_temp if temp_detected else top[4],
             }
+            if with_profiles:
+                menu["profile"] = profiles.get(menu_id)
+            results[i] = menu
 
-        else:
-            raise MenuNotFoundException(menu_item)
-
-    except MenuNotFoundException:
-        raise
-
-    except ConnectionError as e:
-        logger.error(f"벡터 DB 연결 실패: {e}")
-        raise MenuNotFoundException(f"{menu_item} (검색 서비스 오류)")
+    return results
 
-    except Exception as e:
-        logger.error(f"메뉴 검색 중 예상치 못한 오류: {e}")
-        raise MenuNotFoundException(f"{menu_item} (검색 오류)")
+# 메뉴 찾기
+async def search_menu(menu_item: str) -> Dict[str, Any]:
+    result = (await search_menus([menu_item]))[0]
+    if isinstance(result, Exception):
+        raise result
+    return result
 
 # 메뉴 검색 결과 처리
-def _process_menu_results(results, cleaned_menu: str) -> List[Tuple]:
-    logger.info(f"Qdrant 응답 타입: {type(results)}")
-    logger.info(f"Qdrant 응답 내용: {results}")
+# 후보가 모두 메모리 인덱스에 있으면 미리 계산된 특징으로 재정렬 (추가 인코딩 없음)
+async def _process_menu_results(payloads: List[Dict[str, Any]], cleaned_menu: str,
+                                query_vector: Optional[np.ndarray] = None) -> List[Tuple]:
+    if trace_enabled():
+        logger.debug(f"벡터 검색 응답 {len(payloads)}건: {payloads}")
 
     thresholds = get_similarity_thresholds()
     pop_bonus = thresholds["popular_bonus"]
@@ -177,8 +302,7 @@ def _process_menu_results(results, cleaned_menu: str) -> List[Tuple]:
     menu_names = []
     valid_results = []
 
-    for p in results.points:
-        payload = p.payload or {}
+    for payload in payloads:
         menu_id = payload.get("menu_id")
         menu_name = payload.get("menu_item")
         price = payload.get("price")
@@ -186,16 +310,24 @@ def _process_menu_results(results, cleaned_menu: str) -> List[Tuple]:
             menu_names.append(menu_name)
             valid_results.append((menu_id, menu_name, price, payload.get('popular', False), payload.get('temp', 'hot')))
 
-    # 배치 임베딩 예열
-    if menu_names:
-        warmup_embeddings([cleaned_menu] + menu_names)
+    features = None
+    if query_vector is not None and valid_results:
+        features = menu_vector_index.candidate_features([r[0] for r in valid_results])
 
-    # 유사도 계산
-    for menu_id, menu_name, price, popular, db_temp in valid_results:
-        final_score, vector_score, best_fuzzy = calculate_similarity_score(cleaned_menu, menu_name)
+    if features is not None:
+        # 행렬-벡터 곱 한 번 + 스코어러별 cdist 한 번
+        final_scores, vector_scores, fuzzy_scores = score_vectors(
+            query_vector, features.vectors, cleaned_menu, features.names_lower
+        )
+    else:
+        # 유사도 계산 (인코딩 한 번 + 행렬-벡터 곱 한 번)
+        final_scores, vector_scores, fuzzy_scores = await calculate_similarity_scores(cleaned_menu, menu_names)
+    for i, (menu_id, menu_name, price, popular, db_temp) in enumerate(valid_results):
+        final_score = float(final_scores[i])
         if popular:
             final_score += pop_bonus
-        enhanced_results.append((menu_id, menu_name, price, popular, db_temp, final_score, vector_score, best_fuzzy))
+        enhanced_results.append((menu_id, menu_name, price, popular, db_temp, final_score,
+                                 float(vector_scores[i]), float(fuzzy_scores[i])))
 
     enhanced_results.sort(key=lambda x: x[5], reverse=True)
 
@@ -228,17 +360,16 @@ def parse_quantity_from_text(text: str) -> int:
     return 0
 
 # 메뉴와 수량을 함께 처리하는 함수
-def process_order(session_id: str, order_text: str) -> Dict[str, Any]:
+async def process_order(session_id: str, order_text: str) -> Dict[str, Any]:
     try:
-        _ = validate_session(session_id, "started")
+        _ = await validate_session_async(session_id, "started")
 
         # 주문 분리
         individual_orders = split_multiple_orders(order_text)
         logger.info("주문 분리: %s", individual_orders)
 
-        process_multiple_orders(session_id, individual_orders)
-
-        updated_session = validate_session(session_id)
+        # 업데이트 결과로 갱신된 세션을 바로 받음 (다시 조회하지 않음)
+        updated_session = await process_multiple_orders(session_id, individual_orders)
         orders = updated_session["data"]["orders"]
 
         message = f"다음 주문이 접수되었습니다: {format_order_list(orders)}"
@@ -252,106 +383,43 @@ def process_order(session_id: str, order_text: str) -> Dict[str, Any]:
         logger.error(f"주문 처리 중 예상치 못한 오류: {e}")
         raise OrderParsingException("주문 처리 중 오류가 발생했습니다")
 
-# 온도 키워드 복원
-def _restore_temperature_keywords(orders: List[str], replacements: Dict[str, str]) -> List[str]:
-    restored_orders = []
-    for order in orders:
-        restored_order = order
-        for placeholder, original in replacements.items():
-            restored_order = restored_order.replace(placeholder, original)
-        restored_orders.append(restored_order)
-    return restored_orders
-
-# 개별 주문으로 분리
+# 개별 주문으로 분리 (컴파일된 주문 문법으로 한 번에 토큰화)
 def split_multiple_orders(order_text: str) -> List[str]:
-    cold_expressions, hot_expressions, temp_keywords_lower = get_temperature_keywords()
-
-    # 온도 키워드를 벡터 유사도로 보호
-    protected_text = order_text
-    words = order_text.split()
-    replacements = {}
-
-    thresholds = get_similarity_thresholds()
-    rapidfuzz_threshold = thresholds["rapidfuzz_threshold"]
-
-    for i, word in enumerate(words):
-        cand = rf_process.extractOne(word.lower(), temp_keywords_lower, scorer=rf_fuzz.ratio)  # type: ignore
-        if cand and cand[1] >= rapidfuzz_threshold:  # 임계치(0~100)
-            placeholder = f"__TEMP_{i}__"
-            protected_text = protected_text.replace(word, placeholder)
-            replacements[placeholder] = word
-
-    separator_pattern = get_compiled_separators_pattern()
-    orders = separator_pattern.split(protected_text)
-    orders = [order.strip() for order in orders if order.strip()]
-
+    orders = get_order_grammar().split(order_text)
     if len(orders) > 1:
-        return _restore_temperature_keywords(orders, replacements)
-
-    units = get_units_list()
-    korean_numbers = get_korean_numbers()
-
-    unit_pattern = '|'.join(re.escape(unit) for unit in units)
-    korean_nums = '|'.join(re.escape(num) for num in korean_numbers.keys())
-    quantity_pattern = rf'(\d+|{korean_nums})'
-
-    if is_unit_required():
-        full_pattern = rf'([가-힣\s__TEMP_\d+__]*?[가-힣]+[가-힣\s__TEMP_\d+__]*?)\s*{quantity_pattern}\s*({unit_pattern})?'
-    else:
-        full_pattern = rf'([가-힣\s__TEMP_\d+__]*?[가-힣]+[가-힣\s__TEMP_\d+__]*?)\s*{quantity_pattern}\s*({unit_pattern})?'
-
-    matches = re.findall(full_pattern, order_text)
-
-    if len(matches) > 1:
-        # 여러 개 매치되면 각각을 주문으로 재구성
-        parsed_orders = []
-        for match in matches:
-            if len(match) == 3:
-                menu, qty, unit = match
-                if unit:
-                    parsed_orders.append(f"{menu.strip()} {qty} {unit}")
-                else:
-                    parsed_orders.append(f"{menu.strip()} {qty}")
-            elif len(match) == 2:
-                menu, qty = match
-                parsed_orders.append(f"{menu.strip()} {qty}")
-
-        restored_orders = _restore_temperature_keywords(parsed_orders, replacements)
-
-        logger.info(f"패턴 기반 분리: '{order_text}' → {parsed_orders}")
-        return restored_orders
-
-    # 분리할 수 없으면 원본 반환
-    return [order_text.strip()]
+        logger.info(f"주문 분리: '{order_text}' → {orders}")
+    return orders
 
 # 다중 주문 처리
-def process_multiple_orders(session_id: str, orders: List[str]) -> None:
-    _ = validate_session(session_id)
+async def process_multiple_orders(session_id: str, orders: List[str]) -> Dict[str, Any]:
+    _ = await validate_session_async(session_id)
 
     successful_orders = []
     failed_orders = []
 
-    menu_texts = []
     order_data = []
 
     try:
         for order in orders:
             try:
                 menu_text, quantity = parse_single_order_simplified(order)
-                menu_texts.append(menu_text)
                 order_data.append((order, menu_text, quantity))
             except Exception as e:
                 # 기타 예외도 관대하게 처리
                 logger.warning(f"주문 '{order}' 처리 중 오류: {e}")
                 failed_orders.append(f"'{order}': 처리할 수 없습니다")
 
-        if menu_texts:
-            warmup_embeddings(menu_texts)
+        # 메뉴 검색은 전체 주문을 한 번에 (인코딩/검색/가격 조회 각 한 번)
+        validated_orders = await validate_and_create_order_items(
+            [(menu_text, quantity) for _, menu_text, quantity in order_data],
+            search_menus,
+        )
 
         # 개별 주문 처리
-        for order, menu_text, quantity in order_data:
+        for (order, _, _), validated_order in zip(order_data, validated_orders):
             try:
-                validated_order = validate_and_create_order_item(menu_text, quantity, search_menu)
+                if isinstance(validated_order, Exception):
+                    raise validated_order
 
                 # 중복 체크 후 추가 또는 합치기
                 existing = None
@@ -374,10 +442,11 @@ def process_multiple_orders(session_id: str, orders: List[str]) -> None:
                 failed_orders.append(f"'{order}': 처리할 수 없습니다")
 
         validate_order_list(successful_orders)
-        success = update_session_orders(session_id, successful_orders, "packaging")
+        updated_session = await update_session_orders_async(session_id, successful_orders, "packaging")
 
-        if not success:
+        if not updated_session:
             raise SessionUpdateFailedException(session_id, "포장 정보 업데이트")
+        return updated_session
 
     except Exception as e:
         logger.error(f"다중 주문 처리 실패: {e}")
@@ -417,17 +486,39 @@ def extract_menu_from_text(order_text: str, quantity: int) -> str:
 
     return text
 
-# 전체 주문 검증
-def validate_single_order_simplified(order: str) -> Dict[str, Any]:
+# 주문 텍스트 검증 및 메뉴/수량 파싱
+def _parse_order_simplified(order: str) -> Tuple[str, int]:
     if not order or not isinstance(order, str):
         raise OrderParsingException("주문 텍스트가 올바르지 않습니다")
 
     # 메뉴와 수량 파싱
-    menu_text, quantity = parse_single_order_simplified(order)
+    return parse_single_order_simplified(order)
+
+# 전체 주문 검증
+async def validate_single_order_simplified(order: str) -> Dict[str, Any]:
+    menu_text, quantity = _parse_order_simplified(order)
 
     # 메뉴 검색
-    menu = search_menu(menu_text)
+    menu = await search_menu(menu_text)
+    return _simplified_order_item(order, quantity, menu)
+
+# 여러 주문을 한 번에 검증 (메뉴 검색은 search_menus 한 번)
+# 결과는 입력 순서대로 주문 항목 또는 예외 (validate_single_order_simplified 를 항목마다 부른 것과 같은 결과)
+async def validate_orders_simplified(orders: Sequence[str]) -> List[Any]:
+    results: List[Any] = [None] * len(orders)
+    parsed: Dict[int, Tuple[str, int]] = {}
+    for i, order in enumerate(orders):
+        try:
+            parsed[i] = _parse_order_simplified(order)
+        except Exception as e:
+            results[i] = e
+
+    menus = await search_menus([menu_text for menu_text, _ in parsed.values()]) if parsed else []
+    for (i, (_, quantity)), menu in zip(parsed.items(), menus):
+        results[i] = menu if isinstance(menu, Exception) else _simplified_order_item(orders[i], quantity, menu)
+    return results
 
+def _simplified_order_item(order: str, quantity: int, menu: Dict[str, Any]) -> Dict[str, Any]:
     # 수량이 0이어도 허용, 음수는 0으로 보정
     if quantity < 0:
         quantity = 0
@@ -450,13 +541,13 @@ def search_packaging(packaging_text: str) -> str:
     else:
         raise PackagingNotFoundException(packaging_text)
 
-def process_packaging(session_id: str, packaging_type: str) -> str:
-    _ = validate_session(session_id, "packaging")
+async def process_packaging(session_id: str, packaging_type: str) -> str:
+    _ = await validate_session_async(session_id, "packaging")
 
     packaging = search_packaging(packaging_type)
 
     # Redis 세션 업데이트
-    success = redis_session_manager.update_session(
+    success = await async_session_manager.update_session(
         session_id,
         "packaging",
         {"packaging_type": packaging}
@@ -470,29 +561,16 @@ def process_packaging(session_id: str, packaging_type: str) -> str:
 # 확인 응답 분석 (긍정/부정 판단)
 @lru_cache(maxsize=64)
 def analyze_confirmation(text: str) -> bool:
-    text = text.strip().lower()
-
-    positive_words, negative_words = get_confirmation_keywords()
+    categories = KeywordAutomaton.categories_of(get_keyword_automaton().find(text.strip()))
 
-    # 부정 먼저 체크
-    for word in negative_words:
-        if word in text:
-            return False
-
-    # 긍정 체크
-    for word in positive_words:
-        if word in text:
-            return True
-
-    # 기본값은 True
-    return True
+    # 부정이 하나라도 있으면 False, 그 외(긍정 또는 키워드 없음)는 True
+    return "negative" not in categories
 
 # 벡터 + fuzzy 조합 온도 감지
 @lru_cache(maxsize=256)
 def detect_temperature(text: str) -> Tuple[str, str, bool]:
     logger.info(f"온도감지 입력: '{text}'")
 
-    cold_expressions, hot_expressions, _ = get_temperature_keywords()
     thresholds = get_similarity_thresholds()
 
     # config 로드
@@ -500,25 +578,23 @@ def detect_temperature(text: str) -> Tuple[str, str, bool]:
     high_confidence_threshold = thresholds["temperature_high_confidence"]
     default_temp = get_default_temperature()
 
-    # 단어 분리
     text_lower = text.lower()
-    all_expressions = cold_expressions + hot_expressions
 
-    # 각 단어를 온도 키워드와 비교
+    # 키워드 오토마톤으로 한 번에 찾고, 설정 순서가 가장 앞선 온도 키워드 선택
     best_temp = default_temp
     best_word = ""
     highest_score = 0.0
     temp_detected = False
 
-    for word in all_expressions:
-        if word in text_lower:
-            final_score = 1.0
-
-            if final_score > highest_score and final_score > threshold:
-                highest_score = final_score
-                best_word = word
-                best_temp = "ice" if word in cold_expressions else "hot"
-                temp_detected = True
+    automaton = get_keyword_automaton()
+    best_hit = automaton.best(automaton.find(text_lower), ("ice", "hot"))
+    if best_hit is not None:
+        final_score = 1.0
+        if final_score > threshold:
+            highest_score = final_score
+            best_word = best_hit.keyword
+            best_temp = "ice" if "ice" in best_hit.categories else "hot"
+            temp_detected = True
 
     # 감지된 단어 제거
     cleaned_text = text
@@ -530,9 +606,9 @@ def detect_temperature(text: str) -> Tuple[str, str, bool]:
     return cleaned_text, best_temp, temp_detected
 
 # 세션의 각 주문에 profile 정보 추가
-def add_profiles_to_orders(session_id: str) -> List[Dict[str, Any]]:
+async def add_profiles_to_orders(session_id: str) -> List[Dict[str, Any]]:
     try:
-        session = redis_session_manager.get_session(session_id)
+        session = await async_session_manager.get_session(session_id)
         if not session:
             raise SessionNotFoundException(session_id)
 
@@ -540,24 +616,16 @@ def add_profiles_to_orders(session_id: str) -> List[Dict[str, Any]]:
         if not orders:
             return []
 
-        # 각 order에 profile 추가
-        enhanced_orders = []
+        # 각 order에 profile 추가 (전체 menu_id 를 한 번에 조회)
+        menu_ids = list(dict.fromkeys(order["menu_id"] for order in orders if order.get("menu_id")))
+        profiles = await async_menu_db.get_multiple_user_profiles(menu_ids)
 
+        enhanced_orders = []
         for order in orders:
             # 기존 order 복사
             enhanced_order = order.copy()
-
             menu_id = order.get("menu_id")
-            if menu_id:
-                try:
-                    profile = simple_menu_db.get_user_profile(menu_id)
-                    enhanced_order["profile"] = profile
-                except Exception as e:
-                    logger.error(f"menu_id {menu_id} Profile 조회 오류: {e}")
-                    enhanced_order["profile"] = None
-            else:
-                enhanced_order["profile"] = None
-
+            enhanced_order["profile"] = profiles.get(menu_id) if menu_id else None
             enhanced_orders.append(enhanced_order)
 
         return enhanced_orders
@@ -2,10 +2,9 @@ import logging
 from typing import Dict, Any, List
 from .logic_service import (
     split_multiple_orders,
-    validate_single_order_simplified,
-    search_menu
+    validate_orders_simplified,
+    search_menus
 )
-from services.similarity_utils import warmup_embeddings
 from core.exceptions.logic_exceptions import (
     MenuNotFoundException,
     OrderParsingException
@@ -16,10 +15,10 @@ from core.exceptions.session_exceptions import (
     SessionUpdateFailedException
 )
 from .logic_order_utils import (
-    validate_session,
-    validate_and_create_order_item,
+    validate_session_async,
+    validate_and_create_order_items,
     validate_order_list,
-    update_session_orders,
+    update_session_orders_async,
     format_order_list,
     create_order_response,
     add_new_orders,
@@ -30,12 +29,12 @@ from .logic_order_utils import (
 logger = logging.getLogger(__name__)
 
 # 전체 주문 부분적 업데이트 함수
-def patch_orders(session_id: str, order_items: List[Dict[str, Any]]) -> Dict[str, Any]:
+async def patch_orders(session_id: str, order_items: List[Dict[str, Any]]) -> Dict[str, Any]:
     try:
         try:
-            session = validate_session(session_id, "packaging")
+            session = await validate_session_async(session_id, "packaging")
         except InvalidSessionStepException:
-            session = validate_session(session_id, "completed")
+            session = await validate_session_async(session_id, "completed")
 
         session_data = session.get("data", {})
 
@@ -45,18 +44,16 @@ def patch_orders(session_id: str, order_items: List[Dict[str, Any]]) -> Dict[str
         else:
             existing_orders = session_data.get("orders", [])
 
-        menu_names = [item["menu_item"] for item in order_items]
-        if menu_names:
-            warmup_embeddings(menu_names)
+        # 새로운 주문 목록 생성 및 검증 (메뉴 검색은 한 번에)
+        validated_items = await validate_and_create_order_items(
+            [(item["menu_item"], item["quantity"]) for item in order_items],
+            search_menus
+        )
 
-        # 새로운 주문 목록 생성 및 검증
         new_orders = []
-        for item in order_items:
-            order_item = validate_and_create_order_item(
-                item["menu_item"],
-                item["quantity"],
-                search_menu
-            )
+        for item, order_item in zip(order_items, validated_items):
+            if isinstance(order_item, Exception):
+                raise order_item
             order_item["temp"] = item["temp"]
             new_orders.append(order_item)
 
@@ -67,7 +64,7 @@ def patch_orders(session_id: str, order_items: List[Dict[str, Any]]) -> Dict[str
 
         # 변경사항이 있는 경우에만 업데이트
         if changes["has_changes"]:
-            success = update_session_orders(session_id, new_orders)
+            success = await update_session_orders_async(session_id, new_orders)
             if not success:
                 raise SessionUpdateFailedException(session_id, "주문 업데이트")
 
@@ -83,35 +80,25 @@ def patch_orders(session_id: str, order_items: List[Dict[str, Any]]) -> Dict[str
         raise OrderParsingException("주문 업데이트 중 오류가 발생했습니다")
 
 # 기존 주문에 새로운 메뉴 추가
-def add_additional_order(session_id: str, order_text: str) -> Dict[str, Any]:
+async def add_additional_order(session_id: str, order_text: str) -> Dict[str, Any]:
     try:
         # 세션 검증
-        session = validate_session(session_id, "packaging")
+        session = await validate_session_async(session_id, "packaging")
 
         # 새로운 주문 파싱
         individual_orders = split_multiple_orders(order_text)
 
-        menu_texts = []
-        for order in individual_orders:
-            try:
-                # 간단한 메뉴명 추출
-                words = order.strip().split()
-                if words:
-                    menu_texts.extend(words)
-            except:
-                continue
-
-        # 배치 임베딩 예열
-        if menu_texts:
-            warmup_embeddings(menu_texts)
+        # 메뉴 검색은 전체 주문을 한 번에 (인코딩/검색/가격 조회 각 한 번)
+        validated_orders = await validate_orders_simplified(individual_orders)
 
         new_orders = []
 
-        for order in individual_orders:
+        for order, validated_order in zip(individual_orders, validated_orders):
             try:
-                validated_order = validate_single_order_simplified(order)
+                if isinstance(validated_order, Exception):
+                    raise validated_order
                 new_orders.append(validated_order)
-            except MenuNotFoundException as e:
+            except MenuNotFoundException:
                 logger.warning(f"메뉴를 찾을 수 없음: {order}")
                 raise MenuNotFoundException(f"'{order}' 메뉴를 찾을 수 없습니다. 메뉴명을 다시 확인해주세요.")
 
@@ -120,7 +107,7 @@ def add_additional_order(session_id: str, order_text: str) -> Dict[str, Any]:
         updated_orders = add_new_orders(existing_orders, new_orders)
 
         # 세션 업데이트
-        success = update_session_orders(session_id, updated_orders)
+        success = await update_session_orders_async(session_id, updated_orders)
         if not success:
             raise SessionUpdateFailedException(session_id, "추가 주문 업데이트")
 
@@ -136,10 +123,10 @@ def add_additional_order(session_id: str, order_text: str) -> Dict[str, Any]:
         raise OrderParsingException("추가 주문 처리 중 오류가 발생했습니다")
 
 # 특정 메뉴를 주문에서 완전히 삭제
-def remove_order_item(session_id: str, menu_id: int) -> Dict[str, Any]:
+async def remove_order_item(session_id: str, menu_id: int) -> Dict[str, Any]:
     try:
         # 세션 검증
-        session = validate_session(session_id, "packaging")
+        session = await validate_session_async(session_id, "packaging")
 
         # 메뉴 제거
         orders = session["data"]["orders"]
@@ -157,7 +144,7 @@ def remove_order_item(session_id: str, menu_id: int) -> Dict[str, Any]:
         filtered_orders = [order for order in orders if order["menu_id"] != menu_id]
 
         # 세션 업데이트
-        success = update_session_orders(session_id, filtered_orders)
+        success = await update_session_orders_async(session_id, filtered_orders)
         if not success:
             raise SessionUpdateFailedException(session_id, "주문 항목 삭제")
 
@@ -173,10 +160,10 @@ def remove_order_item(session_id: str, menu_id: int) -> Dict[str, Any]:
         raise OrderParsingException("주문 항목 삭제 중 오류가 발생했습니다")
 
 # 전체 주문 삭제
-def clear_all_orders(session_id: str) -> Dict[str, Any]:
+async def clear_all_orders(session_id: str) -> Dict[str, Any]:
     try:
         # 세션 검증
-        session = validate_session(session_id, "packaging")
+        session = await validate_session_async(session_id, "packaging")
 
         # 현재 주문 확인
         orders = session["data"]["orders"]
@@ -185,7 +172,7 @@ def clear_all_orders(session_id: str) -> Dict[str, Any]:
 
         # 빈 주문 목록으로 업데이트
         empty_orders = []
-        success = update_session_orders(session_id, empty_orders)
+        success = await update_session_orders_async(session_id, empty_orders)
         if not success:
             raise SessionUpdateFailedException(session_id, "전체 주문 삭제")
 
@@ -0,0 +1,87 @@
+import os
+import json
+import uuid
+import asyncio
+import logging
+from contextlib import suppress
+from typing import Optional, Sequence
+import redis
+from database.simple_db import menu_catalog_cache
+from services.redis_session_service import redis_session_manager, async_session_manager
+
+logger = logging.getLogger(__name__)
+
+# 메뉴 카탈로그 캐시 무효화를 워커 간에 전파하는 Redis pub/sub 채널
+MENU_CATALOG_CHANNEL = os.getenv("MENU_CATALOG_CHANNEL", "menu_catalog:invalidate")
+MENU_CATALOG_PUBSUB_ENABLED = os.getenv("MENU_CATALOG_PUBSUB_ENABLED", "true").lower() not in ("0", "false", "no")
+
+# 자기 프로세스가 보낸 메시지는 구독에서 무시 (발행 전에 이미 로컬 캐시를 비움)
+_INSTANCE_ID = uuid.uuid4().hex
+
+# 로컬 카탈로그 캐시 무효화 + 다른 워커에 전파 (menu_ids 가 None 이면 전체)
+def invalidate_menu_catalog(menu_ids: Optional[Sequence[int]] = None):
+    menu_catalog_cache.invalidate(menu_ids)
+    if not MENU_CATALOG_PUBSUB_ENABLED:
+        return
+
+    message = json.dumps({
+        "origin": _INSTANCE_ID,
+        "menu_ids": list(menu_ids) if menu_ids is not None else None,
+    })
+    try:
+        redis_session_manager.redis_client.publish(MENU_CATALOG_CHANNEL, message)
+    except redis.RedisError as e:
+        logger.warning(f"메뉴 카탈로그 무효화 전파 실패 (다른 워커는 TTL 만료 후 반영): {e}")
+
+# 다른 워커가 바꾼 메뉴를 메모리 벡터 인덱스에 반영 (menu_ids 가 None 이면 전체 다시 적재)
+def _refresh_menu_index(menu_ids: Optional[Sequence[int]] = None):
+    from services.menu_index import menu_vector_index, use_memory_index
+    from services.logic_service import get_qdrant_client
+
+    if not use_memory_index():
+        return
+    try:
+        menu_vector_index.refresh_from_qdrant(get_qdrant_client(), menu_ids)
+    except Exception as e:
+        logger.warning(f"메뉴 벡터 인덱스 갱신 실패: {e}")
+
+async def _handle_message(data: str):
+    try:
+        message = json.loads(data)
+    except (TypeError, json.JSONDecodeError):
+        logger.warning(f"메뉴 카탈로그 무효화 메시지 형식 오류: {data!r}")
+        return
+    if message.get("origin") == _INSTANCE_ID:
+        return
+    menu_ids = message.get("menu_ids")
+    menu_catalog_cache.invalidate(menu_ids)
+    await asyncio.to_thread(_refresh_menu_index, menu_ids)
+    logger.info(f"메뉴 카탈로그 캐시 무효화 수신: {menu_ids if menu_ids is not None else '전체'}")
+
+# 무효화 채널 구독 (lifespan 백그라운드 작업). 연결이 끊기면 retry_seconds 후 재구독
+async def run_menu_catalog_subscriber(retry_seconds: float = 5.0):
+    if not MENU_CATALOG_PUBSUB_ENABLED:
+        return
+
+    subscribed_before = False
+    while True:
+        pubsub = async_session_manager.redis_client.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(MENU_CATALOG_CHANNEL)
+            if subscribed_before:
+                # 구독이 끊긴 동안 놓친 변경이 있을 수 있으므로 전체 무효화
+                menu_catalog_cache.invalidate()
+                await asyncio.to_thread(_refresh_menu_index)
+            subscribed_before = True
+
+            async for message in pubsub.listen():
+                if message.get("type") == "message":
+                    await _handle_message(message.get("data"))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"메뉴 카탈로그 무효화 구독 끊김 → {retry_seconds:g}s 후 재시도: {e}")
+        finally:
+            with suppress(Exception):
+                await pubsub.aclose()
+        await asyncio.sleep(retry_seconds)
@@ -0,0 +1,322 @@
+import os
+import time
+import logging
+import threading
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+import numpy as np
+from core.utils.jamo import JamoMatcher, to_jamo
+from services.similarity_utils import encode_batch, _normalize_rows
+
+logger = logging.getLogger(__name__)
+
+# 메뉴 검색 백엔드: memory(프로세스 내 인덱스, 기본) | qdrant(매 요청 Qdrant 조회)
+MENU_SEARCH_BACKEND = os.getenv("MENU_SEARCH_BACKEND", "memory").strip().lower()
+MENU_COLLECTION = os.getenv("MENU_COLLECTION", "menu")
+
+# Qdrant/owner 업서트 payload 키 차이(menu_id/menu_item vs id/name)를 하나로 맞춤
+def _normalize_payload(payload: Dict[str, Any], point_id: Any = None) -> Optional[Dict[str, Any]]:
+    menu_id = payload.get("menu_id", payload.get("id", point_id))
+    name = payload.get("menu_item") or payload.get("name")
+    price = payload.get("price")
+    if menu_id is None or not name or price is None:
+        return None
+    return {
+        "menu_id": int(menu_id),
+        "menu_item": name,
+        "price": price,
+        "popular": bool(payload.get("popular", False)),
+        "temp": payload.get("temp") or payload.get("temperature") or "hot",
+    }
+
+# 읽기 전용 스냅샷 (교체는 참조 한 번으로)
+# 메뉴별로 정규화 임베딩(matrix 행) + 소문자 이름 + 자모 분해 이름을 적재 시점에 미리 계산
+class _IndexSnapshot:
+    __slots__ = ("matrix", "payloads", "temps", "row_by_id", "names_lower", "names_jamo",
+                 "rows_by_name", "rows_by_key", "jamo")
+
+    def __init__(self, matrix: np.ndarray, payloads: List[Dict[str, Any]]):
+        self.matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+        self.payloads = payloads
+        self.temps = np.array([p["temp"] for p in payloads], dtype=object)
+        self.row_by_id = {p["menu_id"]: i for i, p in enumerate(payloads)}
+        self.names_lower = [p["menu_item"].lower() for p in payloads]
+        self.names_jamo = [to_jamo(p["menu_item"]) for p in payloads]
+        # 같은 이름(hot/ice)은 한 번만 비교하고 행 목록으로 펼침
+        self.rows_by_name: Dict[str, List[int]] = {}
+        for i, p in enumerate(payloads):
+            self.rows_by_name.setdefault(p["menu_item"], []).append(i)
+        self.jamo = JamoMatcher(list(self.rows_by_name))
+        # 정확 일치 사전: 소문자 + 공백 제거 이름 → 행 목록
+        self.rows_by_key: Dict[str, List[int]] = {}
+        for name, rows in self.rows_by_name.items():
+            self.rows_by_key.setdefault(_name_key(name), []).extend(rows)
+
+# 정확 일치 키 (대소문자/띄어쓰기 차이 무시)
+def _name_key(text: str) -> str:
+    return "".join((text or "").lower().split())
+
+# 재정렬용 후보 특징 (후보 순서대로)
+class MenuFeatures(NamedTuple):
+    vectors: np.ndarray
+    names_lower: List[str]
+    names_jamo: List[str]
+
+# 정규화된 메뉴 임베딩 + payload를 메모리에 두고 정확(brute-force) 코사인 검색
+class MenuVectorIndex:
+    def __init__(self):
+        self._snapshot: Optional[_IndexSnapshot] = None
+        self._write_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "source": None,
+            "loaded_at": None,
+            "load_ms": 0.0,
+            "searches": 0,
+            "total_search_us": 0.0,
+            "upserts": 0,
+        }
+
+    @property
+    def ready(self) -> bool:
+        snapshot = self._snapshot
+        return snapshot is not None and len(snapshot.payloads) > 0
+
+    def __len__(self) -> int:
+        snapshot = self._snapshot
+        return len(snapshot.payloads) if snapshot else 0
+
+    def _swap(self, matrix: np.ndarray, payloads: List[Dict[str, Any]], source: str, started: float):
+        self._snapshot = _IndexSnapshot(matrix, payloads)
+        with self._stats_lock:
+            self._stats["source"] = source
+            self._stats["loaded_at"] = time.time()
+            self._stats["load_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        logger.info(f"메뉴 벡터 인덱스 로드 완료({source}): {len(payloads)}개")
+
+    # Qdrant 컬렉션의 벡터와 payload를 그대로 가져옴
+    def load_from_qdrant(self, client, collection_name: str = MENU_COLLECTION) -> bool:
+        started = time.perf_counter()
+        points, _ = client.scroll(
+            collection_name=collection_name,
+            limit=10000,
+            with_payload=True,
+            with_vectors=True,
+        )
+        payloads: List[Dict[str, Any]] = []
+        vectors: List[Sequence[float]] = []
+        for point in points:
+            payload = _normalize_payload(point.payload or {}, getattr(point, "id", None))
+            if payload is None or point.vector is None:
+                continue
+            payloads.append(payload)
+            vectors.append(point.vector)
+        if not payloads:
+            return False
+        with self._write_lock:
+            self._swap(_normalize_rows(np.asarray(vectors, dtype=np.float32)), payloads, "qdrant", started)
+        return True
+
+    # MySQL 메뉴 테이블을 읽어 메뉴명을 한 번에 인코딩
+    def load_from_mysql(self) -> bool:
+        from database.simple_db import simple_menu_db
+
+        started = time.perf_counter()
+        with simple_menu_db.connection() as connection:
+            if connection is None:
+                return False
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT id, name, price, popular, temperature FROM menu WHERE is_active = 1"
+                )
+                rows = cursor.fetchall()
+
+        payloads = [
+            p for p in (
+                _normalize_payload({"menu_id": r[0], "menu_item": r[1], "price": r[2],
+                                    "popular": bool(r[3]), "temp": r[4]})
+                for r in rows
+            ) if p is not None
+        ]
+        if not payloads:
+            return False
+        matrix = encode_batch([p["menu_item"] for p in payloads])
+        with self._write_lock:
+            self._swap(matrix, payloads, "mysql", started)
+        return True
+
+    # Qdrant 우선, 실패하거나 비어 있으면 MySQL에서 로드
+    def load(self, qdrant_client=None) -> bool:
+        if qdrant_client is not None:
+            try:
+                if self.load_from_qdrant(qdrant_client):
+                    return True
+            except Exception as e:
+                logger.warning(f"Qdrant에서 메뉴 인덱스 로드 실패: {e}")
+        try:
+            return self.load_from_mysql()
+        except Exception as e:
+            logger.error(f"MySQL에서 메뉴 인덱스 로드 실패: {e}")
+            return False
+
+    # 다른 워커가 바꾼 메뉴를 Qdrant 에서 다시 읽어 반영 (menu_ids 가 None 이면 전체 다시 적재)
+    # 인덱스를 못 만든 워커는 계속 Qdrant 검색을 쓰도록 아무것도 하지 않음
+    def refresh_from_qdrant(self, client, menu_ids: Optional[Sequence[int]] = None,
+                            collection_name: str = MENU_COLLECTION) -> bool:
+        if self._snapshot is None:
+            return False
+        if menu_ids is None:
+            return self.load_from_qdrant(client, collection_name)
+        points = client.retrieve(
+            collection_name=collection_name,
+            ids=list(menu_ids),
+            with_payload=True,
+            with_vectors=True,
+        )
+        for point in points:
+            payload = _normalize_payload(point.payload or {}, getattr(point, "id", None))
+            if payload is None or point.vector is None:
+                continue
+            self.upsert(menu_id=payload["menu_id"], name=payload["menu_item"], price=payload["price"],
+                        popular=payload["popular"], temp=payload["temp"], vector=point.vector)
+        return True
+
+    # 점주 메뉴 추가/수정 시 한 건만 반영
+    # 시작 시 적재에 실패한 인덱스는 비워 둠 (한 건짜리 인덱스가 ready 가 되어 Qdrant 검색을 대신하지 않도록)
+    def upsert(self, *, menu_id: int, name: str, price: int, popular: bool, temp: str,
+               vector: Optional[Sequence[float]] = None):
+        payload = _normalize_payload({"menu_id": menu_id, "menu_item": name, "price": price,
+                                      "popular": popular, "temp": temp})
+        if payload is None or self._snapshot is None:
+            return
+        vec = encode_batch([name])[0] if vector is None else _normalize_rows(np.asarray([vector]))[0]
+
+        with self._write_lock:
+            started = time.perf_counter()
+            snapshot = self._snapshot
+            if snapshot is None:
+                return
+            matrix = snapshot.matrix.copy()
+            payloads = list(snapshot.payloads)
+            row = snapshot.row_by_id.get(payload["menu_id"])
+            if row is None:
+                matrix = np.vstack([matrix, vec[None, :]])
+                payloads.append(payload)
+            else:
+                matrix[row] = vec
+                payloads[row] = payload
+            self._snapshot = _IndexSnapshot(matrix, payloads)
+        with self._stats_lock:
+            self._stats["upserts"] += 1
+        logger.info(f"메뉴 벡터 인덱스 반영: {menu_id} {name}[{temp}] ({(time.perf_counter() - started) * 1000:.2f}ms)")
+
+    # 질의 벡터와 전체 메뉴의 코사인 점수 (행렬-벡터 곱 한 번), temp 필터/임계값/상위 N개 적용
+    def search(
+        self,
+        query_vector: np.ndarray,
+        limit: int = 10,
+        score_threshold: Optional[float] = None,
+        temp: Optional[str] = None,
+    ) -> List[Tuple[Dict[str, Any], float]]:
+        return self.search_batch(np.asarray(query_vector, dtype=np.float32)[None, :], limit,
+                                 score_threshold, [temp])[0]
+
+    # 질의 여러 개를 행렬 곱 한 번으로 검색 (질의별 temp 필터)
+    def search_batch(
+        self,
+        query_vectors: np.ndarray,
+        limit: int = 10,
+        score_threshold: Optional[float] = None,
+        temps: Optional[Sequence[Optional[str]]] = None,
+    ) -> List[List[Tuple[Dict[str, Any], float]]]:
+        snapshot = self._snapshot
+        query_vectors = np.asarray(query_vectors, dtype=np.float32)
+        if snapshot is None:
+            return [[] for _ in range(len(query_vectors))]
+        started = time.perf_counter()
+        temps = list(temps) if temps is not None else [None] * len(query_vectors)
+
+        score_matrix = snapshot.matrix @ query_vectors.T
+        results = [
+            self._select(snapshot, score_matrix[:, column], limit, score_threshold, temp)
+            for column, temp in enumerate(temps)
+        ]
+
+        with self._stats_lock:
+            self._stats["searches"] += len(results)
+            self._stats["total_search_us"] += (time.perf_counter() - started) * 1e6
+        return results
+
+    # temp 필터/임계값 적용 후 상위 limit 개 (점수 내림차순)
+    @staticmethod
+    def _select(snapshot: _IndexSnapshot, scores: np.ndarray, limit: int, score_threshold: Optional[float],
+                temp: Optional[str]) -> List[Tuple[Dict[str, Any], float]]:
+        mask = np.ones(len(scores), dtype=bool)
+        if temp is not None:
+            mask &= snapshot.temps == temp
+        if score_threshold is not None:
+            mask &= scores >= score_threshold
+
+        candidates = np.flatnonzero(mask)
+        if len(candidates) > limit:
+            top = np.argpartition(-scores[candidates], limit - 1)[:limit]
+            candidates = candidates[top]
+        ordered = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [(snapshot.payloads[i], float(scores[i])) for i in ordered]
+
+    # 같은 이름의 행들 중 하나 선택: temp 가 있으면 해당 온도 행만, 없으면 인기 메뉴 → 먼저 적재된 행
+    @staticmethod
+    def _pick_row(snapshot: _IndexSnapshot, rows: List[int], temp: Optional[str]) -> Optional[Dict[str, Any]]:
+        if temp is not None:
+            rows = [row for row in rows if snapshot.payloads[row]["temp"] == temp]
+        if not rows:
+            return None
+        return snapshot.payloads[min(rows, key=lambda r: (not snapshot.payloads[r]["popular"], r))]
+
+    # 정확 일치 (대소문자/띄어쓰기 무시) 메뉴
+    def exact_match(self, text: str, temp: Optional[str]) -> Optional[Dict[str, Any]]:
+        snapshot = self._snapshot
+        if snapshot is None:
+            return None
+        rows = snapshot.rows_by_key.get(_name_key(text))
+        return self._pick_row(snapshot, rows, temp) if rows else None
+
+    # 자모 fuzzy 매칭 (벡터 검색 전), 점수는 0~1
+    def jamo_match(self, text: str, temp: Optional[str], score_cutoff: float,
+                   margin: float = 0.0) -> Optional[Tuple[Dict[str, Any], float]]:
+        snapshot = self._snapshot
+        if snapshot is None or not len(snapshot.jamo):
+            return None
+        best = snapshot.jamo.best(text, score_cutoff=score_cutoff, margin=margin)
+        if best is None:
+            return None
+        index, score = best
+        payload = self._pick_row(snapshot, snapshot.rows_by_name[snapshot.jamo.names[index]], temp)
+        return (payload, score / 100) if payload is not None else None
+
+    # 후보 메뉴들의 미리 계산된 특징 (하나라도 인덱스에 없으면 None → 호출부에서 인코딩)
+    def candidate_features(self, menu_ids: Sequence[int]) -> Optional[MenuFeatures]:
+        snapshot = self._snapshot
+        if snapshot is None:
+            return None
+        rows = [snapshot.row_by_id.get(int(menu_id)) for menu_id in menu_ids]
+        if any(row is None for row in rows):
+            return None
+        return MenuFeatures(
+            snapshot.matrix[rows],
+            [snapshot.names_lower[row] for row in rows],
+            [snapshot.names_jamo[row] for row in rows],
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            stats = dict(self._stats)
+        total_us = stats.pop("total_search_us")
+        stats["avg_search_us"] = round(total_us / stats["searches"], 2) if stats["searches"] else 0.0
+        stats["backend"] = MENU_SEARCH_BACKEND
+        stats["size"] = len(self)
+        return stats
+
+menu_vector_index = MenuVectorIndex()
+
+def use_memory_index() -> bool:
+    return MENU_SEARCH_BACKEND == "memory"
@@ -0,0 +1,156 @@
+import os
+import gc
+import time
+import logging
+import resource
+import threading
+from typing import Dict, Optional
+from sentence_transformers import SentenceTransformer
+
+logger = logging.getLogger(__name__)
+
+EMBED_MODEL = os.getenv("EMBED_MODEL", "jhgan/ko-sroberta-multitask")
+EMBED_DEVICE = os.getenv("EMBED_DEVICE") or None
+
+# 추론 백엔드: torch(기준) | onnx | onnx-int8 (ONNX 계열은 scripts.export_embedding_model 로 미리 내보내야 함)
+EMBED_BACKENDS = ("torch", "onnx", "onnx-int8")
+EMBED_BACKEND = os.getenv("EMBED_BACKEND", "torch").lower()
+EMBED_EXPORT_DIR = os.getenv("EMBED_EXPORT_DIR", os.path.join("artifacts", "embedding"))
+EMBED_QUANT_CONFIG = os.getenv("EMBED_QUANT_CONFIG", "avx512_vnni")
+
+# 로컬로 내보낸 모델 디렉터리 (모델명별)
+def export_dir_for(model_name: str) -> str:
+    return os.path.join(EMBED_EXPORT_DIR, model_name.replace("/", "__"))
+
+# 내보낸 디렉터리 안의 ONNX 파일 경로 (sentence-transformers 저장 규칙)
+def onnx_file_name(backend: str, quant_config: str = EMBED_QUANT_CONFIG) -> str:
+    if backend == "onnx":
+        return "onnx/model.onnx"
+    return f"onnx/model_qint8_{quant_config}.onnx"
+
+# 백엔드별 모델 생성. ONNX 계열은 로컬 내보내기 결과만 사용 (실행 중 변환하지 않음)
+def load_embedding_model(model_name: str, backend: str = "torch", device: Optional[str] = None) -> SentenceTransformer:
+    if backend not in EMBED_BACKENDS:
+        raise ValueError(f"지원하지 않는 임베딩 백엔드: {backend} (가능: {', '.join(EMBED_BACKENDS)})")
+    if backend == "torch":
+        return SentenceTransformer(model_name, device=device)
+
+    local_dir = export_dir_for(model_name)
+    file_name = onnx_file_name(backend)
+    if not os.path.exists(os.path.join(local_dir, file_name)):
+        raise FileNotFoundError(
+            f"{os.path.join(local_dir, file_name)} 없음 → python -m scripts.export_embedding_model 먼저 실행"
+        )
+    return SentenceTransformer(local_dir, device=device, backend="onnx", model_kwargs={"file_name": file_name})
+
+# 워커 fork 전에 마스터에서 모델을 올릴지 여부
+# (gunicorn --preload -k uvicorn.workers.UvicornWorker 로 띄우면 가중치 페이지를 워커들이 COW 로 공유)
+def preload_enabled() -> bool:
+    return os.getenv("EMBED_MODEL_PRELOAD", "true").lower() in ("1", "true", "yes")
+
+# 현재 프로세스 메모리 (MB). smaps_rollup 이 있으면 공유/전용 페이지도 구분
+def process_memory_mb() -> Dict[str, float]:
+    usage: Dict[str, float] = {}
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            for line in f:
+                key, _, rest = line.partition(":")
+                if key in ("Rss", "Pss", "Shared_Clean", "Shared_Dirty", "Private_Clean", "Private_Dirty"):
+                    usage[key] = int(rest.split()[0]) / 1024
+    except (OSError, ValueError, IndexError):
+        pass
+
+    if "Rss" not in usage:
+        # smaps_rollup 이 없는 환경: 최대 RSS 로 대체 (리눅스 KB 단위)
+        return {"rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)}
+
+    return {
+        "rss_mb": round(usage["Rss"], 1),
+        "pss_mb": round(usage.get("Pss", 0.0), 1),
+        "shared_mb": round(usage.get("Shared_Clean", 0.0) + usage.get("Shared_Dirty", 0.0), 1),
+        "private_mb": round(usage.get("Private_Clean", 0.0) + usage.get("Private_Dirty", 0.0), 1),
+    }
+
+# 프로세스당 임베딩 모델 한 개만 적재해 모든 사용처(API, 스크립트, 벡터 클라이언트)가 공유
+class ModelRegistry:
+    def __init__(self, model_name: str = EMBED_MODEL, backend: str = EMBED_BACKEND,
+                 device: Optional[str] = EMBED_DEVICE):
+        self.model_name = model_name
+        self.backend = backend
+        self.active_backend: Optional[str] = None
+        self.device = device
+        self._model: Optional[SentenceTransformer] = None
+        self._lock = threading.Lock()
+        self._load_seconds: Optional[float] = None
+        self._loaded_pid: Optional[int] = None
+        self._rss_before_mb: Optional[float] = None
+        self._rss_after_mb: Optional[float] = None
+
+    def is_loaded(self) -> bool:
+        return self._model is not None
+
+    # 임베딩 캐시 키에 쓰는 모델 식별자 (대체 적재까지 반영하도록 적재 후 계산)
+    def model_key(self) -> str:
+        self.get()
+        return f"{self.model_name}@{self.active_backend}"
+
+    def get(self) -> SentenceTransformer:
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    self._load()
+        return self._model
+
+    def _load(self):
+        self._rss_before_mb = process_memory_mb()["rss_mb"]
+        started = time.perf_counter()
+        try:
+            model = load_embedding_model(self.model_name, self.backend, self.device)
+            self.active_backend = self.backend
+        except (FileNotFoundError, ImportError, ValueError) as e:
+            if self.backend == "torch":
+                raise
+            # ONNX 준비가 안 된 환경에서도 서비스는 떠야 하므로 기준(torch) 백엔드로 대체
+            logger.error(f"임베딩 백엔드 {self.backend} 적재 실패 → torch 사용: {e}")
+            model = load_embedding_model(self.model_name, "torch", self.device)
+            self.active_backend = "torch"
+        self._load_seconds = time.perf_counter() - started
+        self._loaded_pid = os.getpid()
+        self._rss_after_mb = process_memory_mb()["rss_mb"]
+        self._model = model
+        logger.info(
+            f"임베딩 모델 적재 완료: {self.model_name} [{self.active_backend}] (pid={self._loaded_pid}, "
+            f"{self._load_seconds:.2f}s, RSS {self._rss_before_mb:.0f}→{self._rss_after_mb:.0f}MB)"
+        )
+
+    # fork 전 적재: 모델을 올린 뒤 현재 객체들을 GC 추적 대상에서 빼서
+    # 워커에서 GC 가 객체 헤더를 건드려 공유 페이지가 복사되는 것을 줄임
+    def preload(self) -> SentenceTransformer:
+        model = self.get()
+        gc.collect()
+        gc.freeze()
+        return model
+
+    # 워커별 지표: 적재가 부모 프로세스에서 일어났다면 shared_from_parent=True
+    def stats(self) -> Dict:
+        pid = os.getpid()
+        return {
+            "model": self.model_name,
+            "backend": self.active_backend or self.backend,
+            "loaded": self.is_loaded(),
+            "pid": pid,
+            "loaded_pid": self._loaded_pid,
+            "shared_from_parent": self._loaded_pid is not None and self._loaded_pid != pid,
+            "load_seconds": round(self._load_seconds, 3) if self._load_seconds is not None else None,
+            "load_rss_delta_mb": (
+                round(self._rss_after_mb - self._rss_before_mb, 1)
+                if self._rss_after_mb is not None and self._rss_before_mb is not None else None
+            ),
+            "memory": process_memory_mb(),
+        }
+
+model_registry = ModelRegistry()
+
+# 공용 임베딩 모델 (최초 호출 시 한 번만 적재)
+def get_embedding_model() -> SentenceTransformer:
+    return model_registry.get()
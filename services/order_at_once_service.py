@@ -1,12 +1,67 @@
 import os
 import re
 import json
+import time
 import uuid
+import asyncio
+import hashlib
+import threading
+from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
-from fuzzywuzzy import fuzz, process
+from rapidfuzz import process as rf_process, fuzz as rf_fuzz
+from rapidfuzz.utils import default_process
 from qdrant_client import QdrantClient
 from config.naver_stt_settings import logger
-from services.redis_session_service import session_manager
+from services.redis_session_service import async_session_manager
+from services.packaging_classifier import get_packaging_classifier
+from config.config_cache import get_keyword_automaton, get_menu_text_normalizer
+from core.utils.keyword_automaton import KeywordAutomaton, KeywordHit
+from core.utils.jamo import JamoMatcher
+
+# _normalize_text_for_menu 에서 제거하는 수량 표현
+_QUANTITY_UNIT_PATTERNS = (r"(\d+)\s*(개|잔)",)
+
+# 메뉴 조회용 인덱스 스냅샷: 이름→항목, 이름 목록, 전처리된 fuzzy 후보, (이름, 온도)→menu_id
+class MenuLookupIndex:
+    def __init__(self, entries: List[Dict[str, Any]]):
+        self.entries = entries
+        self.by_name: Dict[str, Dict[str, Any]] = {e["name"]: e for e in entries}
+        self.names: List[str] = [e["name"] for e in entries]
+        self.choices: List[str] = [default_process(name) for name in self.names]
+        self.jamo = JamoMatcher(self.names)
+        self.id_by_name_temp: Dict[Tuple[str, str], int] = {
+            (e["name"], temp): mid for e in entries for temp, mid in e["temp_to_id"].items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    # 요청 온도 → hot → ice → none 순서로 menu_id 선택
+    def resolve_id(self, name: str, temp: str) -> Optional[int]:
+        for candidate in (temp, "hot", "ice", "none"):
+            menu_id = self.id_by_name_temp.get((name, candidate))
+            if menu_id is not None:
+                return menu_id
+        return None
+
+    # 전처리된 후보에 대해 rapidfuzz ratio 최고점 항목 (score_cutoff 미만이면 None)
+    def best_match(self, text: str, score_cutoff: float) -> Optional[Tuple[Dict[str, Any], float]]:
+        query = default_process(text)
+        if not query or not self.choices:
+            return None
+        best = rf_process.extractOne(
+            query, self.choices, scorer=rf_fuzz.ratio, processor=None, score_cutoff=score_cutoff
+        )
+        if best is None:
+            return None
+        return self.entries[best[2]], best[1]
+
+    # 음절 ratio 로 못 찾은 STT 오인식 메뉴명을 자모 단위로 재시도 (애매하면 None)
+    def jamo_match(self, text: str, score_cutoff: float, margin: float = 0.0) -> Optional[Tuple[Dict[str, Any], float]]:
+        best = self.jamo.best(text, score_cutoff=score_cutoff, margin=margin)
+        if best is None:
+            return None
+        return self.entries[best[0]], best[1]
 
 class OrderAtOnceService:
     def __init__(self):
@@ -19,10 +74,10 @@ class OrderAtOnceService:
             self.client = QdrantClient(host=host, port=port)
 
         self.menu_collection = os.getenv("MENU_COLLECTION", "menu")
-        self.packaging_collection = os.getenv("PACKAGING_COLLECTION", "packaging_options")
 
         self.fuzzy_threshold = int(os.getenv("FUZZY_THRESHOLD", "70"))
-        self.packaging_threshold = float(os.getenv("PACKAGING_THRESHOLD", "0.45"))
+        self.jamo_threshold = float(os.getenv("JAMO_FUZZY_THRESHOLD", "80"))
+        self.jamo_margin = float(os.getenv("JAMO_FUZZY_MARGIN", "3"))
 
         self.qdrant_score_threshold = float(os.getenv("QDRANT_SCORE_THRESHOLD", "0.2"))
         self.qdrant_limit = int(os.getenv("QDRANT_LIMIT", "10"))
@@ -37,12 +92,24 @@ class OrderAtOnceService:
         self._load_quantity_patterns()
         self._load_temperature_patterns_from_file()
 
-        self._menu_cache: List[Dict[str, Any]] = []
+        self.menu_refresh_interval = float(os.getenv("MENU_REFRESH_INTERVAL", "30"))
+
+        self._menu_index = MenuLookupIndex([])
+        self._menu_fingerprint: Optional[str] = None
+        self._refresh_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, Any] = {
+            "menu_lookups": 0,
+            "menu_hits": 0,
+            "menu_misses": 0,
+            "refresh_checks": 0,
+            "refreshes": 0,
+            "refresh_failures": 0,
+            "last_refresh_at": None,
+            "last_refresh_ms": 0.0,
+        }
         self._load_menu_cache()
 
-        self._embed_model = None
-        self._embedding_model_name = os.getenv("EMBEDDING_MODEL", "jhgan/ko-sroberta-multitask")
-
         logger.info("OrderAtOnceService 초기화 완료")
 
     def _load_quantity_patterns(self):
@@ -69,6 +136,7 @@ class OrderAtOnceService:
             self.korean_numbers = {"한": 1, "두": 2, "세": 3}
             self.default_quantity = 1
 
+    # 온도 키워드는 config_cache 키워드 오토마톤에서 공유, 여기서는 기본 온도만 사용
     def _load_temperature_patterns_from_file(self):
         cfg_path = os.path.join(
             os.path.dirname(os.path.dirname(__file__)),
@@ -79,23 +147,13 @@ class OrderAtOnceService:
             if os.path.exists(cfg_path):
                 with open(cfg_path, "r", encoding="utf-8") as f:
                     cfg = json.load(f)
-
-                cold_exp = cfg.get("cold_expressions") or cfg.get("ice_keywords") or []
-                hot_exp = cfg.get("hot_expressions") or cfg.get("hot_keywords") or []
-
-                self.ice_keywords: List[str] = cold_exp or ["아이스", "차가운", "시원한", "냉", "콜드", "ice", "cold", "iced"]
-                self.hot_keywords: List[str] = hot_exp or ["뜨거운", "따뜻한", "핫", "온", "hot", "warm"]
                 self.default_temperature: str = cfg.get("default_temperature", "hot")
                 logger.info("temperature_patterns.json 로드 완료")
             else:
-                self.ice_keywords = ["아이스", "차가운", "시원한", "냉", "콜드", "ice", "cold", "iced"]
-                self.hot_keywords = ["뜨거운", "따뜻한", "핫", "온", "hot", "warm"]
                 self.default_temperature = "hot"
                 logger.warning("temperature_patterns.json 미존재 → 기본값 사용")
         except Exception as e:
             logger.error(f"온도 패턴 로드 오류: {e}")
-            self.ice_keywords = ["아이스", "차가운", "시원한"]
-            self.hot_keywords = ["뜨거운", "따뜻한", "핫"]
             self.default_temperature = "hot"
 
     def _normalize_temp(self, t: str) -> str:
@@ -108,13 +166,76 @@ class OrderAtOnceService:
             return "hot"
         return ""
 
-    def _load_menu_cache(self):
+    # 통계 카운터 증가
+    def _record(self, key: str, amount: int = 1):
+        with self._stats_lock:
+            self._stats[key] += amount
+
+    # 메뉴 캐시 조회 결과 기록
+    def _record_lookup(self, hit: bool):
+        with self._stats_lock:
+            self._stats["menu_lookups"] += 1
+            self._stats["menu_hits" if hit else "menu_misses"] += 1
+
+    # 메뉴 캐시 통계 반환
+    def get_cache_stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            stats = dict(self._stats)
+        lookups = stats["menu_lookups"]
+        stats["hit_rate"] = round(stats["menu_hits"] / lookups, 4) if lookups else 0.0
+        stats["menu_count"] = len(self._menu_index)
+        stats["fingerprint"] = self._menu_fingerprint
+        stats["menu_text_cache"] = get_menu_text_normalizer(tuple(self.quantity_patterns)).stats()
+        return stats
+
+    # 메뉴 컬렉션 전체 포인트 (payload 만, 벡터 제외)
+    def _fetch_menu_points(self) -> List[Any]:
+        points, _ = self.client.scroll(
+            collection_name=self.menu_collection,
+            limit=10000,
+            with_payload=True
+        )
+        return points
+
+    # 메뉴 변경 감지용 지문 (포인트 ID + payload 전체 해시 → 이름/가격/온도/인기 변경, 삭제 후 추가도 감지)
+    @staticmethod
+    def _menu_fingerprint_of(points: List[Any]) -> str:
+        items = sorted(
+            (str(getattr(point, "id", "")), point.payload or {}) for point in points
+        )
+        encoded = json.dumps(items, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+    # 메뉴가 바뀐 경우에만 새 스냅샷을 만들어 교체
+    def refresh_menu_cache(self, force: bool = False) -> bool:
+        with self._refresh_lock:
+            self._record("refresh_checks")
+            try:
+                points = self._fetch_menu_points()
+            except Exception as e:
+                logger.warning(f"메뉴 조회 실패: {e}")
+                self._record("refresh_failures")
+                return False
+            if not force and self._menu_fingerprint_of(points) == self._menu_fingerprint:
+                return False
+            return self._load_menu_cache(points)
+
+    # 주기적으로 메뉴 변경을 확인하는 백그라운드 루프 (lifespan에서 실행)
+    async def run_menu_refresher(self):
+        while True:
+            await asyncio.sleep(self.menu_refresh_interval)
+            try:
+                if await asyncio.to_thread(self.refresh_menu_cache):
+                    logger.info("메뉴 변경 감지 → 메뉴 캐시 교체 완료")
+            except Exception as e:
+                logger.warning(f"메뉴 캐시 갱신 실패: {e}")
+
+    def _load_menu_cache(self, points: Optional[List[Any]] = None) -> bool:
+        started = time.perf_counter()
         try:
-            points, _ = self.client.scroll(
-                collection_name=self.menu_collection,
-                limit=10000,
-                with_payload=True
-            )
+            if points is None:
+                points = self._fetch_menu_points()
+            fingerprint = self._menu_fingerprint_of(points)
             by_name: Dict[str, Dict[str, Any]] = {}
             for point in points:
                 payload = point.payload or {}
@@ -153,111 +274,64 @@ class OrderAtOnceService:
                     "available_temps": ats,
                     "temp_to_id": info["temp_to_id"],
                 })
-            self._menu_cache = menu_data
+            # 읽는 쪽은 항상 완성된 스냅샷만 보도록 참조를 한 번에 교체
+            self._menu_index = MenuLookupIndex(menu_data)
+            self._menu_fingerprint = fingerprint
+            with self._stats_lock:
+                self._stats["refreshes"] += 1
+                self._stats["last_refresh_at"] = datetime.now().isoformat()
+                self._stats["last_refresh_ms"] = round((time.perf_counter() - started) * 1000, 2)
             logger.info(f"메뉴 캐시 로드 완료(집계): {len(menu_data)}개 메뉴")
+            return True
         except Exception as e:
+            # 갱신 실패 시 기존 스냅샷 유지
             logger.warning(f"메뉴 캐시 로드 실패: {e}")
-            self._menu_cache = []
+            self._record("refresh_failures")
+            return False
 
     def resolve_menu_id(self, name: str, temp: str) -> Optional[int]:
         if not name:
             return None
-        want = (temp or "").lower()
-
-        for m in self._menu_cache:
-            if m["name"] == name:
-                tmap = m.get("temp_to_id", {}) or {}
-
-                # 1) 정확히 일치하는 온도 우선
-                if want in tmap:
-                    return tmap[want]
-
-                # 2) 기본 hot 우선
-                if "hot" in tmap:
-                    return tmap["hot"]
-
-                # 3) hot이 없고 ice만 있으면 ice
-                if "ice" in tmap:
-                    return tmap["ice"]
-
-                # 4) 디저트 등 none만 있는 경우
-                if "none" in tmap:
-                    return tmap["none"]
-
-                return None
-        return None
-
-    def _get_embed_model(self):
-        if self._embed_model is None:
-            from sentence_transformers import SentenceTransformer
-            self._embed_model = SentenceTransformer(self._embedding_model_name)
-            logger.info(f"Embed model ready: {self._embedding_model_name}")
-        return self._embed_model
+        menu_index = self._menu_index
+        if name not in menu_index.by_name:
+            self._record_lookup(False)
+            return None
+        self._record_lookup(True)
+        return menu_index.resolve_id(name, (temp or "").lower())
 
-    def _infer_packaging_via_vector(self, text: str) -> str:
+    async def _infer_packaging_via_vector(self, text: str) -> str:
         try:
-            model = self._get_embed_model()
-            qvec = model.encode([text])[0].tolist()
-
-            hits = self.client.search(
-                collection_name=self.packaging_collection,
-                query_vector=qvec,
-                limit=1,
-                with_payload=True
-            )
-            if not hits:
-                return ""
-            top = hits[0]
-            score = float(getattr(top, "score", 0.0) or 0.0)
-            ptype = (top.payload or {}).get("type", "")
-
-            if ptype and score >= self.packaging_threshold:
-                return ptype
-            return ""
+            ptype, score = await get_packaging_classifier().classify_async(text)
+            logger.debug(f"포장 판정(별칭 벡터): '{text}' → '{ptype}' ({score:.3f})")
+            return ptype
         except Exception as e:
             logger.warning(f"포장 판정 실패(벡터 검색): {e}")
             return ""
 
-    def _extract_packaging_keyword(self, text: str) -> str:
-        t = (text or "").lower()
+    # 키워드 오토마톤 매칭 (이미 훑은 결과가 있으면 재사용)
+    def _keyword_hits(self, text: str, hits: Optional[List[KeywordHit]] = None) -> List[KeywordHit]:
+        if hits is not None:
+            return hits
+        return get_keyword_automaton().find(text or "")
+
+    def _extract_packaging_keyword(self, text: str, hits: Optional[List[KeywordHit]] = None) -> str:
+        categories = KeywordAutomaton.categories_of(self._keyword_hits(text, hits))
         # 포장 계열
-        if any(k in t for k in
-               ["포장", "테이크아웃", "takeout", "take-out", "to go", "togo"]):
+        if "takeout" in categories:
             return "포장"
         # 매장 계열
-        if any(k in t for k in
-               ["매장", "먹고", "for here", "here", "dine-in", "dine in"]):
+        if "dine_in" in categories:
             return "매장식사"
         return ""
 
     def _detect_temperature_and_clean(self, user_text: str) -> Tuple[str, str]:
-        text_lower = user_text.lower()
-        if any(kw.lower() in text_lower for kw in self.ice_keywords):
-            temp = "ice"
-        elif any(kw.lower() in text_lower for kw in self.hot_keywords):
-            temp = "hot"
-        else:
-            temp = getattr(self, "default_temperature", "hot")
-        cleaned = self._normalize_text_for_menu(user_text)
+        hits = self._keyword_hits(user_text)
+        temp = self._extract_user_temperature(user_text, hits) or getattr(self, "default_temperature", "hot")
+        cleaned = self._normalize_text_for_menu(user_text, hits)
         return cleaned, temp
 
-    def _normalize_text_for_menu(self, s: str) -> str:
-        cleaned = s
-        try:
-            cleaned = re.sub(r"(\d+)\s*(개|잔)", " ", cleaned)
-        except re.error:
-            pass
-        for kw in self.ice_keywords + self.hot_keywords:
-            cleaned = re.sub(re.escape(kw), " ", cleaned, flags=re.IGNORECASE)
-        for kw in ["포장", "테이크아웃", "매장", "먹고", "가져가", "take out", "to go", "for here"]:
-            cleaned = re.sub(re.escape(kw), " ", cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r'[\"\'“”‘’`]', " ", cleaned)
-        cleaned = re.sub(r'[(){}\[\],.!?]', " ", cleaned)
-        common_words = ["해줘", "해주세요", "주세요", "좀", "요", "하나", "으로", "을", "를", "이", "가"]
-        for word in common_words:
-            cleaned = re.sub(re.escape(word), " ", cleaned, flags=re.IGNORECASE)
-        cleaned = " ".join(cleaned.split()).strip()
-        return cleaned
+    def _normalize_text_for_menu(self, s: str, hits: Optional[List[KeywordHit]] = None) -> str:
+        return get_menu_text_normalizer(_QUANTITY_UNIT_PATTERNS).normalize(s, hits)
 
     def _extract_quantity(self, text: str) -> int:
         for pattern in self.quantity_patterns:
@@ -288,25 +362,22 @@ class OrderAtOnceService:
             return "hot"
         return "hot"
 
-    def _extract_user_temperature(self, text: str) -> Optional[str]:
-        t = (text or "").lower()
-        try:
-            for kw in getattr(self, "ice_keywords", []):
-                if kw.lower() in t:
-                    return "ice"
-            for kw in getattr(self, "hot_keywords", []):
-                if kw.lower() in t:
-                    return "hot"
-        except Exception:
-            pass
+    def _extract_user_temperature(self, text: str, hits: Optional[List[KeywordHit]] = None) -> Optional[str]:
+        categories = KeywordAutomaton.categories_of(self._keyword_hits(text, hits))
+        if "ice" in categories:
+            return "ice"
+        if "hot" in categories:
+            return "hot"
         return None
 
-    async def _extract_menu_fuzzy(self, text: str, user_temp: Optional[str]) -> Dict[str, Any]:
+    async def _extract_menu_fuzzy(self, text: str, user_temp: Optional[str],
+                                  hits: Optional[List[KeywordHit]] = None) -> Dict[str, Any]:
         try:
-            cleaned_text = self._clean_text_for_menu_search(text)
+            cleaned_text = self._clean_text_for_menu_search(text, hits)
             quantity = self._extract_quantity(text)
 
-            if not cleaned_text or not self._menu_cache:
+            menu_index = self._menu_index
+            if not cleaned_text or not len(menu_index):
                 return {
                     "menu_id": None,
                     "name": "",
@@ -318,28 +389,25 @@ class OrderAtOnceService:
                     "method": "no_data"
                 }
 
-            menu_names = [menu["name"] for menu in self._menu_cache]
-            best = process.extractOne(cleaned_text, menu_names, scorer=fuzz.ratio)
-
-            if best and best[1] >= self.fuzzy_threshold:
-                matched = None
-                for m in self._menu_cache:
-                    if m["name"] == best[0]:
-                        matched = m
-                        break
-                if matched:
-                    available_temps = matched.get("available_temps", [])
-                    final_temp = self._determine_final_temp(user_temp, available_temps)
-                    menu_id = self.resolve_menu_id(matched["name"], final_temp)
-                    return {
-                        "menu_id": menu_id,
-                        "name": matched["name"],
-                        "quantity": quantity,
-                        "popular": matched.get("popular", "") if matched.get("popular") is not None else "",
-                        "temp": final_temp,
-                        "price": matched.get("price", 0),
-                    }
+            best = (
+                menu_index.best_match(cleaned_text, score_cutoff=self.fuzzy_threshold)
+                or menu_index.jamo_match(cleaned_text, score_cutoff=self.jamo_threshold, margin=self.jamo_margin)
+            )
+            if best is not None:
+                matched, _ = best
+                available_temps = matched.get("available_temps", [])
+                final_temp = self._determine_final_temp(user_temp, available_temps)
+                menu_id = self.resolve_menu_id(matched["name"], final_temp)
+                return {
+                    "menu_id": menu_id,
+                    "name": matched["name"],
+                    "quantity": quantity,
+                    "popular": matched.get("popular", "") if matched.get("popular") is not None else "",
+                    "temp": final_temp,
+                    "price": matched.get("price", 0),
+                }
 
+            self._record_lookup(False)
             return {
                 "menu_id": None,
                 "name": "",
@@ -350,7 +418,7 @@ class OrderAtOnceService:
                 "method": "no_match"
             }
         except Exception as e:
-            logger.error(f"fuzzywuzzy 메뉴 추출 오류: {e}")
+            logger.error(f"fuzzy 메뉴 추출 오류: {e}")
             return {
                 "menu_id": None,
                 "name": "",
@@ -363,29 +431,15 @@ class OrderAtOnceService:
                 "error": str(e)
             }
 
-    def _clean_text_for_menu_search(self, text: str) -> str:
-        cleaned = text
-        for pattern in self.quantity_patterns:
-            try:
-                cleaned = re.sub(pattern, " ", cleaned)
-            except re.error:
-                logger.warning(f"수량 패턴 무시(정규식 오류): {pattern}")
-        for keyword in self.ice_keywords + self.hot_keywords:
-            cleaned = re.sub(re.escape(keyword), " ", cleaned, flags=re.IGNORECASE)
-        for kw in ["포장", "테이크아웃", "매장", "먹고", "가져가", "take out", "to go", "for here"]:
-            cleaned = re.sub(re.escape(kw), " ", cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r'[\"\'“”‘’`]', " ", cleaned)
-        cleaned = re.sub(r'[(){}\[\],.!?]', " ", cleaned)
-        common_words = ["해줘", "해주세요", "주세요", "좀", "요", "하나", "으로", "을", "를", "이", "가"]
-        for word in common_words:
-            cleaned = re.sub(re.escape(word), " ", cleaned, flags=re.IGNORECASE)
-        cleaned = " ".join(cleaned.split()).strip()
+    def _clean_text_for_menu_search(self, text: str, hits: Optional[List[KeywordHit]] = None) -> str:
+        # 수량/온도/포장/문장부호/불용어를 한 번에 제거 (반복 발화는 캐시)
+        cleaned = get_menu_text_normalizer(tuple(self.quantity_patterns)).normalize(text, hits)
         logger.debug(f"[menu-clean] raw='{text}' -> cleaned='{cleaned}'")
         return cleaned
 
     async def process_order_text(self, text: str) -> Dict[str, Any]:
         try:
-            session_id = session_manager.create_session()
+            session_id = await async_session_manager.create_session()
             return await self.process_order_with_session(text, session_id)
         except Exception as e:
             logger.error(f"하위 호환성 처리 오류: {e}")
@@ -408,9 +462,11 @@ class OrderAtOnceService:
 
     async def process_order_with_session(self, text: str, session_id: str) -> Dict[str, Any]:
         try:
-            user_temp = self._extract_user_temperature(text)
-            menu_info = await self._extract_menu_fuzzy(text, user_temp)
-            packaging = self._extract_packaging_keyword(text) or self._infer_packaging_via_vector(text)
+            # 온도/포장/불용어 키워드는 한 번만 훑고 결과를 공유
+            hits = get_keyword_automaton().find(text)
+            user_temp = self._extract_user_temperature(text, hits)
+            menu_info = await self._extract_menu_fuzzy(text, user_temp, hits)
+            packaging = self._extract_packaging_keyword(text, hits) or await self._infer_packaging_via_vector(text)
 
             order_data = {
                 "menu": menu_info,
@@ -420,7 +476,7 @@ class OrderAtOnceService:
                 "step": "order_at_once_completed"
             }
 
-            session_manager.update_session(
+            await async_session_manager.update_session(
                 session_id=session_id,
                 step="completed",
                 data={
@@ -457,7 +513,7 @@ class OrderAtOnceService:
                 "method": "error"
             }
             try:
-                session_manager.update_session(
+                await async_session_manager.update_session(
                     session_id=session_id,
                     step="error",
                     data={
@@ -490,10 +546,22 @@ class OrderAtOnceService:
 
     async def get_order_by_session(self, session_id: str) -> Optional[Dict[str, Any]]:
         try:
-            session = session_manager.get_session(session_id)
+            session = await async_session_manager.get_session(session_id)
             if session and "order_at_once" in session.get("data", {}):
                 return session["data"]["order_at_once"]
             return None
         except Exception as e:
             logger.error(f"세션 조회 오류: {e}")
             return None
+
+# 프로세스 전역 OrderAtOnceService 인스턴스 (lifespan에서 생성)
+_order_at_once_service: Optional[OrderAtOnceService] = None
+_order_at_once_service_lock = threading.Lock()
+
+def get_order_at_once_service() -> OrderAtOnceService:
+    global _order_at_once_service
+    if _order_at_once_service is None:
+        with _order_at_once_service_lock:
+            if _order_at_once_service is None:
+                _order_at_once_service = OrderAtOnceService()
+    return _order_at_once_service
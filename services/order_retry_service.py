@@ -3,12 +3,12 @@ from fastapi import HTTPException
 from config.naver_stt_settings import logger
 
 from services.redis_session_service import session_manager
-from services.order_at_once_service import OrderAtOnceService
+from services.order_at_once_service import OrderAtOnceService, get_order_at_once_service
 
 class OrderRetryService:
 
     def __init__(self, base_service: Optional[OrderAtOnceService] = None):
-        self.base = base_service or OrderAtOnceService()
+        self.base = base_service or get_order_at_once_service()
 
     def _load_session_or_404(self, session_id: str) -> Dict[str, Any]:
         session = session_manager.get_session(session_id)
@@ -92,17 +92,16 @@ class OrderRetryService:
         }
         logger.info(f"[DEBUG] 업데이트할 데이터: {update_data}")
 
-        update_result = session_manager.update_session(
+        # 업데이트 응답에 갱신된 세션이 담겨 오므로 다시 조회하지 않음
+        updated_session = session_manager.update_session(
             session_id=session_id,
             step="temp_updated",
             data=update_data,
         )
-        logger.info(f"[DEBUG] Redis 업데이트 결과: {update_result}")
 
-        if not update_result:
+        if not updated_session:
             raise HTTPException(status_code=500, detail="Redis 세션 업데이트 실패")
 
-        updated_session = session_manager.get_session(session_id)
         logger.info(f"[DEBUG] 업데이트 후 전체 세션: {updated_session}")
 
         logger.info(
@@ -3,7 +3,10 @@ import logging
 from database.simple_db import simple_menu_db
 from database.repositories.owner_menu_repo import insert_menu_tx, find_menu_id_by_name_temp
 from services.vector_client import upsert_menu_point
+from services.menu_index import menu_vector_index
 from services.s3_service import upload_menu_image
+from services.order_at_once_service import get_order_at_once_service
+from services.menu_catalog_events import invalidate_menu_catalog
 from schemas.owner_menu import OwnerMenuCreateResponse
 
 logger = logging.getLogger(__name__)
@@ -49,7 +52,7 @@ class OwnerMenuService:
                 raise HTTPException(status_code=500, detail=f"메뉴 저장 실패: {err or 'unknown error'}")
 
             try:
-                upsert_menu_point(
+                vec = upsert_menu_point(
                     id_=new_id,
                     name=name,
                     price=price,
@@ -63,6 +66,31 @@ class OwnerMenuService:
 
             conn.commit()
 
+            # 메모리 메뉴 인덱스에 새 메뉴 반영
+            try:
+                menu_vector_index.upsert(
+                    menu_id=new_id,
+                    name=name,
+                    price=price,
+                    popular=popular,
+                    temp=temperature,
+                    vector=vec,
+                )
+            except Exception as e:
+                logger.warning(f"메뉴 벡터 인덱스 반영 실패: {e}")
+
+            # 가격/프로필 카탈로그 캐시 무효화 (다른 워커에는 pub/sub 으로 전파)
+            try:
+                invalidate_menu_catalog([new_id])
+            except Exception as e:
+                logger.warning(f"메뉴 카탈로그 캐시 무효화 실패: {e}")
+
+            # 주문 서비스 메뉴 캐시에 새 메뉴 반영
+            try:
+                get_order_at_once_service().refresh_menu_cache(force=True)
+            except Exception as e:
+                logger.warning(f"메뉴 캐시 갱신 실패: {e}")
+
             return OwnerMenuCreateResponse(
                 id=new_id,
                 name=name,
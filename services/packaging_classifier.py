@@ -0,0 +1,98 @@
+import os
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from config.config_cache import get_packaging_aliases, get_packaging_config
+from services.similarity_utils import encode_batch, encode_cached_async, run_in_encode_executor
+
+logger = logging.getLogger(__name__)
+
+# 포장 방식 분류기: 별칭 임베딩을 메모리에 두고 발화 벡터와 내적 한 번으로 가장 가까운 별칭 선택
+class PackagingClassifier:
+    def __init__(self, aliases: Dict[str, List[str]], threshold: float, cache_size: int = 1024):
+        self.threshold = threshold
+        self._alias_types: List[str] = []
+        self._alias_texts: List[str] = []
+        for ptype, phrases in aliases.items():
+            for phrase in phrases:
+                self._alias_types.append(ptype)
+                self._alias_texts.append(phrase)
+
+        self._matrix: Optional[np.ndarray] = None
+        self._build_lock = threading.Lock()
+
+        self._cache: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._cache_size = cache_size
+        self._cache_lock = threading.Lock()
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        return " ".join((text or "").lower().split())
+
+    # 별칭 임베딩 행렬 준비 (전역 주입 모델로 한 번에 인코딩)
+    def build(self) -> np.ndarray:
+        if self._matrix is None:
+            with self._build_lock:
+                if self._matrix is None:
+                    self._matrix = encode_batch(self._alias_texts)
+                    logger.info(f"포장 분류기 준비 완료: 별칭 {len(self._alias_texts)}개")
+        return self._matrix
+
+    def _cached(self, key: str) -> Optional[Tuple[str, float]]:
+        with self._cache_lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+            return result
+
+    def _remember(self, key: str, result: Tuple[str, float]):
+        with self._cache_lock:
+            self._cache[key] = result
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+    # (포장 방식, 점수) 반환. 임계값 미만이면 포장 방식은 ""
+    def classify(self, text: str) -> Tuple[str, float]:
+        key = self.normalize(text)
+        if not key or not self._alias_texts:
+            return "", 0.0
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+
+        return self._score(key, encode_batch([key])[0])
+
+    def _score(self, key: str, query_vector: np.ndarray) -> Tuple[str, float]:
+        scores = self.build() @ query_vector
+        best = int(np.argmax(scores))
+        score = float(scores[best])
+        result = (self._alias_types[best] if score >= self.threshold else "", score)
+        self._remember(key, result)
+        return result
+
+    # 캐시 적중 시 바로 반환, 아니면 발화 인코딩은 마이크로 배처(다른 요청과 묶음)로 보내고 내적만 여기서 계산
+    async def classify_async(self, text: str) -> Tuple[str, float]:
+        key = self.normalize(text)
+        if not key or not self._alias_texts:
+            return "", 0.0
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+        if self._matrix is None:
+            await run_in_encode_executor(self.build)
+        return self._score(key, await encode_cached_async(key))
+
+_classifier: Optional[PackagingClassifier] = None
+_classifier_lock = threading.Lock()
+
+# 프로세스 공용 포장 분류기 (config/packaging_patterns.json 기반)
+def get_packaging_classifier() -> PackagingClassifier:
+    global _classifier
+    if _classifier is None:
+        with _classifier_lock:
+            if _classifier is None:
+                threshold = float(os.getenv("PACKAGING_THRESHOLD", get_packaging_config().get("threshold", 0.45)))
+                _classifier = PackagingClassifier(get_packaging_aliases(), threshold=threshold)
+    return _classifier
@@ -177,12 +177,8 @@ def save_order_to_mysql(orders: list, packaging_type: str, phone_number: Optiona
         # 총 금액 계산
         total_price = sum(order["price"] * order["quantity"] for order in orders)
 
-        # orders 테이블에 저장
-        connection = simple_menu_db.get_connection()
-        if not connection:
-            raise Exception("MySQL 연결 실패")
-
-        try:
+        # orders + order_items를 하나의 트랜잭션으로 저장 (풀 연결 사용)
+        with simple_menu_db.transaction() as connection:
             with connection.cursor() as cursor:
                 # 1. orders 테이블에 메인 주문 정보 저장
                 order_sql = """
@@ -206,24 +202,20 @@ def save_order_to_mysql(orders: list, packaging_type: str, phone_number: Optiona
                            VALUES (%s, %s, %s, %s, %s, %s) \
                            """
 
-                for order in orders:
-                    cursor.execute(item_sql, (
+                cursor.executemany(item_sql, [
+                    (
                         order_id,
                         order["menu_id"],
                         order["menu_item"],
                         order["price"],
                         order["quantity"],
                         order["temp"]
-                    ))
-
-                # 트랜잭션 커밋
-                connection.commit()
-
-                logger.info(f"주문 저장 완료: order_id={order_id}, total_price={total_price}원, phone={phone_number}")
-                return order_id
+                    )
+                    for order in orders
+                ])
 
-        finally:
-            connection.close()
+        logger.info(f"주문 저장 완료: order_id={order_id}, total_price={total_price}원, phone={phone_number}")
+        return order_id
 
     except Exception as e:
         logger.error(f"MySQL 주문 저장 실패: {e}")
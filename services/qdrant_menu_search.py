@@ -0,0 +1,100 @@
+import os
+import inspect
+import logging
+from typing import Any, Dict, List, Optional, Sequence
+from qdrant_client import AsyncQdrantClient
+
+try:
+    from qdrant_client.http.models import Filter, FieldCondition, MatchValue, QueryRequest
+except ImportError:
+    from qdrant_client.models import Filter, FieldCondition, MatchValue, QueryRequest
+
+logger = logging.getLogger(__name__)
+
+MENU_TEMPS = ("hot", "ice", "none")
+
+# MENU_SEARCH_TRACE=true 이고 DEBUG 레벨일 때만 검색 응답 전체를 기록
+_TRACE = os.getenv("MENU_SEARCH_TRACE", "false").strip().lower() in ("1", "true", "yes")
+
+def trace_enabled() -> bool:
+    return _TRACE and logger.isEnabledFor(logging.DEBUG)
+
+# 클라이언트 버전에 따른 필터 인자 이름 (filter / query_filter)
+def _resolve_filter_kw(client: AsyncQdrantClient) -> Optional[str]:
+    params = inspect.signature(client.query_points).parameters
+    if "filter" in params:
+        return "filter"
+    if "query_filter" in params:
+        return "query_filter"
+    return None
+
+# 메뉴 컬렉션 조회 어댑터: API 호환성 확인과 temp 필터 생성은 생성 시 한 번만
+class QdrantMenuSearch:
+    def __init__(self, client: AsyncQdrantClient, collection_name: str = "menu"):
+        self.client = client
+        self.collection_name = collection_name
+        self.filter_kw = _resolve_filter_kw(client)
+        self.temp_filters: Dict[str, Filter] = {
+            temp: Filter(must=[FieldCondition(key="temp", match=MatchValue(value=temp))])
+            for temp in MENU_TEMPS
+        }
+        if self.filter_kw is None:
+            logger.warning("Qdrant query_points에 필터 인자가 없어 temp 필터 없이 검색합니다")
+
+    def _temp_filter(self, temp: str) -> Filter:
+        flt = self.temp_filters.get(temp)
+        if flt is None:
+            flt = Filter(must=[FieldCondition(key="temp", match=MatchValue(value=temp))])
+        return flt
+
+    async def query(
+        self,
+        query_vector: Sequence[float],
+        limit: int,
+        score_threshold: Optional[float] = None,
+        temp: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        kwargs = {
+            "collection_name": self.collection_name,
+            "query": query_vector.tolist() if hasattr(query_vector, "tolist") else list(query_vector),
+            "limit": limit,
+            "score_threshold": score_threshold,
+            "with_payload": True,
+            "with_vectors": False,
+        }
+        if temp is not None and self.filter_kw is not None:
+            kwargs[self.filter_kw] = self._temp_filter(temp)
+
+        response = await self.client.query_points(**kwargs)
+        points = getattr(response, "points", None) or []
+        if trace_enabled():
+            logger.debug(f"Qdrant 응답 (temp={temp}): {response}")
+        return [p.payload or {} for p in points]
+
+    # 질의 여러 개를 query_batch_points 한 번으로 (질의별 temp 필터)
+    async def query_batch(
+        self,
+        query_vectors: Sequence[Sequence[float]],
+        limit: int,
+        score_threshold: Optional[float] = None,
+        temps: Optional[Sequence[Optional[str]]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        temps = list(temps) if temps is not None else [None] * len(query_vectors)
+        requests = [
+            QueryRequest(
+                query=vec.tolist() if hasattr(vec, "tolist") else list(vec),
+                filter=self._temp_filter(temp) if temp is not None else None,
+                limit=limit,
+                score_threshold=score_threshold,
+                with_payload=True,
+                with_vector=False,
+            )
+            for vec, temp in zip(query_vectors, temps)
+        ]
+        if not requests:
+            return []
+
+        responses = await self.client.query_batch_points(collection_name=self.collection_name, requests=requests)
+        if trace_enabled():
+            logger.debug(f"Qdrant 일괄 응답 (temps={temps}): {responses}")
+        return [[p.payload or {} for p in (getattr(r, "points", None) or [])] for r in responses]
@@ -1,13 +1,230 @@
 import redis
-import json
+import redis.asyncio as aioredis
+import asyncio
+import copy
+import time
 import uuid
+import functools
+import threading
+from contextlib import asynccontextmanager, suppress
+from contextvars import ContextVar
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import logging
 import os
+from core.utils.histogram import Histogram
+from services.session_codec import (
+    SessionCodec,
+    SESSION_DATA_PREFIX,
+    get_session_codec,
+    encode_session_fields,
+    decode_session_fields,
+)
+from services.session_cache import (
+    SESSION_LOCAL_CACHE_ENABLED,
+    SESSION_CACHE_CHANNEL,
+    session_local_cache,
+    session_change_message,
+    parse_session_change,
+)
+from core.exceptions.session_exceptions import SessionConflictException, SessionUpdateFailedException
 
 logger = logging.getLogger(__name__)
 
+def _default_redis_url() -> str:
+    host = os.getenv("REDIS_HOST", "localhost")
+    return f"redis://{host}:6379/0"
+
+_SESSION_KEY_PREFIX = "session:"
+
+def _session_key(session_id: str) -> str:
+    return f"{_SESSION_KEY_PREFIX}{session_id}"
+
+# 세션 통계 키 (session:* 패턴에 걸리지 않도록 session_stats: 접두사)
+# steps: 단계(코덱 인코딩 값)별 세션 수 / step_of: 세션별 현재 단계 / expiry: 세션별 만료 시각 zset (만료 세션 차감용)
+SESSION_STATS_STEPS_KEY = "session_stats:steps"
+SESSION_STATS_EXPIRY_KEY = "session_stats:expiry"
+SESSION_STATS_STEP_OF_KEY = "session_stats:step_of"
+_STATS_KEYS = [SESSION_STATS_STEPS_KEY, SESSION_STATS_EXPIRY_KEY, SESSION_STATS_STEP_OF_KEY]
+
+# 한 번에 정리할 만료 세션 수 / 전체 조회 시 SCAN 한 번에 가져올 키 수
+_REAP_BATCH = 500
+_SCAN_BATCH = 500
+
+# 새 세션 기본 문서
+def _new_session_data(expire_minutes: int) -> Dict[str, Any]:
+    return {
+        "created_at": datetime.now().isoformat(),
+        "expires_at": (datetime.now() + timedelta(minutes=expire_minutes)).isoformat(),
+        "step": "started",
+        "version": 0,
+        "data": {
+            "menu_item": None,
+            "quantity": None,
+            "packaging_type": None
+        }
+    }
+
+# 세션 문서에 단계/데이터 변경 반영
+def _apply_session_update(session: Dict[str, Any], step: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    session["step"] = step
+    session["data"].update(data)
+    session["updated_at"] = datetime.now().isoformat()
+    session["version"] = int(session.get("version", 0)) + 1
+    return session
+
+# 세션은 Redis 해시로 저장 (필드 구성/값 인코딩은 session_codec), 단계 변경 시 바뀐 필드만 씀
+# 이전 형식(문서 전체를 JSON 문자열로 저장)은 읽기 지원 + 다음 업데이트 때 해시로 전환
+def _decode_legacy_session(raw: bytes, codec: SessionCodec) -> Dict[str, Any]:
+    session = codec.decode(raw)
+    session.setdefault("version", 0)
+    return session
+
+# KEYS[1] 세션 키, KEYS[2..4] 통계 키(steps, expiry, step_of)
+# ARGV[1] TTL(초), ARGV[2] step, ARGV[3] updated_at, ARGV[4] 기대 version('' 이면 검사 안 함), ARGV[5] 세션 ID,
+# ARGV[6] 만료 시각(epoch 초), ARGV[7] 캐시 무효화 채널('' 이면 발행 안 함), ARGV[8] 무효화 메시지, ARGV[9..] data 필드·값 쌍
+# 해시면 필드 갱신 + version 증가 + TTL 연장 + 단계 카운터 이동 후 새 상태를 {"hash", 필드, 값, ...} 로 반환,
+# version 이 다르면 {"conflict"}, 해시가 아니면 {키 타입}
+_UPDATE_SESSION_LUA = """
+local kind = redis.call('TYPE', KEYS[1])['ok']
+if kind ~= 'hash' then
+    return {kind}
+end
+if ARGV[4] ~= '' and (redis.call('HGET', KEYS[1], 'version') or '0') ~= ARGV[4] then
+    return {'conflict'}
+end
+redis.call('HSET', KEYS[1], 'step', ARGV[2], 'updated_at', ARGV[3], unpack(ARGV, 9))
+redis.call('HINCRBY', KEYS[1], 'version', 1)
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+
+local previous = redis.call('HGET', KEYS[4], ARGV[5])
+if previous ~= ARGV[2] then
+    if previous then
+        redis.call('HINCRBY', KEYS[2], previous, -1)
+    end
+    redis.call('HINCRBY', KEYS[2], ARGV[2], 1)
+    redis.call('HSET', KEYS[4], ARGV[5], ARGV[2])
+end
+redis.call('ZADD', KEYS[3], ARGV[6], ARGV[5])
+if ARGV[7] ~= '' then
+    redis.call('PUBLISH', ARGV[7], ARGV[8])
+end
+
+local state = redis.call('HGETALL', KEYS[1])
+table.insert(state, 1, 'hash')
+return state
+"""
+
+# 세션 통계에서 빼기. KEYS[1..3] 통계 키(steps, expiry, step_of)
+# ARGV[1] 기준 시각이 있으면 그 전에 만료된 세션을 최대 ARGV[2] 개, 없으면('') ARGV[3..] 세션 ID 를 정리. 정리한 수 반환
+_UNTRACK_SESSIONS_LUA = """
+local ids
+if ARGV[1] ~= '' then
+    ids = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', ARGV[1], 'LIMIT', 0, tonumber(ARGV[2]))
+else
+    ids = {unpack(ARGV, 3)}
+end
+for _, sid in ipairs(ids) do
+    local step = redis.call('HGET', KEYS[3], sid)
+    if step then
+        redis.call('HINCRBY', KEYS[1], step, -1)
+        redis.call('HDEL', KEYS[3], sid)
+    end
+    redis.call('ZREM', KEYS[2], sid)
+end
+return #ids
+"""
+
+def _update_args(
+    codec: SessionCodec, session_id: str, step: str, data: Dict[str, Any], expire_minutes: int,
+    expected_version: Optional[int] = None,
+) -> List[Any]:
+    args: List[Any] = [
+        expire_minutes * 60,
+        codec.encode(step),
+        codec.encode(datetime.now().isoformat()),
+        "" if expected_version is None else str(expected_version),
+        session_id,
+        _expire_at(expire_minutes),
+    ]
+    message = session_change_message(session_id)
+    args.extend((SESSION_CACHE_CHANNEL, message) if message else ("", ""))
+    for key, value in data.items():
+        args.extend((SESSION_DATA_PREFIX + key, codec.encode(value)))
+    return args
+
+# 세션 변경을 다른 워커의 로컬 캐시에 알림 (파이프라인/트랜잭션에 포함)
+def _publish_session_change(pipe, session_id: str):
+    message = session_change_message(session_id)
+    if message:
+        pipe.publish(SESSION_CACHE_CHANNEL, message)
+
+def _expire_at(expire_minutes: int) -> float:
+    return time.time() + expire_minutes * 60
+
+# 새로 추적하는 세션을 통계에 추가 (생성/이전 형식 전환 파이프라인에 포함)
+def _track_session(pipe, session_id: str, encoded_step: bytes, expire_minutes: int):
+    pipe.hincrby(SESSION_STATS_STEPS_KEY, encoded_step, 1)
+    pipe.hset(SESSION_STATS_STEP_OF_KEY, session_id, encoded_step)
+    pipe.zadd(SESSION_STATS_EXPIRY_KEY, {session_id: _expire_at(expire_minutes)})
+
+# 단계 카운터 해시 → {단계: 세션 수} (코덱이 바뀌어 같은 단계가 다른 값으로 저장돼 있어도 합산)
+def _decode_step_counts(counters: Dict[bytes, bytes], codec: SessionCodec) -> Dict[str, int]:
+    step_counts: Dict[str, int] = {}
+    for encoded, count in counters.items():
+        try:
+            step = codec.decode(encoded)
+        except ValueError:
+            step = "unknown"
+        step = step if isinstance(step, str) else str(step)
+        step_counts[step] = step_counts.get(step, 0) + int(count)
+    return {step: count for step, count in step_counts.items() if count > 0}
+
+def _session_id_of(key) -> str:
+    key = key.decode("utf-8") if isinstance(key, bytes) else key
+    return key[len(_SESSION_KEY_PREFIX):]
+
+# 키 목록의 세션을 한 번에 조회: 해시는 파이프라인 HGETALL, 이전 형식(문자열)은 MGET 한 번 → (해시 결과 처리, MGET 대상 키)
+def _collect_batch(keys: List[bytes], results: List[Any], codec: SessionCodec, sessions: Dict[str, Dict[str, Any]]) -> List[bytes]:
+    legacy_keys = []
+    for key, result in zip(keys, results):
+        if isinstance(result, redis.ResponseError) and _is_wrong_type(result):
+            legacy_keys.append(key)
+        elif isinstance(result, Exception):
+            logger.warning(f"세션 조회 실패 ({_session_id_of(key)}): {result}")
+        elif result:
+            try:
+                sessions[_session_id_of(key)] = decode_session_fields(result, codec)
+            except ValueError as e:
+                logger.warning(f"세션 디코딩 실패 ({_session_id_of(key)}): {e}")
+    return legacy_keys
+
+def _collect_legacy(keys: List[bytes], values: List[Optional[bytes]], codec: SessionCodec, sessions: Dict[str, Dict[str, Any]]):
+    for key, raw in zip(keys, values):
+        if not raw:
+            continue
+        try:
+            sessions[_session_id_of(key)] = _decode_legacy_session(raw, codec)
+        except ValueError as e:
+            logger.warning(f"세션 디코딩 실패 ({_session_id_of(key)}): {e}")
+
+def _pairs_to_dict(flat: List[bytes]) -> Dict[bytes, bytes]:
+    return dict(zip(flat[0::2], flat[1::2]))
+
+# Lua 결과 첫 원소 (해시/conflict/키 타입)
+def _script_status(result: List[bytes]) -> str:
+    status = result[0]
+    return status.decode() if isinstance(status, bytes) else status
+
+def _key_type(value) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+def _is_wrong_type(error: redis.ResponseError) -> bool:
+    return str(error).startswith("WRONGTYPE")
+
+# 이전 형식 세션 업데이트 재시도 횟수 (WATCH 충돌 시)
+_LEGACY_UPDATE_RETRIES = 5
+
 # Redis 기반 세션 관리 클래스
 class RedisSessionManager:
     VALID_STEPS = ["started", "packaging", "phone_choice", "phone_input", "completed", "fully_completed"]
@@ -17,14 +234,18 @@ class RedisSessionManager:
         return step in self.VALID_STEPS
 
     # Redis 연결 초기화
-    def __init__(self, redis_url: str = None):
-        host = os.getenv("REDIS_HOST", "localhost")
-        self.redis_url = redis_url or f"redis://{host}:6379/0"
+    # session_client: 세션 값(이진 코덱) 전용 bytes 클라이언트 / redis_client: 키 목록·통계 등 문자열 응답용
+    def __init__(self, redis_url: str = None, codec: Optional[SessionCodec] = None):
+        self.redis_url = redis_url or _default_redis_url()
+        self.codec = codec or get_session_codec()
 
         try:
-            self.redis_client = redis.from_url(redis_url, decode_responses=True)
+            self.redis_client = redis.from_url(self.redis_url, decode_responses=True)
             self.redis_client.ping()
-            logger.info(f"Redis 연결 성공: {redis_url}")
+            self.session_client = redis.from_url(self.redis_url, decode_responses=False)
+            self._update_script = self.session_client.register_script(_UPDATE_SESSION_LUA)
+            self._untrack_script = self.session_client.register_script(_UNTRACK_SESSIONS_LUA)
+            logger.info(f"Redis 연결 성공: {self.redis_url}")
         except redis.RedisError as e:
             logger.error(f"Redis 연결 실패: {e}")
             raise
@@ -32,24 +253,17 @@ class RedisSessionManager:
     # 새 세션 생성
     def create_session(self, expire_minutes: int = 30) -> str:
         session_id = str(uuid.uuid4())
-        session_data = {
-            "created_at": datetime.now().isoformat(),
-            "expires_at": (datetime.now() + timedelta(minutes=expire_minutes)).isoformat(),
-            "step": "started",
-            "data": {
-                "menu_item": None,
-                "quantity": None,
-                "packaging_type": None
-            }
-        }
+        session_data = _new_session_data(expire_minutes)
+        key = _session_key(session_id)
 
         try:
-            # 30분
-            self.redis_client.setex(
-                f"session:{session_id}",
-                expire_minutes * 60,
-                json.dumps(session_data)
-            )
+            # 해시 저장 + TTL(기본 30분) 한 번에
+            pipe = self.session_client.pipeline(transaction=True)
+            fields = encode_session_fields(session_data, self.codec)
+            pipe.hset(key, mapping=fields)
+            pipe.expire(key, expire_minutes * 60)
+            _track_session(pipe, session_id, fields["step"], expire_minutes)
+            pipe.execute()
             logger.info(f"세션 생성 완료: {session_id}")
             return session_id
         except redis.RedisError as e:
@@ -58,47 +272,82 @@ class RedisSessionManager:
 
     # 세션 조회
     def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        key = _session_key(session_id)
         try:
-            session_json = self.redis_client.get(f"session:{session_id}")
-            if not session_json:
+            try:
+                fields = self.session_client.hgetall(key)
+                session_data = decode_session_fields(fields, self.codec) if fields else None
+            except redis.ResponseError as e:
+                if not _is_wrong_type(e):
+                    raise
+                session_json = self.session_client.get(key)
+                session_data = _decode_legacy_session(session_json, self.codec) if session_json else None
+
+            if not session_data:
                 logger.warning(f"세션 없음 또는 만료: {session_id}")
                 return None
 
-            session_data = json.loads(session_json)
             logger.debug(f"세션 조회 성공: {session_id}")
             return session_data
-        except (redis.RedisError, json.JSONDecodeError) as e:
+        except (redis.RedisError, ValueError) as e:
             logger.error(f"세션 조회 실패: {e}")
             return None
 
-    # 세션 업데이트
-    def update_session(self, session_id: str, step: str, data: Dict[str, Any], expire_minutes: int = 30) -> bool:
+    # 세션 업데이트 (원자적 병합 + TTL 연장, 갱신된 세션 반환 / 세션이 없거나 실패하면 None)
+    def update_session(self, session_id: str, step: str, data: Dict[str, Any], expire_minutes: int = 30) -> Optional[Dict[str, Any]]:
+        key = _session_key(session_id)
         try:
-            session = self.get_session(session_id)
-            if not session:
-                logger.warning(f"업데이트할 세션 없음: {session_id}")
-                return False
+            for _ in range(_LEGACY_UPDATE_RETRIES):
+                result = self._update_script(keys=[key, *_STATS_KEYS], args=_update_args(self.codec, session_id, step, data, expire_minutes))
+                if _script_status(result) == "hash":
+                    session = decode_session_fields(_pairs_to_dict(result[1:]), self.codec)
+                elif _script_status(result) == "string":
+                    session = self._update_legacy(key, step, data, expire_minutes)
+                    if session is None:
+                        continue
+                else:
+                    logger.warning(f"업데이트할 세션 없음: {session_id}")
+                    return None
 
-            session["step"] = step
-            session["data"].update(data)
-            session["updated_at"] = datetime.now().isoformat()
+                session_local_cache.invalidate([session_id])
+                logger.info(f"세션 업데이트 완료: {session_id}, step: {step}")
+                return session
 
-            # Redis에 다시 저장 (TTL 연장)
-            self.redis_client.setex(
-                f"session:{session_id}",
-                expire_minutes * 60,
-                json.dumps(session)
-            )
-            logger.info(f"세션 업데이트 완료: {session_id}, step: {step}")
-            return True
-        except redis.RedisError as e:
+            logger.error(f"세션 업데이트 실패 (동시 변경 반복): {session_id}")
+            return None
+        except (redis.RedisError, ValueError) as e:
             logger.error(f"세션 업데이트 실패: {e}")
-            return False
+            return None
+
+    # 이전 형식(JSON 문자열) 세션을 갱신하면서 해시로 전환 (다른 요청이 먼저 바꾸면 None → 재시도)
+    def _update_legacy(self, key: str, step: str, data: Dict[str, Any], expire_minutes: int) -> Optional[Dict[str, Any]]:
+        with self.session_client.pipeline() as pipe:
+            try:
+                pipe.watch(key)
+                if _key_type(pipe.type(key)) != "string":
+                    return None
+                session = _apply_session_update(_decode_legacy_session(pipe.get(key), self.codec), step, data)
+                pipe.multi()
+                pipe.delete(key)
+                fields = encode_session_fields(session, self.codec)
+                pipe.hset(key, mapping=fields)
+                pipe.expire(key, expire_minutes * 60)
+                _track_session(pipe, _session_id_of(key), fields["step"], expire_minutes)
+                _publish_session_change(pipe, _session_id_of(key))
+                pipe.execute()
+                return session
+            except redis.WatchError:
+                return None
 
     # 세션 삭제
     def delete_session(self, session_id: str) -> bool:
         try:
-            result = self.redis_client.delete(f"session:{session_id}")
+            pipe = self.redis_client.pipeline(transaction=True)
+            pipe.delete(_session_key(session_id))
+            _publish_session_change(pipe, session_id)
+            result = pipe.execute()[0]
+            session_local_cache.invalidate([session_id])
+            self._untrack_script(keys=_STATS_KEYS, args=["", 0, session_id])
             if result:
                 logger.info(f"세션 삭제 완료: {session_id}")
                 return True
@@ -112,7 +361,11 @@ class RedisSessionManager:
     # 세션 만료 시간 연장
     def extend_session(self, session_id: str, expire_minutes: int = 30) -> bool:
         try:
-            result = self.redis_client.expire(f"session:{session_id}", expire_minutes * 60)
+            pipe = self.redis_client.pipeline(transaction=True)
+            pipe.expire(_session_key(session_id), expire_minutes * 60)
+            # 통계에 추적 중인 세션만 만료 시각 갱신
+            pipe.zadd(SESSION_STATS_EXPIRY_KEY, {session_id: _expire_at(expire_minutes)}, xx=True)
+            result, _ = pipe.execute()
             if result:
                 logger.info(f"세션 만료시간 연장: {session_id} (+{expire_minutes}분)")
                 return True
@@ -123,58 +376,63 @@ class RedisSessionManager:
             logger.error(f"세션 연장 실패: {e}")
             return False
 
-    # 모든 세션 조회
+    # 모든 세션 조회 (KEYS 대신 SCAN 커서 + 묶음별 파이프라인 조회로 Redis 를 막지 않음)
     def get_all_sessions(self) -> Dict[str, Dict[str, Any]]:
+        sessions: Dict[str, Dict[str, Any]] = {}
         try:
-            session_keys = self.redis_client.keys("session:*")
-            sessions = {}
-
-            for key in session_keys:
-                session_id = key.replace("session:", "")
-                session_data = self.get_session(session_id)
-                if session_data:
-                    sessions[session_id] = session_data
+            batch: List[bytes] = []
+            for key in self.session_client.scan_iter(match=f"{_SESSION_KEY_PREFIX}*", count=_SCAN_BATCH):
+                batch.append(key)
+                if len(batch) >= _SCAN_BATCH:
+                    self._load_batch(batch, sessions)
+                    batch = []
+            if batch:
+                self._load_batch(batch, sessions)
 
             logger.info(f"전체 세션 조회: {len(sessions)}개")
             return sessions
         except redis.RedisError as e:
             logger.error(f"전체 세션 조회 실패: {e}")
-            return {}
+            return sessions
+
+    def _load_batch(self, keys: List[bytes], sessions: Dict[str, Dict[str, Any]]):
+        pipe = self.session_client.pipeline(transaction=False)
+        for key in keys:
+            pipe.hgetall(key)
+        legacy_keys = _collect_batch(keys, pipe.execute(raise_on_error=False), self.codec, sessions)
+        if legacy_keys:
+            _collect_legacy(legacy_keys, self.session_client.mget(legacy_keys), self.codec, sessions)
 
-    # 만료된 세션 정리
+    # 만료된 세션을 통계에서 정리 (만료 시각 zset 기준, 정리한 세션 수 반환)
     def cleanup_expired_sessions(self) -> int:
         try:
-            # 수동 정리가 필요한 경우를 위해 구현
-            session_keys = self.redis_client.keys("session:*")
             expired_count = 0
+            while True:
+                reaped = self._untrack_script(keys=_STATS_KEYS, args=[time.time(), _REAP_BATCH])
+                expired_count += reaped
+                if reaped < _REAP_BATCH:
+                    break
 
-            for key in session_keys:
-                ttl = self.redis_client.ttl(key)
-                if ttl == -2:  # 키가 존재하지 않음
-                    expired_count += 1
-
-            logger.info(f"만료된 세션 정리 완료: {expired_count}개")
+            if expired_count:
+                logger.info(f"만료된 세션 정리 완료: {expired_count}개")
             return expired_count
         except redis.RedisError as e:
             logger.error(f"세션 정리 실패: {e}")
             return 0
 
-    # 세션 통계 정보
+    # 세션 통계 정보 (단계별 카운터는 세션 생성/단계 변경 시 원자적으로 갱신, 만료분은 조회 전에 정리)
     def get_session_stats(self) -> Dict[str, Any]:
         try:
-            total_sessions = len(self.redis_client.keys("session:*"))
-
-            # 단계별 세션 수 계산
-            step_counts = {}
-            sessions = self.get_all_sessions()
+            self.cleanup_expired_sessions()
 
-            for session_data in sessions.values():
-                step = session_data.get("step", "unknown")
-                step_counts[step] = step_counts.get(step, 0) + 1
+            pipe = self.session_client.pipeline(transaction=False)
+            pipe.hgetall(SESSION_STATS_STEPS_KEY)
+            pipe.zcard(SESSION_STATS_EXPIRY_KEY)
+            counters, total_sessions = pipe.execute()
 
             stats = {
                 "total_sessions": total_sessions,
-                "step_distribution": step_counts,
+                "step_distribution": _decode_step_counts(counters, self.codec),
                 "redis_info": {
                     "connected": self.redis_client.ping(),
                     "memory_usage": self.redis_client.info("memory")["used_memory_human"]
@@ -187,8 +445,402 @@ class RedisSessionManager:
             logger.error(f"세션 통계 조회 실패: {e}")
             return {"error": str(e)}
 
+# redis.asyncio 기반 세션 관리 클래스 (이벤트 루프를 막지 않는 API 경로용)
+class AsyncRedisSessionManager:
+    def __init__(self, redis_url: str = None, codec: Optional[SessionCodec] = None):
+        self.redis_url = redis_url or _default_redis_url()
+        self.codec = codec or get_session_codec()
+        # 연결은 첫 명령 실행 시 맺어짐 (세션 값은 bytes 클라이언트, 그 외는 문자열 클라이언트)
+        self.redis_client = aioredis.from_url(self.redis_url, decode_responses=True)
+        self.session_client = aioredis.from_url(self.redis_url, decode_responses=False)
+        self._update_script = self.session_client.register_script(_UPDATE_SESSION_LUA)
+        self._untrack_script = self.session_client.register_script(_UNTRACK_SESSIONS_LUA)
+
+    # 새 세션 생성
+    async def create_session(self, expire_minutes: int = 30) -> str:
+        session_id = str(uuid.uuid4())
+        session_data = _new_session_data(expire_minutes)
+        key = _session_key(session_id)
+
+        try:
+            _count_redis_op("create")
+            pipe = self.session_client.pipeline(transaction=True)
+            fields = encode_session_fields(session_data, self.codec)
+            pipe.hset(key, mapping=fields)
+            pipe.expire(key, expire_minutes * 60)
+            _track_session(pipe, session_id, fields["step"], expire_minutes)
+            await pipe.execute()
+            logger.info(f"세션 생성 완료: {session_id}")
+            return session_id
+        except redis.RedisError as e:
+            logger.error(f"세션 생성 실패: {e}")
+            raise
+
+    # 세션 조회 (작업 단위 안에서는 처음 한 번만 Redis 에서 읽음)
+    async def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        unit_of_work = _current_unit_of_work.get()
+        if unit_of_work is not None and unit_of_work.caching:
+            return await unit_of_work.get(session_id)
+        return await self._load_session(session_id)
+
+    # 세션 업데이트 (원자적 병합 + TTL 연장, 갱신된 세션 반환 / 세션이 없거나 실패하면 None)
+    # 작업 단위 안에서는 메모리에만 반영하고 작업 단위가 끝날 때 한 번에 저장
+    async def update_session(self, session_id: str, step: str, data: Dict[str, Any], expire_minutes: int = 30) -> Optional[Dict[str, Any]]:
+        unit_of_work = _current_unit_of_work.get()
+        if unit_of_work is not None and unit_of_work.caching:
+            return await unit_of_work.update(session_id, step, data, expire_minutes)
+        try:
+            return await self._write_session(session_id, step, data, expire_minutes)
+        except (redis.RedisError, ValueError) as e:
+            logger.error(f"세션 업데이트 실패: {e}")
+            return None
+
+    async def _load_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        key = _session_key(session_id)
+        try:
+            try:
+                _count_redis_op("hgetall")
+                fields = await self.session_client.hgetall(key)
+                session_data = decode_session_fields(fields, self.codec) if fields else None
+            except redis.ResponseError as e:
+                if not _is_wrong_type(e):
+                    raise
+                _count_redis_op("get")
+                session_json = await self.session_client.get(key)
+                session_data = _decode_legacy_session(session_json, self.codec) if session_json else None
+
+            if not session_data:
+                logger.warning(f"세션 없음 또는 만료: {session_id}")
+                return None
+
+            return session_data
+        except (redis.RedisError, ValueError) as e:
+            logger.error(f"세션 조회 실패: {e}")
+            return None
+
+    # Redis 에 변경 반영 (expected_version 이 있으면 version 이 다를 때 SessionConflictException)
+    async def _write_session(
+        self, session_id: str, step: str, data: Dict[str, Any], expire_minutes: int,
+        expected_version: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
+        key = _session_key(session_id)
+        for _ in range(_LEGACY_UPDATE_RETRIES):
+            _count_redis_op("evalsha")
+            result = await self._update_script(
+                keys=[key, *_STATS_KEYS], args=_update_args(self.codec, session_id, step, data, expire_minutes, expected_version)
+            )
+            if _script_status(result) == "hash":
+                session = decode_session_fields(_pairs_to_dict(result[1:]), self.codec)
+            elif _script_status(result) == "conflict":
+                raise SessionConflictException(session_id)
+            elif _script_status(result) == "string":
+                session = await self._update_legacy(key, step, data, expire_minutes, expected_version)
+                if session is None:
+                    continue
+            else:
+                logger.warning(f"업데이트할 세션 없음: {session_id}")
+                return None
+
+            session_local_cache.invalidate([session_id])
+            logger.info(f"세션 업데이트 완료: {session_id}, step: {step}")
+            return session
+
+        logger.error(f"세션 업데이트 실패 (동시 변경 반복): {session_id}")
+        return None
+
+    # 이전 형식(JSON 문자열) 세션을 갱신하면서 해시로 전환 (다른 요청이 먼저 바꾸면 None → 재시도)
+    async def _update_legacy(
+        self, key: str, step: str, data: Dict[str, Any], expire_minutes: int,
+        expected_version: Optional[int] = None,
+    ) -> Optional[Dict[str, Any]]:
+        async with self.session_client.pipeline() as pipe:
+            try:
+                _count_redis_op("legacy_migrate")
+                await pipe.watch(key)
+                if _key_type(await pipe.type(key)) != "string":
+                    return None
+                session = _decode_legacy_session(await pipe.get(key), self.codec)
+                if expected_version is not None and int(session["version"]) != expected_version:
+                    raise SessionConflictException(_session_id_of(key))
+                _apply_session_update(session, step, data)
+                pipe.multi()
+                pipe.delete(key)
+                fields = encode_session_fields(session, self.codec)
+                pipe.hset(key, mapping=fields)
+                pipe.expire(key, expire_minutes * 60)
+                _track_session(pipe, _session_id_of(key), fields["step"], expire_minutes)
+                _publish_session_change(pipe, _session_id_of(key))
+                await pipe.execute()
+                return session
+            except redis.WatchError:
+                return None
+
+    # 세션 삭제
+    async def delete_session(self, session_id: str) -> bool:
+        unit_of_work = _current_unit_of_work.get()
+        if unit_of_work is not None:
+            unit_of_work.discard(session_id)
+        try:
+            _count_redis_op("delete")
+            pipe = self.redis_client.pipeline(transaction=True)
+            pipe.delete(_session_key(session_id))
+            _publish_session_change(pipe, session_id)
+            deleted = (await pipe.execute())[0]
+            session_local_cache.invalidate([session_id])
+            await self._untrack_script(keys=_STATS_KEYS, args=["", 0, session_id])
+            return bool(deleted)
+        except redis.RedisError as e:
+            logger.error(f"세션 삭제 실패: {e}")
+            return False
+
+    # 만료된 세션을 통계에서 정리 (정리한 세션 수 반환)
+    async def cleanup_expired_sessions(self) -> int:
+        expired_count = 0
+        while True:
+            reaped = await self._untrack_script(keys=_STATS_KEYS, args=[time.time(), _REAP_BATCH])
+            expired_count += reaped
+            if reaped < _REAP_BATCH:
+                return expired_count
+
+    # 단계별/전체 활성 세션 수 (세션 수와 무관하게 명령 3개)
+    async def get_session_stats(self) -> Dict[str, Any]:
+        await self.cleanup_expired_sessions()
+        pipe = self.session_client.pipeline(transaction=False)
+        pipe.hgetall(SESSION_STATS_STEPS_KEY)
+        pipe.zcard(SESSION_STATS_EXPIRY_KEY)
+        counters, total_sessions = await pipe.execute()
+        return {
+            "total_sessions": total_sessions,
+            "step_distribution": _decode_step_counts(counters, self.codec),
+        }
+
+    # 만료 세션 통계 정리 주기 실행 (lifespan 백그라운드 작업)
+    async def run_stats_reaper(self, interval_seconds: float = 60.0):
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                reaped = await self.cleanup_expired_sessions()
+                if reaped:
+                    logger.info(f"만료 세션 통계 정리: {reaped}개")
+            except redis.RedisError as e:
+                logger.warning(f"만료 세션 통계 정리 실패: {e}")
+
+    # 세션 캐시 무효화 채널 구독 (lifespan 백그라운드 작업). 연결이 끊기면 retry_seconds 후 재구독
+    async def run_cache_subscriber(self, retry_seconds: float = 5.0):
+        if not SESSION_LOCAL_CACHE_ENABLED:
+            return
+
+        subscribed_before = False
+        while True:
+            pubsub = self.redis_client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(SESSION_CACHE_CHANNEL)
+                if subscribed_before:
+                    # 구독이 끊긴 동안 놓친 변경이 있을 수 있으므로 전체 무효화
+                    session_local_cache.invalidate()
+                subscribed_before = True
+
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    session_id = parse_session_change(message.get("data"))
+                    if session_id is not None:
+                        session_local_cache.invalidate([session_id])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"세션 캐시 무효화 구독 끊김 → {retry_seconds:g}s 후 재시도: {e}")
+                # 재구독 전까지는 다른 워커의 변경을 알 수 없으므로 비움
+                session_local_cache.invalidate()
+            finally:
+                with suppress(Exception):
+                    await pubsub.aclose()
+            await asyncio.sleep(retry_seconds)
+
+    # 연결 풀 정리 (lifespan 종료 시)
+    async def close(self):
+        await self.redis_client.aclose()
+        await self.session_client.aclose()
+
+# 작업 단위 끄기: 매 호출마다 Redis 에 바로 읽기/쓰기 (명령 수 집계는 그대로)
+SESSION_UNIT_OF_WORK_ENABLED = os.getenv("SESSION_UNIT_OF_WORK_ENABLED", "true").lower() not in ("0", "false", "no")
+
+_current_unit_of_work: ContextVar[Optional["SessionUnitOfWork"]] = ContextVar("session_unit_of_work", default=None)
+
+def _count_redis_op(op: str):
+    unit_of_work = _current_unit_of_work.get()
+    if unit_of_work is not None:
+        unit_of_work.ops[op] = unit_of_work.ops.get(op, 0) + 1
+
+# 요청 단위 세션 작업: 세션을 한 번 읽어 메모리에서 변경하고, 끝날 때 읽은 version 과 같을 때만 한 번에 저장
+# 서비스 함수는 그대로 async_session_manager.get_session/update_session 을 호출 (ContextVar 로 연결)
+class SessionUnitOfWork:
+    def __init__(self, manager: "AsyncRedisSessionManager", label: str, caching: bool = True, local_cache: bool = False):
+        self.manager = manager
+        self.label = label
+        self.caching = caching
+        # 조회 전용 작업 단위: 프로세스 로컬 세션 캐시에서 먼저 찾음
+        # (쓰기 작업 단위에 쓰면 무효화 전 값을 읽어 저장 시 충돌할 수 있음)
+        self.local_cache = local_cache
+        self.ops: Dict[str, int] = {}
+        self.memory_reads = 0
+        self.local_cache_hits = 0
+        self._sessions: Dict[str, Optional[Dict[str, Any]]] = {}
+        self._versions: Dict[str, int] = {}
+        # session_id → (step, 변경된 data, expire_minutes)
+        self._pending: Dict[str, Tuple[str, Dict[str, Any], int]] = {}
+
+    async def _state(self, session_id: str) -> Optional[Dict[str, Any]]:
+        if session_id in self._sessions:
+            self.memory_reads += 1
+        else:
+            session = await self._load(session_id)
+            self._sessions[session_id] = session
+            if session is not None:
+                self._versions[session_id] = int(session.get("version", 0))
+        return self._sessions[session_id]
+
+    async def _load(self, session_id: str) -> Optional[Dict[str, Any]]:
+        if not self.local_cache:
+            return await self.manager._load_session(session_id)
+        session = session_local_cache.get(session_id)
+        if session is not None:
+            self.local_cache_hits += 1
+            return session
+        generation = session_local_cache.generation
+        session = await self.manager._load_session(session_id)
+        if session is not None:
+            session_local_cache.put(session_id, session, generation)
+        return session
+
+    # 호출자가 바꿔도 작업 단위 상태가 변하지 않도록 복사본 반환
+    async def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        return copy.deepcopy(await self._state(session_id))
+
+    async def update(self, session_id: str, step: str, data: Dict[str, Any], expire_minutes: int) -> Optional[Dict[str, Any]]:
+        if session_id not in self._sessions:
+            # 읽지 않은 세션 변경은 읽은 값에 의존하지 않으므로 바로 원자적으로 반영 (응답으로 받은 상태를 이후 조회에 사용)
+            try:
+                session = await self.manager._write_session(session_id, step, data, expire_minutes)
+            except (redis.RedisError, ValueError) as e:
+                logger.error(f"세션 업데이트 실패: {e}")
+                return None
+            self._sessions[session_id] = session
+            if session is not None:
+                self._versions[session_id] = int(session.get("version", 0))
+            return copy.deepcopy(session)
+
+        session = await self._state(session_id)
+        if session is None:
+            logger.warning(f"업데이트할 세션 없음: {session_id}")
+            return None
+
+        data = copy.deepcopy(data)
+        session["step"] = step
+        session["data"].update(data)
+        session["updated_at"] = datetime.now().isoformat()
+
+        _, pending_data, _ = self._pending.get(session_id, (step, {}, expire_minutes))
+        pending_data.update(data)
+        self._pending[session_id] = (step, pending_data, expire_minutes)
+        return copy.deepcopy(session)
+
+    def discard(self, session_id: str):
+        self._sessions.pop(session_id, None)
+        self._versions.pop(session_id, None)
+        self._pending.pop(session_id, None)
+
+    # 변경된 세션마다 Lua 업데이트 한 번 (그 사이 다른 요청이 바꿨으면 SessionConflictException)
+    async def flush(self):
+        pending, self._pending = self._pending, {}
+        for session_id, (step, data, expire_minutes) in pending.items():
+            try:
+                session = await self.manager._write_session(
+                    session_id, step, data, expire_minutes, expected_version=self._versions.get(session_id)
+                )
+            except (redis.RedisError, ValueError) as e:
+                logger.error(f"세션 업데이트 실패: {e}")
+                session = None
+            if session is None:
+                raise SessionUpdateFailedException(session_id, "저장")
+            self._sessions[session_id] = session
+            self._versions[session_id] = int(session.get("version", 0))
+
+# 작업 단위(라벨)별 요청당 세션 Redis 명령 수 (/health/metrics 노출용)
+class SessionOpsStats:
+    _BUCKETS = [0, 1, 2, 3, 4, 5, 6, 8, 10, 15, 20]
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._per_label: Dict[str, Histogram] = {}
+        self._op_totals: Dict[str, int] = {}
+        self.memory_reads = 0
+        self.local_cache_hits = 0
+        self.flushes = 0
+        self.conflicts = 0
+
+    def observe(self, unit_of_work: SessionUnitOfWork, flushed: bool, conflict: bool):
+        with self._lock:
+            histogram = self._per_label.get(unit_of_work.label)
+            if histogram is None:
+                histogram = self._per_label[unit_of_work.label] = Histogram(self._BUCKETS)
+            for op, count in unit_of_work.ops.items():
+                self._op_totals[op] = self._op_totals.get(op, 0) + count
+            self.memory_reads += unit_of_work.memory_reads
+            self.local_cache_hits += unit_of_work.local_cache_hits
+            self.flushes += int(flushed)
+            self.conflicts += int(conflict)
+        histogram.observe(sum(unit_of_work.ops.values()))
+
+    def stats(self) -> Dict:
+        with self._lock:
+            per_label = dict(self._per_label)
+            totals = dict(self._op_totals)
+        return {
+            "unit_of_work_enabled": SESSION_UNIT_OF_WORK_ENABLED,
+            "ops_per_request": {label: h.snapshot() for label, h in per_label.items()},
+            "op_totals": totals,
+            "memory_reads": self.memory_reads,
+            "local_cache_hits": self.local_cache_hits,
+            "flushes": self.flushes,
+            "conflicts": self.conflicts,
+        }
+
+session_ops_stats = SessionOpsStats()
+
+# 요청 하나를 작업 단위로 묶음. 정상 종료 시 변경분 저장, 예외로 끝나면 변경분 버림
+# local_cache=True 는 세션을 바꾸지 않는 조회 엔드포인트용 (폴링 요청을 프로세스 메모리에서 응답)
+@asynccontextmanager
+async def session_unit_of_work(label: str, local_cache: bool = False):
+    unit_of_work = SessionUnitOfWork(
+        async_session_manager, label, caching=SESSION_UNIT_OF_WORK_ENABLED, local_cache=local_cache
+    )
+    token = _current_unit_of_work.set(unit_of_work)
+    flushed = conflict = False
+    try:
+        yield unit_of_work
+        flushed = bool(unit_of_work._pending)
+        await unit_of_work.flush()
+    except SessionConflictException:
+        conflict = True
+        raise
+    finally:
+        _current_unit_of_work.reset(token)
+        session_ops_stats.observe(unit_of_work, flushed, conflict)
+
+# 라우터 엔드포인트를 작업 단위로 감싸는 데코레이터 (FastAPI 시그니처는 functools.wraps 로 유지)
+def with_session_unit_of_work(label: str, local_cache: bool = False):
+    def decorator(endpoint):
+        @functools.wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            async with session_unit_of_work(label, local_cache=local_cache):
+                return await endpoint(*args, **kwargs)
+        return wrapper
+    return decorator
+
 # 전역 Redis 세션 매니저 인스턴스
 redis_session_manager = RedisSessionManager()
+async_session_manager = AsyncRedisSessionManager()
 
 # 기존 코드와의 호환성을 위한 별칭
 session_manager = redis_session_manager
\ No newline at end of file
@@ -0,0 +1,126 @@
+import os
+import copy
+import json
+import time
+import uuid
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 자주 조회되는 세션(키오스크 결제 화면 폴링)을 프로세스 메모리에 보관하는 LRU
+SESSION_LOCAL_CACHE_ENABLED = os.getenv("SESSION_LOCAL_CACHE_ENABLED", "true").lower() not in ("0", "false", "no")
+# pub/sub 메시지를 놓쳐도 이 시간(초)이 지나면 Redis 에서 다시 읽음
+SESSION_LOCAL_CACHE_TTL = float(os.getenv("SESSION_LOCAL_CACHE_TTL", "10"))
+SESSION_LOCAL_CACHE_MAX_SIZE = int(os.getenv("SESSION_LOCAL_CACHE_MAX_SIZE", "2000"))
+# 세션이 바뀔 때 워커 간에 무효화를 전파하는 Redis pub/sub 채널 (세션 업데이트 Lua 스크립트 안에서 발행)
+SESSION_CACHE_CHANNEL = os.getenv("SESSION_CACHE_CHANNEL", "session_cache:invalidate")
+
+# 자기 프로세스가 보낸 메시지는 구독에서 무시 (쓰기 직후 이미 로컬 캐시를 비움)
+_INSTANCE_ID = uuid.uuid4().hex
+
+# 세션 변경 알림 메시지 (캐시를 끄면 발행하지 않음 → None)
+def session_change_message(session_id: str) -> Optional[str]:
+    if not SESSION_LOCAL_CACHE_ENABLED:
+        return None
+    return json.dumps({"origin": _INSTANCE_ID, "session_id": session_id})
+
+# 수신한 메시지 → 무효화할 session_id (자기 메시지거나 형식이 틀리면 None)
+def parse_session_change(data: Any) -> Optional[str]:
+    try:
+        message = json.loads(data)
+        session_id = message["session_id"]
+    except (TypeError, KeyError, json.JSONDecodeError):
+        logger.warning(f"세션 캐시 무효화 메시지 형식 오류: {data!r}")
+        return None
+    if message.get("origin") == _INSTANCE_ID:
+        return None
+    return session_id
+
+# session_id → (만료 시각, version, 세션). 같은 세션은 더 높은 version 으로만 교체
+class SessionLocalCache:
+    def __init__(self, ttl: float = SESSION_LOCAL_CACHE_TTL, max_size: int = SESSION_LOCAL_CACHE_MAX_SIZE,
+                 enabled: bool = SESSION_LOCAL_CACHE_ENABLED):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.enabled = enabled and ttl > 0 and max_size > 0
+        self._entries: "OrderedDict[str, Tuple[float, int, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # 무효화마다 증가: 무효화 전에 시작한 Redis 조회 결과가 캐시에 다시 들어가지 않도록
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.invalidations = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    # 호출자가 바꿔도 캐시가 변하지 않도록 복사본 반환
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        if not self.enabled:
+            return None
+        with self._lock:
+            cached = self._entries.get(session_id)
+            if cached is None:
+                self.misses += 1
+                return None
+            if cached[0] <= time.monotonic():
+                del self._entries[session_id]
+                self.expired += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(session_id)
+            self.hits += 1
+            session = cached[2]
+        return copy.deepcopy(session)
+
+    # Redis 조회 결과 저장 (generation 은 조회 시작 전에 읽은 값)
+    def put(self, session_id: str, session: Dict[str, Any], generation: int):
+        if not self.enabled:
+            return
+        version = int(session.get("version", 0))
+        session = copy.deepcopy(session)
+        expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            if generation != self._generation:
+                return
+            cached = self._entries.get(session_id)
+            if cached is not None and cached[1] > version:
+                return
+            self._entries[session_id] = (expires_at, version, session)
+            self._entries.move_to_end(session_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    # session_ids 가 None 이면 전체 무효화
+    def invalidate(self, session_ids: Optional[Sequence[str]] = None):
+        with self._lock:
+            self._generation += 1
+            self.invalidations += 1
+            if session_ids is None:
+                self._entries.clear()
+            else:
+                for session_id in session_ids:
+                    self._entries.pop(session_id, None)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            size = len(self._entries)
+        total = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "ttl_seconds": self.ttl,
+            "size": size,
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "expired": self.expired,
+            "invalidations": self.invalidations,
+        }
+
+session_local_cache = SessionLocalCache()
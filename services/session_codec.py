@@ -0,0 +1,150 @@
+import os
+import json
+import logging
+from typing import Any, Dict, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+# 세션 값 직렬화 방식: json | orjson | msgpack (라이브러리가 없으면 json 으로 대체)
+SESSION_CODEC = os.getenv("SESSION_CODEC", "orjson").strip().lower()
+# 직렬화 결과가 이 크기(바이트) 이상이면 zstd 압축 (0 이면 압축 안 함)
+SESSION_COMPRESS_MIN_BYTES = int(os.getenv("SESSION_COMPRESS_MIN_BYTES", "1024"))
+SESSION_ZSTD_LEVEL = int(os.getenv("SESSION_ZSTD_LEVEL", "3"))
+
+SESSION_CODECS = ("json", "orjson", "msgpack")
+
+# 이진 값은 첫 바이트가 형식 버전: 하위 비트 = 직렬화 방식, 0x10 = zstd 압축
+# 모두 0x20 미만이라 JSON 텍스트 첫 글자와 겹치지 않음 → 헤더가 없으면 이전 형식(JSON 텍스트)으로 읽음
+# 압축하지 않은 json/orjson 값은 헤더 없이 JSON 텍스트 그대로 저장 (이전 버전 코드도 읽을 수 있음)
+_FORMAT_JSON = 0x01
+_FORMAT_MSGPACK = 0x02
+_FLAG_ZSTD = 0x10
+_HEADERS = frozenset(fmt | flag for fmt in (_FORMAT_JSON, _FORMAT_MSGPACK) for flag in (0, _FLAG_ZSTD))
+
+def _json_dumps(value: Any) -> bytes:
+    return json.dumps(value).encode("utf-8")
+
+def _orjson_dumps(value: Any) -> bytes:
+    # json.dumps 와 같이 정수 dict 키를 문자열로 변환
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+def _json_loads(raw: bytes) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # json.dumps 가 쓴 NaN/Infinity 는 orjson 이 읽지 못함
+            pass
+    return json.loads(raw)
+
+def _msgpack_dumps(value: Any) -> bytes:
+    return msgpack.packb(value, use_bin_type=True)
+
+def _msgpack_loads(raw: bytes) -> Any:
+    return msgpack.unpackb(raw, raw=False, strict_map_key=False)
+
+# 세션 해시 필드 값 인코더/디코더 (디코딩은 설정과 무관하게 모든 형식을 읽음)
+class SessionCodec:
+    def __init__(self, name: str = SESSION_CODEC, compress_min_bytes: int = SESSION_COMPRESS_MIN_BYTES,
+                 zstd_level: int = SESSION_ZSTD_LEVEL):
+        if name not in SESSION_CODECS:
+            raise ValueError(f"지원하지 않는 세션 코덱: {name} (가능: {', '.join(SESSION_CODECS)})")
+        if name == "orjson" and orjson is None:
+            logger.warning("orjson 미설치 → 세션 코덱 json 사용")
+            name = "json"
+        if name == "msgpack" and msgpack is None:
+            logger.warning("msgpack 미설치 → 세션 코덱 json 사용")
+            name = "json"
+        if compress_min_bytes > 0 and zstandard is None:
+            logger.warning("zstandard 미설치 → 세션 값 압축 안 함")
+            compress_min_bytes = 0
+
+        self.name = name
+        self.compress_min_bytes = compress_min_bytes
+        self.zstd_level = zstd_level
+        self._dumps = {"json": _json_dumps, "orjson": _orjson_dumps, "msgpack": _msgpack_dumps}[name]
+        self._format = _FORMAT_MSGPACK if name == "msgpack" else _FORMAT_JSON
+
+    # zstd 압축/해제 객체는 스레드 안전하지 않으므로 공유하지 않고 호출마다 생성
+    def encode(self, value: Any) -> bytes:
+        payload = self._dumps(value)
+        if self.compress_min_bytes and len(payload) >= self.compress_min_bytes:
+            compressed = zstandard.ZstdCompressor(level=self.zstd_level).compress(payload)
+            if len(compressed) + 1 < len(payload):
+                return bytes((self._format | _FLAG_ZSTD,)) + compressed
+        if self._format == _FORMAT_JSON:
+            return payload
+        return bytes((self._format,)) + payload
+
+    def decode(self, raw: Union[bytes, str]) -> Any:
+        if isinstance(raw, str):
+            return json.loads(raw)
+        if not raw or raw[0] not in _HEADERS:
+            return _json_loads(raw)
+
+        # 형식 오류는 모두 ValueError 로 (호출 쪽은 json.JSONDecodeError 와 같이 처리)
+        header, payload = raw[0], raw[1:]
+        if header & _FLAG_ZSTD:
+            if zstandard is None:
+                raise ValueError("zstd 압축 세션 값을 읽으려면 zstandard 가 필요합니다")
+            try:
+                payload = zstandard.ZstdDecompressor().decompress(payload)
+            except zstandard.ZstdError as e:
+                raise ValueError(f"세션 값 압축 해제 실패: {e}") from e
+        if header & ~_FLAG_ZSTD == _FORMAT_MSGPACK:
+            if msgpack is None:
+                raise ValueError("msgpack 세션 값을 읽으려면 msgpack 이 필요합니다")
+            return _msgpack_loads(payload)
+        return _json_loads(payload)
+
+# 세션 해시 필드 구성: 최상위 필드(step, created_at ...)와 data 하위 키("data.<키>")를 각각 코덱 값으로,
+# version 은 Lua 에서 HINCRBY/비교하므로 정수 텍스트 그대로
+SESSION_DATA_PREFIX = "data."
+
+def encode_session_fields(session: Dict[str, Any], codec: SessionCodec) -> Dict[str, bytes]:
+    fields = {}
+    for key, value in session.items():
+        if key == "data":
+            for data_key, data_value in (value or {}).items():
+                fields[SESSION_DATA_PREFIX + data_key] = codec.encode(data_value)
+        elif key == "version":
+            fields[key] = str(int(value)).encode()
+        else:
+            fields[key] = codec.encode(value)
+    return fields
+
+def decode_session_fields(fields: Dict[Union[bytes, str], Union[bytes, str]], codec: SessionCodec) -> Dict[str, Any]:
+    session: Dict[str, Any] = {"data": {}}
+    for field, raw in fields.items():
+        field = field.decode("utf-8") if isinstance(field, bytes) else field
+        if field.startswith(SESSION_DATA_PREFIX):
+            session["data"][field[len(SESSION_DATA_PREFIX):]] = codec.decode(raw)
+        elif field == "version":
+            session[field] = int(raw)
+        else:
+            session[field] = codec.decode(raw)
+    session.setdefault("version", 0)
+    return session
+
+_default_codec: Optional[SessionCodec] = None
+
+def get_session_codec() -> SessionCodec:
+    global _default_codec
+    if _default_codec is None:
+        _default_codec = SessionCodec()
+    return _default_codec
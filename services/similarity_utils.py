@@ -1,8 +1,17 @@
 from __future__ import annotations
-from functools import lru_cache
-from typing import Callable, Tuple, Iterable
+import os
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Tuple, Iterable, List, Sequence, TYPE_CHECKING
 import numpy as np
 from sentence_transformers import SentenceTransformer
+from rapidfuzz import fuzz as rf_fuzz, process as rf_process
+from core.utils.micro_batcher import MicroBatcher
+
+if TYPE_CHECKING:
+    from services.embedding_store import EmbeddingStore
 
 # 외부에서 주입할 SentenceTransformer 인스턴스 getter
 _MODEL_GETTER: Callable[[], "SentenceTransformer"] | None = None
@@ -16,15 +25,115 @@ def _get_model():
         raise RuntimeError("SentenceTransformer 모델이 설정되지 않았습니다. set_model_getter()를 먼저 호출하세요.")
     return _MODEL_GETTER()
 
-# 텍스트 -> 임베딩 (소문자 변환 후) 캐시. tuple로 저장해 lru_cache 키로 사용.
-@lru_cache(maxsize=4096)
-def encode_cached(text: str) -> Tuple[float, ...]:
-    model = _get_model()
-    vec = model.encode([text.lower()], show_progress_bar=False, convert_to_numpy=True)[0]
-    return tuple(vec.tolist())
+# 외부에서 주입할 디스크 임베딩 저장소 getter (없으면 메모리 LRU 만 사용)
+_STORE_GETTER: Callable[[], "EmbeddingStore | None"] | None = None
+
+def set_store_getter(getter: Callable[[], "EmbeddingStore | None"] | None) -> None:
+    global _STORE_GETTER
+    _STORE_GETTER = getter
+
+def _get_store():
+    return _STORE_GETTER() if _STORE_GETTER is not None else None
+
+# 캐시 키: 소문자 + 공백 정리 (인코딩도 이 텍스트로 수행)
+def _cache_key(text: str) -> str:
+    return " ".join(text.lower().split())
+
+# 행 단위 L2 정규화 (영벡터는 그대로 0)
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+# 정규화된 float32 임베딩을 하나의 연속 행렬에 보관하는 LRU 캐시
+class EmbeddingCache:
+    def __init__(self, capacity: int = 4096):
+        self.capacity = capacity
+        self._matrix: np.ndarray | None = None
+        self._rows: "OrderedDict[str, int]" = OrderedDict()
+        self._free: List[int] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    # 캐시된 텍스트의 벡터 사본과 누락된 텍스트 목록 반환
+    def lookup(self, keys: Sequence[str]) -> Tuple[dict, List[str]]:
+        found = {}
+        missing = []
+        with self._lock:
+            for key in keys:
+                row = self._rows.get(key)
+                if row is None:
+                    if key not in found and key not in missing:
+                        missing.append(key)
+                    continue
+                self._rows.move_to_end(key)
+                found[key] = self._matrix[row].copy()
+        return found, missing
+
+    # 새로 인코딩한 정규화 벡터 저장 (가득 차면 오래된 행 재사용)
+    def store(self, keys: Sequence[str], vectors: np.ndarray) -> None:
+        with self._lock:
+            if self._matrix is None:
+                self._matrix = np.zeros((self.capacity, vectors.shape[1]), dtype=np.float32)
+                self._free = list(range(self.capacity - 1, -1, -1))
+
+            for key, vec in zip(keys[-self.capacity:], vectors[-self.capacity:]):
+                row = self._rows.get(key)
+                if row is None:
+                    if self._free:
+                        row = self._free.pop()
+                    else:
+                        _, row = self._rows.popitem(last=False)
+                    self._rows[key] = row
+                else:
+                    self._rows.move_to_end(key)
+                self._matrix[row] = vec
+
+    def clear(self) -> None:
+        with self._lock:
+            self._rows.clear()
+            self._matrix = None
+            self._free = []
+
+_EMBEDDING_CACHE = EmbeddingCache(capacity=int(os.getenv("EMBED_CACHE_SIZE", "4096")))
+
+# 여러 텍스트 -> 정규화 임베딩 행렬 (캐시 키 정규화 후)
+# 메모리 LRU → 디스크 저장소 순으로 찾고, 둘 다 없는 것만 한 번의 encode로 계산
+def encode_batch(texts: Iterable[str]) -> np.ndarray:
+    keys = [_cache_key(t) for t in texts]
+    if not keys:
+        return np.zeros((0, 0), dtype=np.float32)
+
+    found, missing = _EMBEDDING_CACHE.lookup(keys)
+    store = _get_store() if missing else None
+    if store is not None:
+        stored = store.get_many(missing)
+        if stored:
+            restored = [k for k in missing if k in stored]
+            _EMBEDDING_CACHE.store(restored, np.stack([stored[k] for k in restored]))
+            found.update(stored)
+            missing = [k for k in missing if k not in stored]
+
+    if missing:
+        model = _get_model()
+        encoded = model.encode(missing, show_progress_bar=False, convert_to_numpy=True)
+        encoded = _normalize_rows(encoded)
+        _EMBEDDING_CACHE.store(missing, encoded)
+        if store is not None:
+            store.put_many(missing, encoded)
+        found.update(zip(missing, encoded))
+
+    return np.stack([found[k] for k in keys])
+
+# 텍스트 -> 정규화 임베딩 (소문자 변환 후, 캐시 사용)
+def encode_cached(text: str) -> np.ndarray:
+    return encode_batch([text])[0]
 
 # 두 벡터의 코사인 유사도
-def cosine_from_vecs(a: Tuple[float, ...], b: Tuple[float, ...]) -> float:
+def cosine_from_vecs(a: Sequence[float], b: Sequence[float]) -> float:
     a_np = np.asarray(a, dtype=np.float32)
     b_np = np.asarray(b, dtype=np.float32)
 
@@ -39,22 +148,37 @@ def cosine_from_vecs(a: Tuple[float, ...], b: Tuple[float, ...]) -> float:
 
     return dot_product / denominator
 
+# 입력 텍스트와 대상 텍스트 사이의 fuzzy 최고 점수 (0~1)
+def _best_fuzzy(input_text: str, target_text: str) -> float:
+    inp = input_text.lower()
+    ratio = rf_fuzz.ratio(target_text, inp) / 100
+    partial = rf_fuzz.partial_ratio(target_text, inp) / 100
+    token = rf_fuzz.token_sort_ratio(target_text, inp) / 100
+    return max(ratio, partial, token)
+
+# 입력 텍스트 하나와 후보 N개의 fuzzy 최고 점수 배열 (0~1)
+# 스코어러별 process.cdist 한 번씩 (후보 루프는 rapidfuzz 내부 C++ 에서 처리)
+_FUZZY_SCORERS = (rf_fuzz.ratio, rf_fuzz.partial_ratio, rf_fuzz.token_sort_ratio)
+
+def fuzzy_scores_batch(input_text: str, target_texts: Sequence[str]) -> np.ndarray:
+    if not len(target_texts):
+        return np.zeros(0, dtype=np.float32)
+    query = [input_text.lower()]
+    best = rf_process.cdist(query, target_texts, scorer=_FUZZY_SCORERS[0], dtype=np.float32)[0]
+    for scorer in _FUZZY_SCORERS[1:]:
+        np.maximum(best, rf_process.cdist(query, target_texts, scorer=scorer, dtype=np.float32)[0], out=best)
+    return best / 100
+
 #  결합 점수(final), 벡터 점수, fuzzy 최고 점수를 반환
 def combined_score_from_vecs(
-    input_vec: Tuple[float, ...],
-    target_vec: Tuple[float, ...],
+    input_vec: Sequence[float],
+    target_vec: Sequence[float],
     input_text: str,
     target_text: str,
     vector_weight: float = 0.7,
 ) -> tuple[float, float, float]:
     vector_score = cosine_from_vecs(input_vec, target_vec)
-
-    from rapidfuzz import fuzz as rf
-    inp = input_text.lower()
-    ratio = rf.ratio(target_text, inp) / 100
-    partial = rf.partial_ratio(target_text, inp) / 100
-    token = rf.token_sort_ratio(target_text, inp) / 100
-    best_fuzzy = max(ratio, partial, token)
+    best_fuzzy = _best_fuzzy(input_text, target_text)
 
     final = vector_weight * vector_score + (1 - vector_weight) * best_fuzzy
     return final, vector_score, best_fuzzy
@@ -65,15 +189,92 @@ def combined_score_from_texts(
     target_text: str,
     vector_weight: float = 0.7,
 ) -> tuple[float, float, float]:
-    iv = encode_cached(input_text)
-    tv = encode_cached(target_text)
-    return combined_score_from_vecs(iv, tv, input_text, target_text, vector_weight=vector_weight)
+    final, vector, fuzzy = score_candidates(input_text, [target_text], vector_weight=vector_weight)
+    return float(final[0]), float(vector[0]), float(fuzzy[0])
+
+# 질의 벡터 하나와 후보 행렬의 결합 점수 (행렬-벡터 곱 한 번)
+def score_vectors(
+    query_vec: np.ndarray,
+    target_matrix: np.ndarray,
+    input_text: str,
+    target_texts: Sequence[str],
+    vector_weight: float = 0.7,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    vector_scores = target_matrix @ query_vec
+    fuzzy_scores = fuzzy_scores_batch(input_text, target_texts)
+    final = vector_weight * vector_scores + (1 - vector_weight) * fuzzy_scores
+    return final, vector_scores, fuzzy_scores
+
+# 입력 텍스트 하나를 후보 N개와 비교 (인코딩 한 번 + 행렬-벡터 곱 한 번)
+def score_candidates(
+    input_text: str,
+    target_texts: Sequence[str],
+    vector_weight: float = 0.7,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    if not target_texts:
+        empty = np.zeros(0, dtype=np.float32)
+        return empty, empty, empty
+    vectors = encode_batch([input_text, *target_texts])
+    return score_vectors(vectors[0], vectors[1:], input_text, target_texts, vector_weight)
 
 def warmup_embeddings(texts: Iterable[str]) -> None:
-    texts = [t.lower() for t in texts]
-    for t in texts:
-        encode_cached(t)
+    encode_batch(texts)
 
 # 임베딩 캐시 초기화
 def clear_embedding_cache() -> None:
-    encode_cached.cache_clear()
+    _EMBEDDING_CACHE.clear()
+
+# 인코딩(CPU 연산)은 이벤트 루프 밖 전용 스레드에서 실행
+_ENCODE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv("EMBED_WORKERS", "2")),
+    thread_name_prefix="embed",
+)
+
+async def run_in_encode_executor(func: Callable, *args):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_ENCODE_EXECUTOR, func, *args)
+
+# 동시 요청의 캐시 미스 텍스트를 모아 encode 한 번으로 처리 (EMBED_BATCH_MAX_WAIT_MS=0 이면 묶지 않음)
+_ENCODE_BATCHER = MicroBatcher(
+    encode_batch,
+    run_in_encode_executor,
+    max_batch=int(os.getenv("EMBED_BATCH_MAX_SIZE", "64")),
+    max_wait_ms=float(os.getenv("EMBED_BATCH_MAX_WAIT_MS", "3")),
+)
+
+def encode_batcher_stats() -> dict:
+    return _ENCODE_BATCHER.stats()
+
+# 진행 중인 인코딩 배치 마무리 (lifespan 종료 시)
+async def close_encode_batcher() -> None:
+    await _ENCODE_BATCHER.aclose()
+
+# 모두 캐시에 있으면 스레드 전환 없이 바로 반환, 아니면 미스만 배처로 보냄
+async def encode_batch_async(texts: Iterable[str]) -> np.ndarray:
+    keys = [_cache_key(t) for t in texts]
+    if not keys:
+        return np.zeros((0, 0), dtype=np.float32)
+    found, missing = _EMBEDDING_CACHE.lookup(keys)
+    if missing:
+        found.update(zip(missing, await _ENCODE_BATCHER.submit(missing)))
+    return np.stack([found[k] for k in keys])
+
+async def encode_cached_async(text: str) -> np.ndarray:
+    return (await encode_batch_async([text]))[0]
+
+async def warmup_embeddings_async(texts: Iterable[str]) -> None:
+    texts = list(texts)
+    if not texts:
+        return
+    await encode_batch_async(texts)
+
+async def score_candidates_async(
+    input_text: str,
+    target_texts: Sequence[str],
+    vector_weight: float = 0.7,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    if not target_texts:
+        empty = np.zeros(0, dtype=np.float32)
+        return empty, empty, empty
+    vectors = await encode_batch_async([input_text, *target_texts])
+    return score_vectors(vectors[0], vectors[1:], input_text, target_texts, vector_weight)
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("sentence_transformers")
+
+from services.model_registry import EMBED_MODEL, load_embedding_model
+
+# 실제 키오스크 발화 길이(1~5어절) 위주
+SENTENCES = [
+    "아메리카노",
+    "아이스 아메리카노",
+    "따뜻한 카페라떼 한 잔",
+    "바닐라 라떼 두 잔 포장이요",
+    "레몬에이드",
+    "치즈케이크 하나 주세요",
+    "여기서 먹고 갈게요",
+    "가져갈게요",
+    "흑당 버블 밀크티",
+    "캐모마일 티 따뜻하게",
+]
+
+# 백엔드별 기준(torch) 대비 허용 코사인 하한 (최소값, 평균)
+COSINE_BOUNDS = {
+    "onnx": (0.9999, 0.9999),
+    "onnx-int8": (0.97, 0.985),
+}
+
+def _encode(model, sentences):
+    vectors = model.encode(sentences, show_progress_bar=False, convert_to_numpy=True)
+    vectors = np.asarray(vectors, dtype=np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+@pytest.fixture(scope="module")
+def reference():
+    return _encode(load_embedding_model(EMBED_MODEL, "torch"), SENTENCES)
+
+@pytest.mark.parametrize("backend", sorted(COSINE_BOUNDS))
+def test_backend_cosine_drift(reference, backend):
+    try:
+        model = load_embedding_model(EMBED_MODEL, backend)
+    except (FileNotFoundError, ImportError) as e:
+        pytest.skip(f"{backend} 백엔드 준비 안 됨: {e}")
+
+    candidate = _encode(model, SENTENCES)
+    cosines = np.sum(reference * candidate, axis=1)
+    min_bound, mean_bound = COSINE_BOUNDS[backend]
+    print(f"\n{backend}: 최소 {cosines.min():.5f}, 평균 {cosines.mean():.5f}")
+
+    assert cosines.min() >= min_bound
+    assert cosines.mean() >= mean_bound
+
+    # 발화끼리의 최근접 순위도 기준과 같아야 메뉴/포장 매칭 결과가 바뀌지 않음
+    ref_sim = reference @ reference.T
+    cand_sim = candidate @ candidate.T
+    np.fill_diagonal(ref_sim, -1)
+    np.fill_diagonal(cand_sim, -1)
+    assert np.array_equal(ref_sim.argmax(axis=1), cand_sim.argmax(axis=1))
@@ -0,0 +1,83 @@
+import pytest
+
+from config.config_cache import (
+    get_keyword_automaton,
+    get_temperature_keywords,
+    get_confirmation_keywords,
+    get_packaging_phrases,
+    MENU_STRIP_CATEGORIES,
+)
+from core.utils.keyword_automaton import KeywordAutomaton
+
+UTTERANCES = [
+    "아이스 아메리카노 두 잔 포장이요",
+    "따뜻한 카페라떼 한잔 매장에서 먹고 갈게요",
+    "시원한 레몬에이드 2잔 테이크아웃 해주세요",
+    "차가운 거 말고 따뜻한 거",
+    "hot americano 2잔 for here",
+    "ICED latte to go",
+    "카페모카 아이스로 두 개요",
+    "캐모마일 티 따뜻하게 한 잔",
+    "아메리카노",
+    "바닐라 라떼 하나 주세요",
+    "네 맞아요",
+    "아니요 취소할게요",
+    "아니 맞아",
+    "응 그걸로",
+    "ok",
+    "여기서 먹을게요",
+    "",
+]
+
+# 오토마톤 도입 전 구현 (설정 순서대로 부분 문자열 검사)
+def legacy_temperature(text):
+    cold, hot, _ = get_temperature_keywords()
+    text_lower = text.lower()
+    for word in cold + hot:
+        if word in text_lower:
+            return ("ice" if word in cold else "hot"), word
+    return None, ""
+
+# 긍정 키워드는 결과를 바꾸지 않음 (부정이 없으면 기본값 True)
+def legacy_confirmation(text):
+    _, negative_words = get_confirmation_keywords()
+    text = text.strip().lower()
+    return not any(word in text for word in negative_words)
+
+def legacy_packaging(text):
+    phrases = get_packaging_phrases()
+    t = text.lower()
+    for ptype in ("포장", "매장식사"):
+        if any(k in t for k in phrases[ptype]):
+            return ptype
+    return ""
+
+@pytest.fixture(scope="module")
+def automaton():
+    return get_keyword_automaton()
+
+@pytest.mark.parametrize("text", UTTERANCES)
+def test_temperature_matches_previous_detection(automaton, text):
+    hit = automaton.best(automaton.find(text.lower()), ("ice", "hot"))
+    detected = (("ice" if "ice" in hit.categories else "hot"), hit.keyword) if hit else (None, "")
+    assert detected == legacy_temperature(text)
+
+@pytest.mark.parametrize("text", UTTERANCES)
+def test_confirmation_matches_previous_analysis(automaton, text):
+    categories = KeywordAutomaton.categories_of(automaton.find(text.strip()))
+    assert ("negative" not in categories) == legacy_confirmation(text)
+
+@pytest.mark.parametrize("text", UTTERANCES)
+def test_packaging_matches_previous_keywords(automaton, text):
+    categories = KeywordAutomaton.categories_of(automaton.find(text))
+    packaging = "포장" if "takeout" in categories else "매장식사" if "dine_in" in categories else ""
+    assert packaging == legacy_packaging(text)
+
+# 의도한 변경: 겹치는 키워드 구간을 합쳐서 한 번에 지움 (예전 re.sub 연쇄는 '냉' 을 먼저 지워 '면' 이 남았음)
+def test_strip_removes_overlapping_keywords_together(automaton):
+    text = "냉면 주세요"
+    assert automaton.strip(text, automaton.find(text), MENU_STRIP_CATEGORIES).split() == []
+
+def test_strip_keeps_menu_words(automaton):
+    text = "아이스 카라멜 마키아토 한 잔 to go"
+    assert " ".join(automaton.strip(text, automaton.find(text), MENU_STRIP_CATEGORIES).split()) == "카라멜 마키아토 한 잔"
@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("sentence_transformers")
+
+from qdrant_client import QdrantClient
+from qdrant_client.models import Distance, PointStruct, VectorParams
+from services.menu_index import MenuVectorIndex
+
+DIM = 4
+
+# (menu_id, 이름, 가격, 인기, 온도, 벡터)
+MENUS = [
+    (1, "아메리카노", 4000, True, "hot", [1.0, 0.0, 0.0, 0.0]),
+    (2, "아메리카노", 4000, True, "ice", [0.9, 0.1, 0.0, 0.0]),
+    (3, "카페라떼", 4500, True, "hot", [0.0, 1.0, 0.0, 0.0]),
+    (28, "치즈케이크", 5500, False, "none", [0.0, 0.0, 1.0, 0.0]),
+]
+
+def _point(menu_id, name, price, popular, temp, vector):
+    return PointStruct(id=menu_id, vector=vector, payload={
+        "menu_id": menu_id, "menu_item": name, "price": price, "popular": popular, "temp": temp,
+    })
+
+@pytest.fixture
+def client():
+    client = QdrantClient(":memory:")
+    client.create_collection("menu", vectors_config=VectorParams(size=DIM, distance=Distance.COSINE))
+    client.upsert("menu", points=[_point(*menu) for menu in MENUS])
+    return client
+
+@pytest.fixture
+def loaded_index(client):
+    index = MenuVectorIndex()
+    assert index.load_from_qdrant(client, "menu")
+    return index
+
+def _search_ids(index, vector, temp=None):
+    return [payload["menu_id"] for payload, _ in index.search(np.asarray(vector, dtype=np.float32), temp=temp)]
+
+def test_upsert_without_loaded_index_keeps_qdrant_path():
+    index = MenuVectorIndex()
+    index.upsert(menu_id=40, name="레몬에이드", price=4500, popular=False, temp="ice",
+                 vector=[0.0, 0.0, 0.0, 1.0])
+
+    assert not index.ready
+    assert len(index) == 0
+
+def test_upsert_adds_and_replaces_rows(loaded_index):
+    loaded_index.upsert(menu_id=40, name="레몬에이드", price=4500, popular=False, temp="ice",
+                        vector=[0.0, 0.0, 0.0, 1.0])
+    loaded_index.upsert(menu_id=3, name="카페라떼", price=4800, popular=True, temp="hot",
+                        vector=[0.0, 1.0, 0.0, 0.0])
+
+    assert len(loaded_index) == len(MENUS) + 1
+    assert _search_ids(loaded_index, [0.0, 0.0, 0.0, 1.0])[0] == 40
+    assert loaded_index.exact_match("카페라떼", "hot")["price"] == 4800
+
+def test_refresh_from_qdrant_applies_changed_menus(client, loaded_index):
+    client.upsert("menu", points=[_point(40, "레몬에이드", 4500, False, "ice", [0.0, 0.0, 0.0, 1.0])])
+
+    assert loaded_index.refresh_from_qdrant(client, [40], "menu")
+    assert _search_ids(loaded_index, [0.0, 0.0, 0.0, 1.0], temp="ice")[0] == 40
+
+def test_refresh_from_qdrant_skips_unloaded_index(client):
+    index = MenuVectorIndex()
+
+    assert not index.refresh_from_qdrant(client, [1], "menu")
+    assert not index.ready
+
+# 점주 메뉴 추가: 요청을 받은 워커의 로컬 반영과 다른 워커의 Qdrant 재적재가 같은 행을 만들어야 함
+def test_owner_upsert_matches_refresh_from_qdrant(monkeypatch):
+    from services import vector_client
+
+    client = QdrantClient(":memory:")
+    monkeypatch.setattr(vector_client, "qclient", client)
+    vector_client.upsert_menu_point(id_=1, name="아메리카노", price=4000, popular=True, temp="hot")
+    local, remote = MenuVectorIndex(), MenuVectorIndex()
+    assert local.load_from_qdrant(client, vector_client.COLLECTION)
+    assert remote.load_from_qdrant(client, vector_client.COLLECTION)
+
+    vec = vector_client.upsert_menu_point(id_=40, name="레몬에이드", price=4500, popular=False, temp="ice")
+    local.upsert(menu_id=40, name="레몬에이드", price=4500, popular=False, temp="ice", vector=vec)
+    assert remote.refresh_from_qdrant(client, [40], vector_client.COLLECTION)
+
+    local_row, remote_row = local._snapshot.row_by_id[40], remote._snapshot.row_by_id[40]
+    assert local._snapshot.payloads[local_row] == remote._snapshot.payloads[remote_row]
+    np.testing.assert_allclose(local._snapshot.matrix[local_row], remote._snapshot.matrix[remote_row], atol=1e-6)
@@ -0,0 +1,85 @@
+import re
+
+import pytest
+
+from config.config_cache import (
+    get_keyword_automaton,
+    get_temperature_keywords,
+    get_quantity_config,
+    get_menu_noise_words,
+    get_filler_words,
+    get_menu_punctuation,
+    MENU_STRIP_CATEGORIES,
+)
+from core.utils.text_normalizer import MenuTextNormalizer
+
+# 키오스크 음성 주문 문장 (STT 결과 그대로)
+KIOSK_CORPUS = [
+    "아이스 아메리카노 두 잔 포장이요",
+    "따뜻한 카페라떼 한잔 매장에서 먹고 갈게요",
+    "바닐라 라떼 하나 주세요",
+    "시원한 레몬에이드 2잔 테이크아웃 해주세요",
+    "치즈케이크 하나랑 아메리카노 한 잔이요",
+    "뜨거운 녹차 라떼 1개 좀 해주세요",
+    "카페모카 아이스로 두 개요",
+    "초코 머핀 세 개 포장해 주세요",
+    "딸기 바나나 스무디 하나 가져갈게요",
+    "흑당 버블 밀크티 두 잔이요",
+    "캐모마일 티 따뜻하게 한 잔",
+    "말차 프라페 하나요!",
+    "아이스 카라멜 마키아토 한 잔 to go",
+    "hot americano 2잔 for here",
+    "유자차 뜨거운 걸로 하나 주세요",
+    "자몽에이드 두 잔 그리고 티라미수 하나",
+    "\"블루 레몬 에이드\" 하나 주세요",
+    "카푸치노 (핫) 1잔",
+    "플레인 스콘 두 개, 크루아상 하나",
+    "얼음 많이 아이스티 한 잔",
+    "망고 요거트 스무디 하나 포장",
+    "흑임자 라떼 아이스로 한 잔 주세요",
+    "밀크티 따뜻한 거 두 잔이요",
+    "곡물 라떼 하나 매장",
+    "오렌지 주스 한 잔 테이크아웃이요",
+]
+
+# 단일 패스 정리기 도입 전 구현: 패턴/키워드마다 re.sub 한 번씩
+def legacy_clean(text, quantity_patterns):
+    cold, hot, _ = get_temperature_keywords()
+    cleaned = text
+    for pattern in quantity_patterns:
+        cleaned = re.sub(pattern, " ", cleaned)
+    for keyword in cold + hot:
+        cleaned = re.sub(re.escape(keyword), " ", cleaned, flags=re.IGNORECASE)
+    for kw in get_menu_noise_words():
+        cleaned = re.sub(re.escape(kw), " ", cleaned, flags=re.IGNORECASE)
+    cleaned = re.sub(r'[\"\'“”‘’`]', " ", cleaned)
+    cleaned = re.sub(r'[(){}\[\],.!?]', " ", cleaned)
+    for word in get_filler_words():
+        cleaned = re.sub(re.escape(word), " ", cleaned, flags=re.IGNORECASE)
+    return " ".join(cleaned.split()).strip()
+
+@pytest.fixture(scope="module")
+def quantity_patterns():
+    return tuple(get_quantity_config().get("regex_patterns", []))
+
+def _normalizer(quantity_patterns, cache_size):
+    return MenuTextNormalizer(
+        automaton=get_keyword_automaton(),
+        quantity_patterns=quantity_patterns,
+        strip_categories=MENU_STRIP_CATEGORIES,
+        punctuation=get_menu_punctuation(),
+        cache_size=cache_size,
+    )
+
+@pytest.mark.parametrize("cache_size", [0, 2048])
+def test_normalize_matches_previous_regex_chain(quantity_patterns, cache_size):
+    normalizer = _normalizer(quantity_patterns, cache_size)
+    # 캐시가 있으면 두 번째 호출은 캐시에서 나옴
+    for _ in range(2):
+        for text in KIOSK_CORPUS:
+            assert normalizer.normalize(text) == legacy_clean(text, quantity_patterns), text
+
+def test_normalize_reuses_given_hits(quantity_patterns):
+    normalizer = _normalizer(quantity_patterns, cache_size=0)
+    text = "아이스 카라멜 마키아토 한 잔 to go"
+    assert normalizer.normalize(text, get_keyword_automaton().find(text)) == normalizer.normalize(text)
@@ -0,0 +1,37 @@
+import pytest
+
+from config.config_cache import get_order_grammar
+
+# (발화, 분리 결과) — 컴파일 문법 도입 전 split_multiple_orders 와 같은 결과
+SPLIT_CASES = [
+    ("아이스 아메리카노 두 잔", ["아이스 아메리카노 두 잔"]),
+    ("따뜻한 카페라떼 한 잔 하고 치즈케이크 하나", ["따뜻한 카페라떼 한 잔", "치즈케이크 하나"]),
+    ("아메리카노 두 잔 라떼 한 잔", ["아메리카노 두 잔", "라떼 한 잔"]),
+    ("카페라떼랑 레몬에이드 두 잔", ["카페라떼", "레몬에이드 두 잔"]),
+    ("뜨거운 카페라떼 한잔 아이스 아메리카노 두잔", ["뜨거운 카페라떼 한 잔", "아이스 아메리카노 두 잔"]),
+    ("아메리카노2잔카페라떼3잔", ["아메리카노 2 잔", "카페라떼 3 잔"]),
+    ("바닐라 라떼 한 잔", ["바닐라 라떼 한 잔"]),
+    ("시원한 레몬에이드 두 잔 그리고 티라미수 하나", ["시원한 레몬에이드 두 잔", "티라미수 하나"]),
+    ("초코 머핀 세 개 녹차 라떼 두 잔 딸기 주스 한 잔", ["초코 머핀 세 개", "녹차 라떼 두 잔", "딸기 주스 한 잔"]),
+    ("카페라떼 세 잔이랑 아이스티 한 잔", ["카페라떼 세 잔", "아이스티 한 잔"]),
+    ("한라봉 에이드 두 잔", ["한라봉 에이드 두 잔"]),
+]
+
+# 의도한 변경: 예전에는 '주세요' 의 '세' 를 수량으로 읽어 ['흑당 버블 밀크티 하나', '주 세'] 로 쪼갰음
+INTENDED_CHANGES = [
+    ("흑당 버블 밀크티 하나 주세요", ["흑당 버블 밀크티 하나 주세요"]),
+    # 같은 이유로 '세트' 도 예전에는 ['치킨 세', '트 하나'] 로 쪼갰음 (한글 수사 뒤에 한글이 이어지면 수량이 아님)
+    ("치킨 세트 하나", ["치킨 세트 하나"]),
+]
+
+@pytest.fixture(scope="module")
+def grammar():
+    return get_order_grammar()
+
+@pytest.mark.parametrize("text,expected", SPLIT_CASES)
+def test_split_matches_previous_parser(grammar, text, expected):
+    assert grammar.split(text) == expected
+
+@pytest.mark.parametrize("text,expected", INTENDED_CHANGES)
+def test_split_intended_changes(grammar, text, expected):
+    assert grammar.split(text) == expected
@@ -0,0 +1,115 @@
+import asyncio
+import importlib
+import json
+import time
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")  # fakeredis 의 Lua 스크립트(EVALSHA) 실행에 필요
+
+import redis
+import redis.asyncio as aioredis
+from core.exceptions.session_exceptions import SessionConflictException
+
+# 테스트마다 빈 fakeredis 서버에 연결 (모듈 전역 매니저가 import 시 Redis 에 연결하므로 import 도 연결을 바꾼 뒤에)
+@pytest.fixture
+def rs(monkeypatch):
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(redis, "from_url",
+                        lambda url, **kwargs: fakeredis.FakeRedis(server=server, **kwargs))
+    monkeypatch.setattr(aioredis, "from_url",
+                        lambda url, **kwargs: fakeredis.FakeAsyncRedis(server=server, **kwargs))
+    return importlib.import_module("services.redis_session_service")
+
+@pytest.fixture
+def manager(rs):
+    return rs.RedisSessionManager()
+
+@pytest.fixture
+def async_manager(rs):
+    return rs.AsyncRedisSessionManager()
+
+def test_create_session_stores_hash_with_ttl(manager):
+    session_id = manager.create_session(expire_minutes=30)
+    key = f"session:{session_id}"
+
+    assert manager.redis_client.type(key) == "hash"
+    assert 0 < manager.redis_client.ttl(key) <= 30 * 60
+    session = manager.get_session(session_id)
+    assert session["step"] == "started"
+    assert session["version"] == 0
+    assert session["data"]["packaging_type"] is None
+
+def test_update_session_merges_data_and_bumps_version(manager):
+    session_id = manager.create_session()
+    manager.update_session(session_id, "started", {"orders": [{"menu_id": 1, "quantity": 2}]})
+
+    updated = manager.update_session(session_id, "packaging", {"packaging_type": "포장"})
+
+    assert updated["step"] == "packaging"
+    assert updated["version"] == 2
+    assert updated["data"]["orders"] == [{"menu_id": 1, "quantity": 2}]
+    assert updated["data"]["packaging_type"] == "포장"
+    assert manager.get_session(session_id) == updated
+
+def test_update_missing_session_returns_none(manager):
+    assert manager.update_session("missing", "packaging", {}) is None
+
+def test_legacy_json_session_is_migrated_on_update(manager):
+    legacy = {
+        "created_at": "2025-01-01T12:00:00", "expires_at": "2025-01-01T12:30:00", "step": "started",
+        "data": {"menu_item": None, "orders": [{"menu_id": 3, "quantity": 1}]},
+    }
+    manager.redis_client.set("session:old", json.dumps(legacy), ex=600)
+    assert manager.get_session("old")["data"]["orders"] == [{"menu_id": 3, "quantity": 1}]
+
+    updated = manager.update_session("old", "packaging", {"packaging_type": "매장식사"})
+
+    assert manager.redis_client.type("session:old") == "hash"
+    assert updated["version"] == 1
+    assert updated["data"]["orders"] == [{"menu_id": 3, "quantity": 1}]
+    assert manager.get_session("old") == updated
+
+def test_write_with_stale_version_raises_conflict(async_manager):
+    async def scenario():
+        session_id = await async_manager.create_session()
+        await async_manager._write_session(session_id, "started", {"orders": []}, 30, expected_version=0)
+        with pytest.raises(SessionConflictException) as error:
+            await async_manager._write_session(session_id, "packaging", {"packaging_type": "포장"}, 30,
+                                               expected_version=0)
+        return error.value, await async_manager._load_session(session_id)
+
+    error, session = asyncio.run(scenario())
+    assert error.status_code == 409
+    assert session["version"] == 1
+    assert session["step"] == "started"
+
+def test_session_stats_follow_steps_delete_and_expiry(rs, async_manager):
+    async def scenario():
+        ids = [await async_manager.create_session() for _ in range(3)]
+        await async_manager.update_session(ids[0], "packaging", {})
+        await async_manager.update_session(ids[0], "packaging", {})
+        await async_manager.update_session(ids[1], "completed", {})
+        before = await async_manager.get_session_stats()
+
+        await async_manager.delete_session(ids[2])
+        # 만료: 키가 사라지고 만료 시각이 지난 상태
+        await async_manager.session_client.delete(f"session:{ids[1]}")
+        await async_manager.session_client.zadd(rs.SESSION_STATS_EXPIRY_KEY, {ids[1]: time.time() - 1})
+        after = await async_manager.get_session_stats()
+        return before, after
+
+    before, after = asyncio.run(scenario())
+    assert before == {"total_sessions": 3, "step_distribution": {"started": 1, "packaging": 1, "completed": 1}}
+    assert after == {"total_sessions": 1, "step_distribution": {"packaging": 1}}
+
+def test_get_all_sessions_scans_hash_and_legacy_sessions(manager):
+    session_ids = {manager.create_session() for _ in range(3)}
+    manager.redis_client.set("session:old", json.dumps({"step": "started", "data": {}}))
+    manager.redis_client.set("other:key", "ignored")
+
+    sessions = manager.get_all_sessions()
+
+    assert set(sessions) == session_ids | {"old"}
+    assert sessions["old"]["step"] == "started"
@@ -0,0 +1,119 @@
+import asyncio
+import importlib
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+pytest.importorskip("lupa")  # fakeredis 의 Lua 스크립트(EVALSHA) 실행에 필요
+
+import redis
+import redis.asyncio as aioredis
+from core.exceptions.session_exceptions import SessionConflictException
+
+# 빈 fakeredis 서버에 붙은 세션 모듈 (작업 단위가 쓰는 전역 async_session_manager 도 교체)
+@pytest.fixture
+def rs(monkeypatch):
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(redis, "from_url",
+                        lambda url, **kwargs: fakeredis.FakeRedis(server=server, **kwargs))
+    monkeypatch.setattr(aioredis, "from_url",
+                        lambda url, **kwargs: fakeredis.FakeAsyncRedis(server=server, **kwargs))
+    module = importlib.import_module("services.redis_session_service")
+    monkeypatch.setattr(module, "async_session_manager", module.AsyncRedisSessionManager())
+    monkeypatch.setattr(module, "SESSION_UNIT_OF_WORK_ENABLED", True)
+    return module
+
+def test_request_reads_once_and_flushes_once(rs):
+    manager = rs.async_session_manager
+
+    async def scenario():
+        session_id = await manager.create_session()
+        async with rs.session_unit_of_work("test") as unit_of_work:
+            session = await manager.get_session(session_id)
+            await manager.update_session(session_id, "started", {"orders": [{"menu_id": 1, "quantity": 2}]})
+            await manager.get_session(session_id)
+            await manager.update_session(session_id, "packaging", {"packaging_type": "포장"})
+            # 작업 단위가 끝나기 전에는 Redis 에 반영되지 않음 (집계되지 않는 직접 조회)
+            version_before_flush = await manager.session_client.hget(f"session:{session_id}", "version")
+        return session, unit_of_work.ops, version_before_flush, await manager._load_session(session_id)
+
+    session, ops, version_before_flush, stored = asyncio.run(scenario())
+    assert session["version"] == 0
+    assert ops == {"hgetall": 1, "evalsha": 1}
+    assert version_before_flush == b"0"
+    assert stored["version"] == 1
+    assert stored["step"] == "packaging"
+    assert stored["data"]["orders"] == [{"menu_id": 1, "quantity": 2}]
+    assert stored["data"]["packaging_type"] == "포장"
+
+# 두 요청이 같은 version 을 읽은 뒤 먼저 저장한 쪽만 성공하고 나중 쪽은 409
+def test_concurrent_writer_gets_conflict(rs):
+    manager = rs.async_session_manager
+
+    async def scenario():
+        session_id = await manager.create_session()
+        first_read, second_read, first_flushed = asyncio.Event(), asyncio.Event(), asyncio.Event()
+
+        async def first():
+            async with rs.session_unit_of_work("test"):
+                await manager.get_session(session_id)
+                first_read.set()
+                await second_read.wait()
+                await manager.update_session(session_id, "packaging", {"packaging_type": "포장"})
+            first_flushed.set()
+
+        async def second():
+            async with rs.session_unit_of_work("test"):
+                await first_read.wait()
+                await manager.get_session(session_id)
+                second_read.set()
+                await first_flushed.wait()
+                await manager.update_session(session_id, "packaging", {"packaging_type": "매장식사"})
+
+        results = await asyncio.gather(first(), second(), return_exceptions=True)
+        return results, await manager._load_session(session_id)
+
+    (first_result, second_result), stored = asyncio.run(scenario())
+    assert first_result is None
+    assert isinstance(second_result, SessionConflictException)
+    assert second_result.status_code == 409
+    assert stored["version"] == 1
+    assert stored["data"]["packaging_type"] == "포장"
+
+def test_failed_request_discards_pending_changes(rs):
+    manager = rs.async_session_manager
+
+    async def scenario():
+        session_id = await manager.create_session()
+        with pytest.raises(ValueError):
+            async with rs.session_unit_of_work("test"):
+                await manager.get_session(session_id)
+                await manager.update_session(session_id, "packaging", {"packaging_type": "포장"})
+                raise ValueError("endpoint failed")
+        return await manager._load_session(session_id)
+
+    stored = asyncio.run(scenario())
+    assert stored["version"] == 0
+    assert stored["step"] == "started"
+
+def test_decorated_endpoint_surfaces_conflict_as_409(rs):
+    manager = rs.async_session_manager
+
+    @rs.with_session_unit_of_work("test.endpoint")
+    async def endpoint(session_id: str):
+        await manager.get_session(session_id)
+        # 다른 요청이 먼저 저장
+        await manager._write_session(session_id, "packaging", {"packaging_type": "매장식사"}, 30)
+        await manager.update_session(session_id, "packaging", {"packaging_type": "포장"})
+        return "ok"
+
+    async def scenario():
+        session_id = await manager.create_session()
+        with pytest.raises(SessionConflictException) as error:
+            await endpoint(session_id)
+        return error.value, await manager._load_session(session_id)
+
+    error, stored = asyncio.run(scenario())
+    assert error.status_code == 409
+    assert stored["data"]["packaging_type"] == "매장식사"
+    assert rs.session_ops_stats.stats()["conflicts"] >= 1